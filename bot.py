@@ -3,7 +3,7 @@ from bs4 import BeautifulSoup
 import html
 
 import re as _re_simple
-from telegram.error import BadRequest
+from telegram.error import BadRequest, RetryAfter
 
 # --- Time helpers ---
 from datetime import datetime, timedelta, timezone
@@ -98,15 +98,13 @@ def extract_simple_from_body(body: str, allow_ai_rewrite: bool = True) -> str:
 불릿:
 {bullets_txt}
 '''
-            resp = client_oa.chat.completions.create(
+            one = llm_chat(
+                "simple_rewrite",
                 model=os.getenv("SIMPLE_REWRITE_MODEL", "gpt-4.1-mini"),
-                messages=[
-                    {"role": "system", "content": "Rewrite Korean sports analysis bullet points into one natural sentence."},
-                    {"role": "user", "content": prompt},
-                ],
+                system="Rewrite Korean sports analysis bullet points into one natural sentence.",
+                prompt=prompt,
                 temperature=0.2,
             )
-            one = (resp.choices[0].message.content or "").strip()
             one = re.sub(r"\s+", " ", one).strip()
             # 안전장치: 너무 길거나 비어있으면 폴백
             if (not one) or (len(one) > 240):
@@ -1100,6 +1098,181 @@ import httpx
 
 import traceback
 import unicodedata
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import inspect
+
+
+# ───────────────── 단계별 시간/카운터 계측 ─────────────────
+# - span("maz.list") 같은 구간을 재서 소요 시간/바이트/재시도/HTTP 상태를 모은다.
+# - 명령 하나가 처리되는 동안의 기록은 contextvar 로 묶인다(to_thread/create_task 도 컨텍스트를 복사하므로 함께 잡힘).
+# - 프로세스 전체 누적은 /timing 으로 본다.
+CMD_TIMING_REPORT = (os.getenv("CMD_TIMING_REPORT", "0") or "").strip().lower() in ("1", "true", "yes", "on")
+CMD_TIMING_MIN_SEC = float(os.getenv("CMD_TIMING_MIN_SEC", "3"))
+CMD_TIMING_LOG = (os.getenv("CMD_TIMING_LOG", "1") or "").strip().lower() in ("1", "true", "yes", "on")
+
+_SPAN_LOCK = threading.Lock()
+_SPAN_TOTALS: dict[str, dict] = {}
+_CMD_TRACE: contextvars.ContextVar[dict | None] = contextvars.ContextVar("cmd_trace", default=None)
+_CUR_SPAN: contextvars.ContextVar[dict | None] = contextvars.ContextVar("cur_span", default=None)
+_HTTP_STATUS_RE = re.compile(r"HTTP_(\d{3})")
+
+
+def _span_stat_add(stats: dict[str, dict], name: str, rec: dict) -> None:
+    st = stats.setdefault(name, {
+        "count": 0, "errors": 0, "total_sec": 0.0, "max_sec": 0.0,
+        "bytes": 0, "retries": 0, "status": {},
+    })
+    st["count"] += 1
+    st["errors"] += 0 if rec["ok"] else 1
+    st["total_sec"] += rec["sec"]
+    st["max_sec"] = max(st["max_sec"], rec["sec"])
+    st["bytes"] += rec["bytes"]
+    st["retries"] += rec["retries"]
+    for code in rec["status"]:
+        st["status"][code] = st["status"].get(code, 0) + 1
+
+
+def span_record(name: str, sec: float, *, ok: bool = True, nbytes: int = 0, retries: int = 0, status=()) -> None:
+    """끝난 구간 하나를 현재 명령 기록과 프로세스 누적에 더한다."""
+    rec = {
+        "sec": max(0.0, float(sec)), "ok": bool(ok), "bytes": int(nbytes or 0),
+        "retries": int(retries or 0), "status": [int(s) for s in status if s],
+    }
+    with _SPAN_LOCK:
+        _span_stat_add(_SPAN_TOTALS, name, rec)
+        trace = _CMD_TRACE.get()
+        if trace is not None:
+            _span_stat_add(trace["stages"], name, rec)
+
+
+def span_note(*, status: int | None = None, nbytes: int = 0, request: bool = False, ok: bool | None = None) -> None:
+    """진행 중인 span 에 HTTP 상태/바이트/요청 수를 덧붙인다(span 밖이면 무시)."""
+    cur = _CUR_SPAN.get()
+    if cur is None:
+        return
+    if status:
+        cur["status"].append(int(status))
+    cur["bytes"] += int(nbytes or 0)
+    if request:
+        cur["requests"] += 1
+    if ok is not None:
+        cur["ok"] = bool(ok)
+
+
+class span:
+    """with span("gsheet.post"): ...  /  async 함수 안에서도 그대로 with 로 쓴다."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.rec = {"status": [], "bytes": 0, "requests": 0, "retries": 0, "ok": True}
+
+    def __enter__(self) -> dict:
+        self._t0 = time.perf_counter()
+        self._token = _CUR_SPAN.set(self.rec)
+        return self.rec
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _CUR_SPAN.reset(self._token)
+        rec = self.rec
+        retries = rec["retries"] or max(0, rec["requests"] - 1)
+        span_record(
+            self.name, time.perf_counter() - self._t0,
+            ok=rec["ok"] and exc_type is None, nbytes=rec["bytes"], retries=retries, status=rec["status"],
+        )
+        return False
+
+
+def _span_result_ok(rec: dict, result) -> None:
+    """(성공여부, 정보) / (값, url, 에러문자열) 형태의 반환값에서 성공/HTTP 상태를 읽는다."""
+    if not isinstance(result, tuple) or not result:
+        return
+    if isinstance(result[0], bool):
+        rec["ok"] = rec["ok"] and result[0]
+        info = str(result[1]) if len(result) > 1 else ""
+    else:
+        info = str(result[-1] or "")
+        if info:
+            rec["ok"] = False
+    if not rec["status"] and info:
+        m = _HTTP_STATUS_RE.search(info)
+        if m:
+            rec["status"].append(int(m.group(1)))
+
+
+def traced(name: str):
+    """함수 전체를 span 으로 감싸는 데코레이터(동기/비동기 모두)."""
+
+    def deco(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def _async(*a, **kw):
+                with span(name) as rec:
+                    result = await fn(*a, **kw)
+                    _span_result_ok(rec, result)
+                    return result
+            return _async
+
+        @functools.wraps(fn)
+        def _sync(*a, **kw):
+            with span(name) as rec:
+                result = fn(*a, **kw)
+                _span_result_ok(rec, result)
+                return result
+        return _sync
+
+    return deco
+
+
+def _fmt_bytes(n: int) -> str:
+    if n >= 1024 * 1024:
+        return f"{n / (1024 * 1024):.1f}MB"
+    if n >= 1024:
+        return f"{n / 1024:.0f}KB"
+    return f"{n}B"
+
+
+def format_span_stats(stats: dict[str, dict]) -> list[str]:
+    lines = []
+    for name, st in sorted(stats.items(), key=lambda kv: -kv[1]["total_sec"]):
+        parts = [f"×{st['count']} {st['total_sec']:.1f}s (최대 {st['max_sec']:.1f}s)"]
+        if st["bytes"]:
+            parts.append(_fmt_bytes(st["bytes"]))
+        if st["retries"]:
+            parts.append(f"재시도 {st['retries']}")
+        if st["errors"]:
+            parts.append(f"실패 {st['errors']}")
+        if st["status"]:
+            parts.append("HTTP " + ",".join(f"{c}×{n}" for c, n in sorted(st["status"].items())))
+        lines.append(f"- {name} " + " / ".join(parts))
+    return lines
+
+
+def cmd_trace_begin(label: str):
+    """현재 컨텍스트에 명령 단위 기록을 연다. 반환값은 cmd_trace_end 에 넘긴다."""
+    trace = {"label": label, "t0": time.perf_counter(), "stages": {}}
+    return trace, _CMD_TRACE.set(trace)
+
+
+def cmd_trace_end(handle) -> tuple[dict, float]:
+    trace, token = handle
+    _CMD_TRACE.reset(token)
+    elapsed = time.perf_counter() - trace["t0"]
+    if CMD_TIMING_LOG and trace["stages"]:
+        summary = " | ".join(
+            f"{n} ×{st['count']} {st['total_sec']:.1f}s" for n, st in sorted(trace["stages"].items(), key=lambda kv: -kv[1]["total_sec"])
+        )
+        print(f"[TIMING] {trace['label']} {elapsed:.1f}s :: {summary}", flush=True)
+    return trace, elapsed
+
+
+def span_totals_snapshot() -> dict[str, dict]:
+    with _SPAN_LOCK:
+        return {k: {**v, "status": dict(v["status"])} for k, v in _SPAN_TOTALS.items()}
+
+
 # ───────────────── 네이버 카페 자동 글쓰기 (추후: '네이버 카페 자동 글쓰기') ─────────────────
 # 공식 문서:
 # - 네이버 로그인 토큰 발급/갱신: https://nid.naver.com/oauth2.0/token
@@ -1299,6 +1472,7 @@ def _naver_quote_once(s: str) -> str:
     s = _naver_clean_text(s)
     return quote_plus(s, safe="", encoding="utf-8", errors="strict")
 
+@traced("naver.post")
 def _naver_cafe_post(subject: str, content: str, clubid: str, menuid: str) -> tuple[bool, str]:
     """네이버 카페에 글쓰기. (success, articleId_or_error)
 
@@ -1332,6 +1506,7 @@ def _naver_cafe_post(subject: str, content: str, clubid: str, menuid: str) -> tu
 
     try:
         resp = requests.post(url, headers=headers, data=body.encode("utf-8"), timeout=30)
+        span_note(status=resp.status_code, nbytes=len(body), request=True)
 
         if resp.status_code != 200:
             txt = (resp.text or "")[:800]
@@ -1362,6 +1537,7 @@ def _naver_cafe_post(subject: str, content: str, clubid: str, menuid: str) -> tu
     except Exception as e:
         return False, f"EXC:{e}"
 
+@traced("naver.news_post")
 def _naver_news_cafe_post(subject: str, content: str, clubid: str, menuid: str) -> tuple[bool, str]:
     """뉴스 전용 계정으로 네이버 카페에 글쓰기. (success, articleId_or_error)
 
@@ -1395,6 +1571,7 @@ def _naver_news_cafe_post(subject: str, content: str, clubid: str, menuid: str)
 
     try:
         resp = requests.post(url, headers=headers, data=body.encode("utf-8"), timeout=30)
+        span_note(status=resp.status_code, nbytes=len(body), request=True)
 
         if resp.status_code != 200:
             txt = (resp.text or "")[:800]
@@ -1426,6 +1603,7 @@ def _naver_news_cafe_post(subject: str, content: str, clubid: str, menuid: str)
         return False, f"EXC:{e}"
 
 
+@traced("naver.news_post_image")
 def _naver_news_cafe_post_multipart(
     subject: str,
     content: str,
@@ -1612,6 +1790,7 @@ def _naver_news_cafe_post_multipart(
                 for attempt in range(max_retries + 1):
                     try:
                         resp = requests.post(url, headers=headers, data=data, files=files, timeout=70)
+                        span_note(status=resp.status_code, nbytes=len(img_b), request=True)
 
                         if resp.status_code != 200:
                             st, code, msg = _parse_err(resp)
@@ -1995,6 +2174,136 @@ async def cafe_volleyball_deep(update: Update, context: ContextTypes.DEFAULT_TYP
     return await cafe_post_from_export(update, context, which, sport_filter="volleyball", mode="deep")
 
 
+# export 시트 링크 기록(cafe_title / cafe_url / cafe_url_deep) 모아쓰기
+# - 글마다 ws.update 2~3회 대신 메모리에 모았다가 batch_update 1회로 반영 (N건마다 + 종료 시)
+# - 반영 전 링크는 로컬 저널에 먼저 적어 두고, 재시작 후 다음 업로드 때 이어서 반영한다.
+CAFE_LINK_FLUSH_EVERY = max(1, int(os.getenv("CAFE_LINK_FLUSH_EVERY", "10")))
+CAFE_LINK_JOURNAL_PATH = (os.getenv("CAFE_LINK_JOURNAL_PATH") or "cafe_link_journal.json").strip()
+CAFE_LINK_JOURNAL_MAX_AGE_SEC = max(3600, int(os.getenv("CAFE_LINK_JOURNAL_MAX_AGE_SEC", str(7 * 24 * 3600))))
+
+
+def _cafe_link_journal_load() -> list[dict]:
+    try:
+        with open(CAFE_LINK_JOURNAL_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        entries = data.get("entries") if isinstance(data, dict) else None
+        return [e for e in (entries or []) if isinstance(e, dict)]
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        print(f"[CAFE][EXPORT_LINK] 저널 로드 실패(무시): {e}")
+        return []
+
+
+def _cafe_link_journal_save(entries: list[dict]) -> None:
+    if not entries:
+        try:
+            os.remove(CAFE_LINK_JOURNAL_PATH)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[CAFE][EXPORT_LINK] 저널 삭제 실패(무시): {e}")
+        return
+    tmp = CAFE_LINK_JOURNAL_PATH + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"entries": entries}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, CAFE_LINK_JOURNAL_PATH)
+    except Exception as e:
+        print(f"[CAFE][EXPORT_LINK] 저널 저장 실패(무시): {e}")
+
+
+class _ExportLinkWriteback:
+    """export 시트 링크 기록 버퍼. pending은 (행, 컬럼명) → 저널 항목."""
+
+    def __init__(self, ws, sheet_name: str, vals: list[list[str]]):
+        self.ws = ws
+        self.sheet_name = sheet_name
+        self.header = [str(h).strip() for h in (vals[0] if vals else [])]
+        self.pending: dict[tuple[int, str], dict] = {}
+        self.posts_since_flush = 0
+
+        # 이전 실행에서 못 쓴 링크 복구: 행 번호가 바뀌었으면 src_id로 다시 찾는다.
+        # /export_rollover 로 다른 export 시트에서 옮겨온 행의 링크도 src_id로 찾아 이 시트에 반영한다.
+        # 어느 쪽에서도 못 찾은 항목은 버리지 않고 저널에 남긴다(CAFE_LINK_JOURNAL_MAX_AGE_SEC 지나면 정리).
+        i_src = self.header.index("src_id") if "src_id" in self.header else 2
+        row_by_sid = {}
+        for row_idx, r in enumerate(vals[1:], start=2):
+            sid = r[i_src].strip() if len(r) > i_src else ""
+            if sid:
+                row_by_sid.setdefault(sid, row_idx)
+        other_sheet = _export_other_sheet_name(sheet_name)
+        now_ts = time.time()
+        self.kept: list[dict] = []
+        restored = 0
+        for e in _cafe_link_journal_load():
+            if e.get("sheet") not in (sheet_name, other_sheet):
+                self.kept.append(e)
+                continue
+            row_idx = row_by_sid.get(str(e.get("sid") or ""))
+            col_name = str(e.get("col") or "")
+            if row_idx and col_name in self.header:
+                self.pending[(row_idx, col_name)] = {**e, "sheet": sheet_name, "row": row_idx}
+                restored += 1
+                continue
+            ts = float(e.get("ts") or now_ts)
+            if now_ts - ts <= CAFE_LINK_JOURNAL_MAX_AGE_SEC:
+                self.kept.append({**e, "ts": ts})
+        if restored:
+            print(f"[CAFE][EXPORT_LINK] 저널에서 링크 {restored}건 복구({sheet_name})")
+
+    def _journal(self) -> None:
+        # 같은 파일을 다른 실행이 건드렸을 수 있으니, 이 버퍼가 맡지 않은 다른 시트 항목은 파일에서 다시 읽는다.
+        mine = {self.sheet_name, _export_other_sheet_name(self.sheet_name)}
+        others = [e for e in _cafe_link_journal_load() if e.get("sheet") not in mine]
+        kept_mine = [e for e in self.kept if e.get("sheet") in mine]
+        _cafe_link_journal_save(others + kept_mine + list(self.pending.values()))
+
+    def add(self, row_idx: int, sid: str, values: dict[str, str]) -> None:
+        """글 1건의 링크들을 버퍼에 넣고 저널에 먼저 기록한다."""
+        for col_name, value in values.items():
+            if col_name not in self.header or not value:
+                continue
+            self.pending[(row_idx, col_name)] = {
+                "sheet": self.sheet_name,
+                "row": row_idx,
+                "sid": sid,
+                "col": col_name,
+                "value": value,
+                "ts": time.time(),
+            }
+        self.posts_since_flush += 1
+        self._journal()
+
+    def due(self) -> bool:
+        return self.posts_since_flush >= CAFE_LINK_FLUSH_EVERY
+
+    async def flush(self) -> bool:
+        """버퍼 전체를 batch_update 1회로 반영. 실패하면 버퍼/저널을 그대로 두고 False."""
+        self.posts_since_flush = 0
+        if not self.pending:
+            return True
+        payload = [
+            {"range": f"{_col_letter(self.header.index(col_name) + 1)}{row_idx}", "values": [[e["value"]]]}
+            for (row_idx, col_name), e in sorted(self.pending.items())
+        ]
+        try:
+            await _gsheet_call_with_backoff(
+                "cafe_post.export_link.batch_update",
+                self.ws.batch_update,
+                payload,
+                value_input_option="RAW",
+            )
+        except Exception as e:
+            print(f"[CAFE][EXPORT_LINK] 일괄 업데이트 실패({len(payload)}칸, 저널 유지): {e}")
+            return False
+        self.pending.clear()
+        self._journal()
+        return True
+
+
 async def cafe_post_from_export(update: Update, context: ContextTypes.DEFAULT_TYPE, which: str, sport_filter: str = "", mode: str = "simple"):
     """export_today/export_tomorrow 내용을 네이버 카페에 업로드.
 
@@ -2057,12 +2366,12 @@ async def cafe_post_from_export(update: Update, context: ContextTypes.DEFAULT_TY
     i_body = col("body", 4)
     i_created = col("createdAt", 5)
     i_simple = col("simple", 6)
-    i_cafe_title = col("cafe_title", -1)
-    i_cafe_url = col("cafe_url", -1)
-    i_cafe_url_deep = col("cafe_url_deep", -1)
-
 
     posted_keys = _load_posted_keys(ws_log)
+    links = _ExportLinkWriteback(ws, sheet_name, vals)
+    # 배치(Batch API) 결과를 기다리는 행은 본문/simple이 아직 비어 있으므로 업로드하지 않는다.
+    batch_pending = _openai_batch_pending_src_ids()
+    pending_cnt = 0
 
     def _infer_sport_key(sportv: str) -> str:
         for k in ("soccer", "baseball", "basketball", "volleyball"):
@@ -2104,10 +2413,15 @@ async def cafe_post_from_export(update: Update, context: ContextTypes.DEFAULT_TY
 
         # ✅ 마지막 안전 처리: 브랜드/구분자 제거(시트에 남아있어도 업로드 전에 정리)
         contentv = _postprocess_site_body_text(contentv)
+        if sid in batch_pending or not (contentv or "").strip():
+            pending_cnt += 1
+            continue
         to_post.append((sid, dayv, sportv, titlev, contentv, createdv, menuid, row_idx))
 
+    pending_note = f"\n(본문 생성 대기/빈 본문 {pending_cnt}건은 제외 → 채워진 뒤 다시 업로드)" if pending_cnt else ""
     if not to_post:
-        await update.message.reply_text("업로드할 새 글이 없어(이미 올린 글은 제외됨).")
+        await links.flush()
+        await update.message.reply_text("업로드할 새 글이 없어(이미 올린 글은 제외됨)." + pending_note)
         return
 
     delay_sec = float(os.getenv("CAFE_POST_DELAY_SEC", "7"))
@@ -2133,14 +2447,6 @@ async def cafe_post_from_export(update: Update, context: ContextTypes.DEFAULT_TY
             continue
 
         content_txt = (contentv or "").strip()
-        if not content_txt:
-            fail_cnt += 1
-            status = "NO_BODY" if mode == "deep" else "NO_SIMPLE"
-            await _append_cafe_log_row_safe(
-                ws_log,
-                [sid, dayv, sportv, NAVER_CAFE_CLUBID, menuid, "", now_kst().isoformat(), status, titlev, "", ""],
-            )
-            continue
 
         # 줄바꿈/HTML 태그 정규화 (body에 <br> 등이 섞여 있을 수 있음)
         content_norm = str(content_txt)
@@ -2187,18 +2493,13 @@ async def cafe_post_from_export(update: Update, context: ContextTypes.DEFAULT_TY
                     ws_log,
                     [sid, dayv, sportv, NAVER_CAFE_CLUBID, menuid, article_id, posted_at, "OK", subject, url, deep_url],
                 )
-                # export 시트에도 업로드된 링크를 기록(가능할 때만)
-                try:
-                    if i_cafe_title != -1:
-                        ws.update(range_name=f"{_col_letter(i_cafe_title + 1)}{row_idx}", values=[[subject]])
-                    if mode == "deep":
-                        if i_cafe_url_deep != -1 and deep_url:
-                            ws.update(range_name=f"{_col_letter(i_cafe_url_deep + 1)}{row_idx}", values=[[deep_url]])
-                    else:
-                        if i_cafe_url != -1 and url:
-                            ws.update(range_name=f"{_col_letter(i_cafe_url + 1)}{row_idx}", values=[[url]])
-                except Exception as e:
-                    print(f"[CAFE][EXPORT_LINK] 업데이트 실패({sid}): {e}")
+                # export 시트에도 업로드된 링크를 기록(가능할 때만) - 모았다가 N건마다 일괄 반영
+                if mode == "deep":
+                    links.add(row_idx, sid, {"cafe_title": subject, "cafe_url_deep": deep_url})
+                else:
+                    links.add(row_idx, sid, {"cafe_title": subject, "cafe_url": url})
+                if links.due():
+                    await links.flush()
 
                 break
 
@@ -2222,7 +2523,10 @@ async def cafe_post_from_export(update: Update, context: ContextTypes.DEFAULT_TY
 
         await asyncio.sleep(delay_sec)
 
-    await update.message.reply_text(f"카페 업로드 완료({mode}): 성공 {ok_cnt} / 실패 {fail_cnt} (중복은 제외됨)")
+    msg = f"카페 업로드 완료({mode}): 성공 {ok_cnt} / 실패 {fail_cnt} (중복은 제외됨)" + pending_note
+    if not await links.flush():
+        msg += f"\n⚠️ export 링크 기록 {len(links.pending)}칸 반영 실패 → 다음 업로드 때 다시 반영"
+    await update.message.reply_text(msg)
 
 
 def _log_httpx_exception(prefix: str, e: Exception) -> None:
@@ -2247,6 +2551,46 @@ def _log_httpx_exception(prefix: str, e: Exception) -> None:
     traceback.print_exc()
 
 
+# ----------------------------
+# 공유 동시성 제한 (호스트별 HTTP / LLM 호출)
+# - 여러 크롤링이 동시에 돌 때(/pipeline) 같은 호스트·LLM으로 몰리지 않게 한다.
+# - LLM 호출은 동기 SDK라 전용 스레드 풀로 넘겨서 이벤트 루프를 막지 않는다.
+#   (동시성 제한/재시도는 LLM 게이트웨이(_llm_call)의 모델별 슬롯 한 곳에서만 한다)
+# ----------------------------
+PIPELINE_HOST_CONCURRENCY = max(1, int(os.getenv("PIPELINE_HOST_CONCURRENCY", "4")))
+LLM_THREAD_WORKERS = max(1, int(os.getenv("LLM_THREAD_WORKERS", "16")))
+
+_HOST_SEMAPHORES: dict[str, asyncio.Semaphore] = {}
+# 모델 슬롯을 기다리는 LLM 스레드가 기본 스레드 풀(시트 호출 등 to_thread)을 잡아먹지 않게 분리
+_LLM_EXECUTOR = ThreadPoolExecutor(max_workers=LLM_THREAD_WORKERS, thread_name_prefix="llm")
+
+
+def _host_semaphore(url: str) -> asyncio.Semaphore:
+    """URL 호스트별 공유 세마포어(PIPELINE_HOST_CONCURRENCY)."""
+    try:
+        host = (urlparse(str(url)).hostname or "").lower()
+    except Exception:
+        host = ""
+    sem = _HOST_SEMAPHORES.get(host)
+    if sem is None:
+        sem = asyncio.Semaphore(PIPELINE_HOST_CONCURRENCY)
+        _HOST_SEMAPHORES[host] = sem
+    return sem
+
+
+async def _host_limited_get(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """호스트별 동시성 제한을 걸고 client.get 수행."""
+    async with _host_semaphore(url):
+        return await client.get(url, **kwargs)
+
+
+async def _run_llm_in_thread(func, *args, **kwargs):
+    """동기 LLM 호출(func)을 LLM 전용 스레드 풀에서 실행. (컨텍스트는 to_thread처럼 복사)"""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_LLM_EXECUTOR, functools.partial(ctx.run, func, *args, **kwargs))
+
+
 # ----------------------------
 # HTTP helpers (Mazgtv anti-bot 대응: 브라우저 헤더 + 쿠키 워밍업)
 # ----------------------------
@@ -2385,6 +2729,7 @@ from telegram import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     InputFile,
+    InputMediaDocument,
 )
 
 from datetime import datetime, timedelta, date
@@ -2396,6 +2741,7 @@ from telegram.ext import (
     CallbackQueryHandler,
     TypeHandler,
     ApplicationHandlerStop,
+    BaseUpdateProcessor,
     ContextTypes,
     filters,
 )
@@ -2455,6 +2801,106 @@ async def _dedup_update_guard(update: Update, context: ContextTypes.DEFAULT_TYPE
         _RECENT_UPDATE_IDS[uid] = now_ts
 
 
+# ───────────────── Telegram 업데이트 동시 처리 ─────────────────
+# - 업데이트를 동시에 처리하되, 같은 채팅(콜백은 같은 사용자) 안에서는 들어온 순서대로 하나씩 처리
+# - 크롤링/업로드 같은 무거운 명령은 별도 레인(동시 실행 수 제한)으로 보내
+#   채널 사용자의 메뉴 콜백이 관리자 작업 뒤에서 기다리지 않게 한다.
+# - 무거운 명령은 시트를 '읽고 → 없는 것만 추가/이동'하므로 기본은 한 번에 하나씩(TG_HEAVY_CONCURRENCY=1).
+#   2 이상으로 올리면 /rollover 와 크롤링처럼 같은 시트를 건드리는 명령이 서로 섞여 실행될 수 있다.
+TG_PUBLIC_CONCURRENCY = max(1, int(os.getenv("TG_PUBLIC_CONCURRENCY", "16")))
+TG_HEAVY_CONCURRENCY = max(1, int(os.getenv("TG_HEAVY_CONCURRENCY", "1")))
+TG_MAX_PENDING_UPDATES = max(TG_PUBLIC_CONCURRENCY + TG_HEAVY_CONCURRENCY, int(os.getenv("TG_MAX_PENDING_UPDATES", "256")))
+
+# 무거운 레인 동시 실행 제한(스케줄 실행도 같은 세마포어를 잡아 수동 명령과 섞이지 않게)
+_TG_HEAVY_SEM = asyncio.Semaphore(TG_HEAVY_CONCURRENCY)
+
+# 무거운 레인에 보내지 않는 가벼운 명령
+_TG_LIGHT_COMMANDS = {"start", "myid", "llm_stats", "timing", "schedule"}
+# 무거운 콜백(파일 생성/전송)
+_TG_HEAVY_CALLBACK_PREFIXES = ("txt:", "zip:")
+
+
+def _tg_update_lane(update: object) -> tuple[object, bool]:
+    """(순서 보장 키, 무거운 작업 여부). 키가 None이면 순서 제약 없음."""
+    if not isinstance(update, Update):
+        return None, False
+
+    q = update.callback_query
+    if q is not None:
+        user = q.from_user
+        heavy = str(q.data or "").startswith(_TG_HEAVY_CALLBACK_PREFIXES)
+        return (("user", user.id) if user else None), heavy
+
+    chat = update.effective_chat
+    key = ("chat", chat.id) if chat else None
+    msg = update.effective_message
+    text = (getattr(msg, "text", None) or "").strip() if msg else ""
+    if text.startswith("/"):
+        cmd = text[1:].split(maxsplit=1)[0].split("@", 1)[0].lower() if len(text) > 1 else ""
+        return key, bool(cmd) and cmd not in _TG_LIGHT_COMMANDS
+    return key, False
+
+
+async def _tg_timed_command(update: object, coroutine) -> None:
+    """무거운 명령 하나를 명령 단위 계측 기록 안에서 실행하고, 끝나면 단계별 소요를 로그/메시지로 남긴다."""
+    if isinstance(update, Update) and update.callback_query is not None:
+        label = "cb:" + str(update.callback_query.data or "").split(":", 1)[0]
+    else:
+        msg = update.effective_message if isinstance(update, Update) else None
+        label = ((getattr(msg, "text", None) or "").strip().split(maxsplit=1) or ["?"])[0]
+
+    handle = cmd_trace_begin(label)
+    try:
+        await coroutine
+    finally:
+        trace, elapsed = cmd_trace_end(handle)
+        if CMD_TIMING_REPORT and trace["stages"] and elapsed >= CMD_TIMING_MIN_SEC and is_admin(update):
+            try:
+                lines = [f"⏱ {label} 단계별 소요 (전체 {elapsed:.1f}s, 동시 실행분은 합계로 표시)"]
+                lines.extend(format_span_stats(trace["stages"]))
+                await update.get_bot().send_message(chat_id=update.effective_chat.id, text="\n".join(lines)[:4000])
+            except Exception as e:
+                print(f"[TIMING] 리포트 전송 실패: {e}")
+
+
+class _ChatLaneUpdateProcessor(BaseUpdateProcessor):
+    """채팅별 순서 보장 + 일반/무거운 레인 분리 업데이트 처리기."""
+
+    def __init__(self):
+        super().__init__(TG_MAX_PENDING_UPDATES)
+        self._public_sem = asyncio.Semaphore(TG_PUBLIC_CONCURRENCY)
+        self._heavy_sem = _TG_HEAVY_SEM
+        # 키 → [lock, 사용 중인 업데이트 수] (다 끝나면 지워서 dict가 계속 커지지 않게)
+        self._chat_locks: dict[object, list] = {}
+
+    async def do_process_update(self, update: object, coroutine) -> None:
+        key, heavy = _tg_update_lane(update)
+        lane = self._heavy_sem if heavy else self._public_sem
+        if heavy:
+            coroutine = _tg_timed_command(update, coroutine)
+        if key is None:
+            async with lane:
+                await coroutine
+            return
+
+        ent = self._chat_locks.setdefault(key, [asyncio.Lock(), 0])
+        ent[1] += 1
+        try:
+            async with ent[0]:
+                async with lane:
+                    await coroutine
+        finally:
+            ent[1] -= 1
+            if ent[1] <= 0:
+                self._chat_locks.pop(key, None)
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+
 # 🔹 Gemini API 키 (환경변수에 설정)
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "").strip()
 
@@ -2652,10 +3098,34 @@ def get_gs_client():
 
     creds = ServiceAccountCredentials.from_json_keyfile_dict(key_data, scope)
     _gs_client = gspread.authorize(creds)
+    _gsheet_instrument_client(_gs_client)
     print("[GSHEET] gspread 인증 완료")
     return _gs_client
 
 
+def _gsheet_instrument_client(client) -> None:
+    """gspread 의 모든 HTTP 호출을 span(gsheet.read / gsheet.write)으로 잰다."""
+    http = getattr(client, "http_client", None)
+    orig = getattr(http, "request", None)
+    if orig is None or getattr(orig, "_span_wrapped", False):
+        return
+
+    def request(method, endpoint, *a, **kw):
+        name = "gsheet.read" if str(method).lower() == "get" else "gsheet.write"
+        with span(name):
+            try:
+                resp = orig(method, endpoint, *a, **kw)
+            except Exception as e:
+                r = getattr(e, "response", None)
+                span_note(status=getattr(r, "status_code", None), request=True)
+                raise
+            span_note(status=resp.status_code, nbytes=len(resp.content or b""), request=True)
+            return resp
+
+    request._span_wrapped = True
+    http.request = request
+
+
 def summarize_text(text: str, max_len: int = 400) -> str:
     """
     (예전용) 아주 단순한 요약: 문장을 잘라서 앞에서부터 max_len까지 자르는 방식.
@@ -3337,68 +3807,56 @@ def _openai_generate_text_any(prompt: str, system: str, model: str, temperature:
     - 키 권한이 Responses만/ChatCompletions만 허용된 경우 모두 대응
     - 실패 시 EXPORT_COMMENT_LAST_ERROR에 마지막 에러를 기록
     """
-    client = get_openai_client()
-    if not client:
+    if not get_openai_client():
         _set_export_comment_last_error("OPENAI_API_KEY 미설정 또는 클라이언트 초기화 실패")
         return ""
 
     # 1) Responses API 먼저 시도 (권한이 더 타이트한 키에서도 자주 허용)
     try:
-        if hasattr(client, "responses") and hasattr(client.responses, "create"):
-            # 시스템+유저 프롬프트를 한 문자열로 합쳐 전달 (SDK 버전 차이에 덜 민감)
-            combined = (system or "").strip() + "\n\n" + (prompt or "").strip()
-            resp = client.responses.create(
-                model=model,
-                input=combined,
-                temperature=temperature,
-            )
-            txt = _extract_text_from_responses_obj(resp)
-            if txt:
-                return txt
+        # 시스템+유저 프롬프트를 한 문자열로 합쳐 전달 (SDK 버전 차이에 덜 민감)
+        combined = (system or "").strip() + "\n\n" + (prompt or "").strip()
+        return llm_responses("export_comment", model=model, input_text=combined, temperature=temperature)
     except Exception as e:
         _set_export_comment_last_error(f"Responses 실패: {e}")
 
     # 2) Chat Completions 시도
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system or ""},
-                {"role": "user", "content": prompt or ""},
-            ],
-            temperature=temperature,
-        )
-        content = (resp.choices[0].message.content or "").strip()
-        if content:
-            return content
+        return llm_chat("export_comment", model=model, system=system, prompt=prompt, temperature=temperature)
     except Exception as e:
         _set_export_comment_last_error(f"ChatCompletions 실패: {e}")
 
     return ""
 
 
-def generate_export_comments(
+def _export_comment_model_candidates() -> list[str]:
+    # 모델: env 우선 + 안전 폴백
+    primary_model = (os.getenv("EXPORT_COMMENT_MODEL") or os.getenv("SIMPLE_REWRITE_MODEL") or os.getenv("OPENAI_MODEL") or "").strip()
+    model_candidates = [m for m in [primary_model, "gpt-4o-mini", "gpt-4o", "gpt-4.1-mini"] if m]
+    # 중복 제거
+    seen = set()
+    return [m for m in model_candidates if (m not in seen and not seen.add(m))]
+
+
+def _export_comment_temperature() -> float:
+    try:
+        temperature = float((os.getenv("EXPORT_COMMENT_TEMPERATURE", "0.95") or "0.95").strip())
+    except Exception:
+        temperature = 0.95
+    return max(0.2, min(1.2, temperature))
+
+
+def _build_export_comment_prompt(
     title: str,
     sport_label: str = "",
     count: int | None = None,
     mode: str = "simple",
     body_hint: str = "",
     avoid_text: str = "",
-) -> str:
-    """OpenAI로 '인간 댓글'을 생성해서 줄바꿈 문자열로 반환한다.
-
-    mode:
-      - "simple": 일반(심플) 게시글용 댓글
-      - "deep":   심층 게시글용 댓글(더 디테일/심층 뉘앙스)
+) -> tuple[str, str, int] | None:
+    """댓글 생성 프롬프트 (prompt, system, count). 제목이 없으면 None.
 
-    ⚠️ 중요한 설계:
-    - 실패해도 봇이 죽지 않도록 예외는 내부에서 처리
-    - 실패 원인은 EXPORT_COMMENT_LAST_ERROR에 남김
+    실시간 생성(generate_export_comments)과 Batch API 생성(/export_comment_fill batch)이 같이 쓴다.
     """
-    enabled = (os.getenv("EXPORT_COMMENT_ENABLED", "1").strip().lower() not in ("0", "false", "no"))
-    if not enabled:
-        return ""
-
     mode = (mode or "simple").strip().lower()
     if mode not in ("simple", "deep"):
         mode = "simple"
@@ -3414,20 +3872,7 @@ def generate_export_comments(
 
     t = (title or "").strip()
     if not t:
-        return ""
-
-    # 모델: env 우선 + 안전 폴백
-    primary_model = (os.getenv("EXPORT_COMMENT_MODEL") or os.getenv("SIMPLE_REWRITE_MODEL") or os.getenv("OPENAI_MODEL") or "").strip()
-    model_candidates = [m for m in [primary_model, "gpt-4o-mini", "gpt-4o", "gpt-4.1-mini"] if m]
-    # 중복 제거
-    seen = set()
-    model_candidates = [m for m in model_candidates if (m not in seen and not seen.add(m))]
-
-    try:
-        temperature = float((os.getenv("EXPORT_COMMENT_TEMPERATURE", "0.95") or "0.95").strip())
-    except Exception:
-        temperature = 0.95
-    temperature = max(0.2, min(1.2, temperature))
+        return None
 
     parts = _parse_export_title_parts(t)
     league = parts.get("league", "")
@@ -3481,23 +3926,11 @@ def generate_export_comments(
 """
 
     system = "You write natural Korean comments for sports community posts."
+    return prompt, system, count
 
-    # 모델 후보 순서대로 시도
-    content = ""
-    last_err = ""
-    for m in (model_candidates or ["gpt-4o-mini"]):
-        _set_export_comment_last_error("")
-        content = _openai_generate_text_any(prompt=prompt, system=system, model=m, temperature=temperature)
-        if content:
-            break
-        last_err = EXPORT_COMMENT_LAST_ERROR or last_err
-
-    if not content:
-        if last_err:
-            print(f"[OPENAI][EXPORT_COMMENT] 생성 실패: {last_err}")
-        return ""
 
-    # 파싱/정리
+def _clean_export_comment_output(content: str, count: int) -> str:
+    """모델 출력 → 댓글 줄 목록 정리(번호/불릿 제거, 길이 컷, 중복 제거, count개)."""
     out_lines: list[str] = []
     for line in (content or "").splitlines():
         s = (line or "").strip()
@@ -3528,12 +3961,127 @@ def generate_export_comments(
     return "\n".join(uniq).strip()
 
 
+def generate_export_comments(
+    title: str,
+    sport_label: str = "",
+    count: int | None = None,
+    mode: str = "simple",
+    body_hint: str = "",
+    avoid_text: str = "",
+) -> str:
+    """OpenAI로 '인간 댓글'을 생성해서 줄바꿈 문자열로 반환한다.
+
+    mode:
+      - "simple": 일반(심플) 게시글용 댓글
+      - "deep":   심층 게시글용 댓글(더 디테일/심층 뉘앙스)
+
+    ⚠️ 중요한 설계:
+    - 실패해도 봇이 죽지 않도록 예외는 내부에서 처리
+    - 실패 원인은 EXPORT_COMMENT_LAST_ERROR에 남김
+    """
+    enabled = (os.getenv("EXPORT_COMMENT_ENABLED", "1").strip().lower() not in ("0", "false", "no"))
+    if not enabled:
+        return ""
+
+    built = _build_export_comment_prompt(
+        title,
+        sport_label=sport_label,
+        count=count,
+        mode=mode,
+        body_hint=body_hint,
+        avoid_text=avoid_text,
+    )
+    if built is None:
+        return ""
+    prompt, system, count = built
+
+    model_candidates = _export_comment_model_candidates()
+    temperature = _export_comment_temperature()
+
+    # 모델 후보 순서대로 시도
+    content = ""
+    last_err = ""
+    for m in (model_candidates or ["gpt-4o-mini"]):
+        _set_export_comment_last_error("")
+        content = _openai_generate_text_any(prompt=prompt, system=system, model=m, temperature=temperature)
+        if content:
+            break
+        last_err = EXPORT_COMMENT_LAST_ERROR or last_err
+
+    if not content:
+        if last_err:
+            print(f"[OPENAI][EXPORT_COMMENT] 생성 실패: {last_err}")
+        return ""
+
+    return _clean_export_comment_output(content, count)
+
+
 def generate_export_comments_pair(title: str, sport_label: str = "", body_hint: str = "", count: int | None = None) -> tuple[str, str]:
     """(comments, deep_comments) 쌍을 생성한다. deep 쪽은 simple 쪽과 중복을 피하도록 유도한다."""
     comments = generate_export_comments(title=title, sport_label=sport_label, count=count, mode="simple")
     deep_comments = generate_export_comments(title=title, sport_label=sport_label, count=count, mode="deep", body_hint=body_hint, avoid_text=comments)
     return (comments or "").strip(), (deep_comments or "").strip()
 
+# export simple(G열) 생성 단계
+# - extract_simple_from_body()는 OpenAI 재작성(동기 호출)을 할 수 있어서, 시트 append 안에서 돌리지 않고
+#   append 전에 별도 async 단계로 동시에 생성한다. 같은 본문은 캐시해서 다시 생성하지 않는다.
+SIMPLE_GEN_CACHE_MAX = max(0, int(os.getenv("SIMPLE_GEN_CACHE_MAX", "2000")))
+_SIMPLE_GEN_CACHE: dict[str, str] = {}
+
+
+def _simple_gen_cache_key(body: str) -> str:
+    return _hashlib.sha1(str(body).encode("utf-8")).hexdigest()
+
+
+async def fill_export_simple(rows: list[list[str]]) -> int:
+    """append_export_rows에 넘길 행들의 빈 simple을 body에서 생성해 채운다(제자리 수정).
+
+    - 기본/구버전/신버전 입력 포맷 모두 body=4, simple=6 위치
+    - 서로 다른 본문만 생성하고(중복 본문은 1회), LLM 동시성은 _run_llm_in_thread 제한을 따른다.
+    반환: 새로 생성한 본문 수(캐시 적중 제외)
+    """
+    i_body, i_simple = 4, 6
+    targets: list[list[str]] = []
+    for r in rows:
+        if not r:
+            continue
+        body = str(r[i_body] if len(r) > i_body else "").strip()
+        if not body:
+            continue
+        if len(r) > i_simple and str(r[i_simple]).strip():
+            continue
+        targets.append(r)
+    if not targets:
+        return 0
+
+    todo: dict[str, str] = {}
+    for r in targets:
+        k = _simple_gen_cache_key(r[i_body])
+        if k not in _SIMPLE_GEN_CACHE:
+            todo.setdefault(k, r[i_body])
+
+    if todo:
+        keys = list(todo)
+        results = await asyncio.gather(
+            *[_run_llm_in_thread(extract_simple_from_body, todo[k]) for k in keys],
+            return_exceptions=True,
+        )
+        for k, res in zip(keys, results):
+            if isinstance(res, Exception):
+                print(f"[EXPORT][SIMPLE] 생성 실패(빈 값으로 저장): {res}")
+                continue
+            _SIMPLE_GEN_CACHE[k] = res or ""
+        while len(_SIMPLE_GEN_CACHE) > SIMPLE_GEN_CACHE_MAX:
+            _SIMPLE_GEN_CACHE.pop(next(iter(_SIMPLE_GEN_CACHE)))
+
+    for r in targets:
+        simple = _SIMPLE_GEN_CACHE.get(_simple_gen_cache_key(r[i_body]), "")
+        while len(r) <= i_simple:
+            r.append("")
+        r[i_simple] = simple
+    return len(todo)
+
+
 def append_export_rows(sheet_name: str, rows: list[list[str]], *, fill_comments: bool = False) -> bool:
     """지정 export 시트에 rows를 append.
 
@@ -3546,6 +4094,7 @@ def append_export_rows(sheet_name: str, rows: list[list[str]], *, fill_comments:
       day, sport, src_id, title, body, createdAt, simple, cafe_title, cafe_url, comments, cafe_url_deep, deep_comments
 
     성능 메모:
+      - simple은 여기서 만들지 않는다. 비어 있으면 호출 전에 fill_export_simple()로 채운다.
       - fill_comments=False 이면 comments / deep_comments 자동 생성(OpenAI)을 건너뛴다.
       - 대량 mazcrawl 시 export 저장 지연을 줄이기 위해 기본값은 False다.
       - 댓글이 필요하면 /export_comment_fill 로 별도 생성한다.
@@ -3619,10 +4168,6 @@ def append_export_rows(sheet_name: str, rows: list[list[str]], *, fill_comments:
         title = rr[i_title] if i_title < len(rr) else ""
         body = rr[i_body] if i_body < len(rr) else ""
 
-        # simple 보정(비어있으면 body에서 추출)
-        if i_simple < len(rr) and not str(rr[i_simple]).strip():
-            rr[i_simple] = extract_simple_from_body(body)
-
         # base_title: 우선 title, 없으면 simple 첫 줄
         base_title = (title or "").strip()
         if not base_title:
@@ -3671,28 +4216,416 @@ def append_export_rows(sheet_name: str, rows: list[list[str]], *, fill_comments:
         print(f"[GSHEET][EXPORT] append 실패({sheet_name}): {e}")
         return False
 
-# ───────────────── Export 댓글 채우기(OpenAI) ─────────────────
+# ───────────────── OpenAI Batch API (비긴급 LLM 생성) ─────────────────
+# export 댓글 채우기 / 내일 경기 사이트 본문 재작성처럼 급하지 않은 생성은
+# JSONL 배치로 묶어 제출하고, JobQueue에서 주기적으로 결과를 확인해 시트에 한 번에 반영한다.
+# - OPENAI_BATCH_BASE_URL 을 주면 해당 엔드포인트(로컬 대체 서버 등)로 배치를 보낸다.
+# - 제출한 배치 메타(custom_id → 시트/src_id/컬럼)는 로컬 JSON에 저장해 재시작 후에도 이어서 반영한다.
 
-async def export_comment_fill(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """기존 export 시트의 comments / deep_comments 컬럼을 채운다.
+OPENAI_BATCH_BASE_URL = (os.getenv("OPENAI_BATCH_BASE_URL") or "").strip().rstrip("/")
+OPENAI_BATCH_STATE_PATH = (os.getenv("OPENAI_BATCH_STATE_PATH") or "openai_batch_state.json").strip()
+OPENAI_BATCH_POLL_SEC = max(30, int(os.getenv("OPENAI_BATCH_POLL_SEC", "300")))
+OPENAI_BATCH_COMPLETION_WINDOW = (os.getenv("OPENAI_BATCH_COMPLETION_WINDOW") or "24h").strip()
+OPENAI_BATCH_ENDPOINT = "/v1/chat/completions"
+OPENAI_BATCH_WRITE_MAX_ATTEMPTS = max(1, int(os.getenv("OPENAI_BATCH_WRITE_MAX_ATTEMPTS", "12")))
 
-    사용:
-      /export_comment_fill
-      /export_comment_fill today|tomorrow|all [limit] [force] [simple|deep|both]
+_openai_batch_client = None
+_OPENAI_BATCH_STATE_LOCK = asyncio.Lock()
 
-    기본 동작(✅ 요청 반영):
-      - /export_comment_fill (인자 없음) → comments + deep_comments 둘 다 채움(비어있는 것만)
-      - 최신 행(아래쪽)부터 최대 30행(경기) 처리
 
-    옵션:
-      - simple : comments(심플)만
-      - deep   : deep_comments(심층)만
-      - both   : comments + deep_comments
-      - force  : 이미 값이 있어도 덮어쓰기(단, 생성 결과가 비어있으면 덮어쓰지 않음)
+def get_openai_batch_client():
+    """Batch API용 클라이언트(OPENAI_BATCH_BASE_URL 이 있으면 그 주소).
 
-    주의:
-      - OpenAI 생성 실패(키/모델/레이트리밋 등) 시, 시트가 비어있는 상태로 남을 수 있음
-      - 이 경우 "생성 실패" 카운트와 마지막 에러를 응답에 포함한다.
+    files/batches 호출은 LLM 게이트웨이를 거치지 않으므로, 게이트웨이용 클라이언트(max_retries=0)를
+    공유하지 않고 SDK 기본 재시도를 쓰는 별도 클라이언트를 만든다.
+    """
+    global _openai_batch_client
+    if _openai_batch_client is not None:
+        return _openai_batch_client
+    api_key = os.getenv("OPENAI_API_KEY", "").strip()
+    if not api_key and not OPENAI_BATCH_BASE_URL:
+        print("[OPENAI][BATCH] OPENAI_API_KEY 미설정 → 배치 사용 불가")
+        return None
+    try:
+        kwargs = {"base_url": OPENAI_BATCH_BASE_URL} if OPENAI_BATCH_BASE_URL else {}
+        _openai_batch_client = OpenAI(api_key=api_key or "local", **kwargs)
+    except Exception as e:
+        print(f"[OPENAI][BATCH] 클라이언트 초기화 실패: {e}")
+        _openai_batch_client = None
+    return _openai_batch_client
+
+
+def _openai_batch_load_state() -> dict:
+    try:
+        with open(OPENAI_BATCH_STATE_PATH, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if isinstance(state, dict) and isinstance(state.get("batches"), dict):
+            return state
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[OPENAI][BATCH] 상태 파일 읽기 실패: {e}")
+    return {"batches": {}}
+
+
+def _openai_batch_save_state(state: dict) -> None:
+    tmp = OPENAI_BATCH_STATE_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp, OPENAI_BATCH_STATE_PATH)
+
+
+def _openai_batch_request_line(
+    custom_id: str,
+    *,
+    model: str,
+    system: str,
+    prompt: str,
+    temperature: float,
+    max_completion_tokens: int | None = None,
+) -> dict:
+    body = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system or ""},
+            {"role": "user", "content": prompt or ""},
+        ],
+        "temperature": temperature,
+    }
+    if max_completion_tokens:
+        body["max_completion_tokens"] = int(max_completion_tokens)
+    return {"custom_id": custom_id, "method": "POST", "url": OPENAI_BATCH_ENDPOINT, "body": body}
+
+
+def submit_openai_batch(kind: str, lines: list[dict], items: dict[str, dict], *, chat_id=None) -> str:
+    """JSONL 배치를 업로드/제출하고 batch_id를 돌려준다(실패 시 "").
+
+    kind : "export_comment" | "site_rewrite" (결과 반영 방식)
+    items: custom_id → 반영 메타
+    """
+    if not lines:
+        return ""
+    client = get_openai_batch_client()
+    if not client:
+        print("[OPENAI][BATCH] 클라이언트 없음 → 배치 제출 불가")
+        return ""
+
+    data = "\n".join(json.dumps(line, ensure_ascii=False) for line in lines).encode("utf-8")
+    try:
+        up = client.files.create(file=(f"{kind}.jsonl", data), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=up.id,
+            endpoint=OPENAI_BATCH_ENDPOINT,
+            completion_window=OPENAI_BATCH_COMPLETION_WINDOW,
+            metadata={"kind": kind},
+        )
+    except Exception as e:
+        print(f"[OPENAI][BATCH] 제출 실패({kind}): {e}")
+        return ""
+
+    state = _openai_batch_load_state()
+    state["batches"][batch.id] = {
+        "kind": kind,
+        "createdAt": get_kst_now().strftime("%Y-%m-%d %H:%M:%S"),
+        "chat_id": chat_id,
+        "items": items,
+    }
+    _openai_batch_save_state(state)
+    print(f"[OPENAI][BATCH] 제출 완료 kind={kind} id={batch.id} 요청={len(lines)}")
+    return batch.id
+
+
+def _openai_batch_parse_output(text: str) -> dict[str, str]:
+    """배치 결과 JSONL → custom_id → 응답 텍스트(실패 항목은 "")."""
+    out: dict[str, str] = {}
+    for line in (text or "").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            obj = json.loads(line)
+        except Exception:
+            continue
+        cid = str(obj.get("custom_id") or "")
+        if not cid:
+            continue
+        content = ""
+        try:
+            resp = obj.get("response") or {}
+            if int(resp.get("status_code") or 0) == 200:
+                choices = (resp.get("body") or {}).get("choices") or []
+                if choices:
+                    content = ((choices[0].get("message") or {}).get("content") or "").strip()
+        except Exception:
+            content = ""
+        out[cid] = content
+    return out
+
+
+def _openai_batch_results_to_cells(kind: str, items: dict[str, dict], results: dict[str, str]) -> tuple[dict[str, dict[str, dict[str, str]]], int]:
+    """결과를 시트 반영 단위로 변환: {sheet: {src_id: {column: value}}}, 실패 수."""
+    cells: dict[str, dict[str, dict[str, str]]] = {}
+    failed = 0
+    for cid, meta in items.items():
+        content = results.get(cid, "")
+        sheet = meta.get("sheet") or ""
+        src_id = meta.get("src_id") or ""
+        if not (sheet and src_id):
+            continue
+
+        if kind == "export_comment":
+            value = _clean_export_comment_output(content, int(meta.get("count") or 6)) if content else ""
+            if not value:
+                failed += 1
+                continue
+            cells.setdefault(sheet, {}).setdefault(src_id, {})[meta.get("column") or "comments"] = value
+
+        elif kind == "site_rewrite":
+            req = meta.get("req") or {}
+            if content:
+                body = _finalize_site_rewrite_body(content, req)
+            else:
+                failed += 1
+                body = _site_rewrite_fallback_body(req)
+            body, simple = _build_site_export_body_and_simple(
+                body,
+                site_title=meta.get("site_title") or "",
+                sport_label=meta.get("sport_label") or "",
+                row_sport=meta.get("row_sport") or "",
+                league=meta.get("league") or "",
+                home=meta.get("home") or "",
+                away=meta.get("away") or "",
+                row_id=src_id,
+            )
+            cells.setdefault(sheet, {}).setdefault(src_id, {}).update({"body": body, "simple": simple})
+
+    return cells, failed
+
+
+def _export_other_sheet_name(sheet_name: str) -> str:
+    """export_today ↔ export_tomorrow (그 외 시트는 "")."""
+    if sheet_name == EXPORT_TODAY_SHEET_NAME:
+        return EXPORT_TOMORROW_SHEET_NAME
+    if sheet_name == EXPORT_TOMORROW_SHEET_NAME:
+        return EXPORT_TODAY_SHEET_NAME
+    return ""
+
+
+def _openai_batch_write_sheet(sheet_name: str, by_src: dict[str, dict[str, str]]) -> tuple[int, list[str], str]:
+    """한 시트를 한 번 읽고 한 번의 batch_update로 반영. (반영 셀 수, 행이 없는 src_id, 에러)"""
+    ws = get_export_ws(sheet_name)
+    if not ws:
+        return 0, [], f"{sheet_name} 시트 열기 실패"
+    try:
+        vals = ws.get_all_values()
+    except Exception as e:
+        return 0, [], f"{sheet_name} 읽기 실패: {e}"
+    header = [str(h).strip() for h in (vals[0] if vals else [])]
+    if "src_id" not in header:
+        return 0, list(by_src), ""
+    i_src = header.index("src_id")
+    row_by_src: dict[str, int] = {}
+    for n, r in enumerate(vals[1:], start=2):
+        sid = (r[i_src] if len(r) > i_src else "").strip()
+        if sid:
+            row_by_src[sid] = n
+
+    payload = []
+    missing: list[str] = []
+    for src_id, col_values in by_src.items():
+        row_num = row_by_src.get(src_id)
+        if not row_num:
+            missing.append(src_id)
+            continue
+        for col_name, value in col_values.items():
+            if col_name not in header:
+                continue
+            payload.append({"range": f"{_col_letter(header.index(col_name) + 1)}{row_num}", "values": [[value]]})
+    if not payload:
+        return 0, missing, ""
+    try:
+        ws.batch_update(payload, value_input_option="RAW")
+    except Exception as e:
+        return 0, [], f"{sheet_name} batch_update 실패: {e}"
+    return len(payload), missing, ""
+
+
+def _openai_batch_write_cells(cells: dict[str, dict[str, dict[str, str]]]) -> tuple[int, int, str]:
+    """시트별로 반영. (반영 셀 수, 어느 export 시트에서도 행을 못 찾은 src_id 수, 마지막 에러)
+
+    제출 후 /export_rollover 로 tomorrow → today 로 옮겨진 행은 다른 export 시트에서 찾아 반영한다.
+    에러가 있으면 호출 측에서 배치를 상태에 남겨 다음 확인 때 다시 반영한다.
+    """
+    written = 0
+    missing_cnt = 0
+    last_err = ""
+    retry_in: dict[str, dict[str, dict[str, str]]] = {}
+    for sheet_name, by_src in cells.items():
+        n, missing, err = _openai_batch_write_sheet(sheet_name, by_src)
+        written += n
+        last_err = err or last_err
+        other = _export_other_sheet_name(sheet_name)
+        for sid in missing:
+            if other:
+                retry_in.setdefault(other, {})[sid] = by_src[sid]
+            else:
+                missing_cnt += 1
+
+    for sheet_name, by_src in retry_in.items():
+        n, missing, err = _openai_batch_write_sheet(sheet_name, by_src)
+        written += n
+        missing_cnt += len(missing)
+        last_err = err or last_err
+    return written, missing_cnt, last_err
+
+
+def _openai_batch_pending_src_ids() -> set[str]:
+    """아직 결과가 반영되지 않은 배치의 src_id (업로드 시 제외용)."""
+    out: set[str] = set()
+    for entry in _openai_batch_load_state()["batches"].values():
+        for meta in (entry.get("items") or {}).values():
+            sid = str((meta or {}).get("src_id") or "").strip()
+            if sid:
+                out.add(sid)
+    return out
+
+
+def _openai_batch_poll_once() -> list[dict]:
+    """대기 중인 배치를 한 번씩 확인하고, 끝난 배치는 시트 반영 후 상태에서 제거한다.
+
+    시트 반영이 실패하면(시트 열기/읽기/batch_update 오류) 배치를 남겨 두고 다음 확인 때 다시 반영한다.
+    (OPENAI_BATCH_WRITE_MAX_ATTEMPTS 번 연속 실패하면 포기)
+    """
+    state = _openai_batch_load_state()
+    if not state["batches"]:
+        return []
+    client = get_openai_batch_client()
+    if not client:
+        return []
+
+    reports: list[dict] = []
+    for batch_id, entry in list(state["batches"].items()):
+        try:
+            batch = client.batches.retrieve(batch_id)
+        except Exception as e:
+            print(f"[OPENAI][BATCH] 조회 실패 id={batch_id}: {e}")
+            continue
+
+        status = str(getattr(batch, "status", "") or "")
+        if status in ("validating", "in_progress", "finalizing", "cancelling"):
+            continue
+
+        report = {"id": batch_id, "kind": entry.get("kind"), "status": status, "chat_id": entry.get("chat_id"),
+                  "requests": len(entry.get("items") or {}), "written": 0, "failed": 0, "error": ""}
+
+        # failed/expired/cancelled 또는 결과 파일 없는 completed 는 결과 없음으로 처리한다.
+        # (site_rewrite 는 빈 결과 → 원문 기반 본문/simple 로 채워서 본문이 빈 export 행이 남지 않게)
+        results: dict[str, str] = {}
+        if status == "completed" and getattr(batch, "output_file_id", None):
+            try:
+                text = client.files.content(batch.output_file_id).text
+            except Exception as e:
+                print(f"[OPENAI][BATCH] 결과 다운로드 실패 id={batch_id}: {e}")
+                continue
+            results = _openai_batch_parse_output(text)
+        elif status == "completed":
+            report["error"] = "결과 파일 없음"
+        else:
+            report["error"] = f"배치 상태 {status}"
+
+        cells, failed = _openai_batch_results_to_cells(entry.get("kind") or "", entry.get("items") or {}, results)
+        written, missing, err = _openai_batch_write_cells(cells)
+        report.update({"written": written, "failed": failed + missing})
+        if err:
+            prefix = f"{report['error']} / " if report["error"] else ""
+            attempts = int(entry.get("write_attempts") or 0) + 1
+            entry["write_attempts"] = attempts
+            if attempts < OPENAI_BATCH_WRITE_MAX_ATTEMPTS:
+                _openai_batch_save_state(state)
+                print(f"[OPENAI][BATCH] 반영 실패 id={batch_id} ({attempts}/{OPENAI_BATCH_WRITE_MAX_ATTEMPTS}): {err}")
+                if attempts == 1:
+                    report["error"] = f"{prefix}{err} → 다음 확인 때 다시 반영"
+                    reports.append(report)
+                continue
+            report["error"] = f"{prefix}{err} → {attempts}회 실패로 포기"
+
+        state["batches"].pop(batch_id, None)
+        _openai_batch_save_state(state)
+        reports.append(report)
+    return reports
+
+
+def _format_openai_batch_report(rep: dict) -> str:
+    msg = f"📦 배치 {rep['id']} ({rep['kind']}) {rep['status']}: 요청 {rep['requests']}건 / 셀 반영 {rep['written']}"
+    if rep["failed"]:
+        msg += f" / 생성·반영 실패 {rep['failed']}"
+    if rep["error"]:
+        msg += f"\n- 오류: {str(rep['error'])[:300]}"
+    return msg
+
+
+async def _openai_batch_poll_job(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue 주기 작업: 완료된 배치를 반영하고 요청자(없으면 관리자)에게 알린다."""
+    if _OPENAI_BATCH_STATE_LOCK.locked():
+        return
+    async with _OPENAI_BATCH_STATE_LOCK:
+        reports = await asyncio.to_thread(_openai_batch_poll_once)
+    for rep in reports:
+        chat_id = rep.get("chat_id") or (ADMIN_IDS[0] if ADMIN_IDS else None)
+        text = _format_openai_batch_report(rep)
+        print(f"[OPENAI][BATCH] {text}")
+        if chat_id is None:
+            continue
+        try:
+            await context.bot.send_message(chat_id=chat_id, text=text)
+        except Exception as e:
+            print(f"[OPENAI][BATCH] 알림 실패: {e}")
+
+
+async def llm_batch(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """/llm_batch : 대기 중인 OpenAI 배치 목록을 보여주고 즉시 한 번 결과를 확인한다."""
+    if not is_admin(update):
+        await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
+        return
+
+    async with _OPENAI_BATCH_STATE_LOCK:
+        reports = await asyncio.to_thread(_openai_batch_poll_once)
+    pending = _openai_batch_load_state()["batches"]
+
+    lines = [_format_openai_batch_report(rep) for rep in reports]
+    if pending:
+        lines.append(f"⏳ 대기 중 배치 {len(pending)}개:")
+        for batch_id, entry in pending.items():
+            lines.append(f"- {batch_id} ({entry.get('kind')}) {len(entry.get('items') or {})}건 / 제출 {entry.get('createdAt')}")
+    if not lines:
+        lines.append("대기 중인 배치가 없습니다.")
+    await update.message.reply_text("\n".join(lines))
+
+
+# ───────────────── Export 댓글 채우기(OpenAI) ─────────────────
+
+async def export_comment_fill(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """기존 export 시트의 comments / deep_comments 컬럼을 채운다.
+
+    사용:
+      /export_comment_fill
+      /export_comment_fill today|tomorrow|all [limit] [force] [simple|deep|both] [batch]
+
+    기본 동작(✅ 요청 반영):
+      - /export_comment_fill (인자 없음) → comments + deep_comments 둘 다 채움(비어있는 것만)
+      - 최신 행(아래쪽)부터 최대 30행(경기) 처리
+
+    옵션:
+      - simple : comments(심플)만
+      - deep   : deep_comments(심층)만
+      - both   : comments + deep_comments
+      - force  : 이미 값이 있어도 덮어쓰기(단, 생성 결과가 비어있으면 덮어쓰지 않음)
+      - batch  : 즉시 생성하지 않고 OpenAI Batch API로 제출(완료 시 자동 반영, /llm_batch 로 확인)
+                 ※ 배치에서는 deep 댓글이 같은 배치의 simple 댓글을 참고하지 못한다(기존 comments만 참고).
+
+    주의:
+      - OpenAI 생성 실패(키/모델/레이트리밋 등) 시, 시트가 비어있는 상태로 남을 수 있음
+      - 이 경우 "생성 실패" 카운트와 마지막 에러를 응답에 포함한다.
     """
     if not is_admin(update):
         await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
@@ -3702,6 +4635,7 @@ async def export_comment_fill(update: Update, context: ContextTypes.DEFAULT_TYPE
     target = "tomorrow"
     limit = 30
     force = False
+    use_batch = False
 
     # mode를 명시하지 않으면 기본은 both(요청사항)
     mode: str | None = None  # simple | deep | both
@@ -3722,6 +4656,9 @@ async def export_comment_fill(update: Update, context: ContextTypes.DEFAULT_TYPE
         if al in ("force", "overwrite"):
             force = True
             continue
+        if al in ("batch", "offline"):
+            use_batch = True
+            continue
         if al in ("simple", "comments", "comment", "sim", "j"):
             mode = "simple"
             continue
@@ -3757,9 +4694,18 @@ async def export_comment_fill(update: Update, context: ContextTypes.DEFAULT_TYPE
     total_write_fail = 0
     last_err = ""
 
+    # batch 모드: 생성 요청을 모아서 한 번에 제출
+    batch_lines: list[dict] = []
+    batch_items: dict[str, dict] = {}
+    batch_model = (_export_comment_model_candidates() or ["gpt-4o-mini"])[0]
+    batch_temperature = _export_comment_temperature()
+    # 이미 제출돼 결과를 기다리는 행은 다시 제출하지 않는다(재실행 시 중복 제출 방지).
+    batch_pending_src_ids = _openai_batch_pending_src_ids() if use_batch else set()
+
     for sheet_name in sheet_names:
         ws = get_export_ws(sheet_name)
         if not ws:
+            _pipeline_job_fail(f"{sheet_name} 시트 없음")
             await update.message.reply_text(f"{sheet_name} 시트를 찾을 수 없습니다.")
             continue
 
@@ -3778,6 +4724,7 @@ async def export_comment_fill(update: Update, context: ContextTypes.DEFAULT_TYPE
         try:
             vals = ws.get_all_values()
         except Exception as e:
+            _pipeline_job_fail(f"{sheet_name} 읽기 실패: {e}")
             await update.message.reply_text(f"{sheet_name} 읽기 실패: {e}")
             continue
 
@@ -3794,6 +4741,7 @@ async def export_comment_fill(update: Update, context: ContextTypes.DEFAULT_TYPE
                 return fallback
 
         i_sport = _idx("sport", 1)
+        i_src = _idx("src_id", 2)
         i_title = _idx("title", 3)
         i_body = _idx("body", 4)
         i_simple = _idx("simple", 6)
@@ -3842,6 +4790,28 @@ async def export_comment_fill(update: Update, context: ContextTypes.DEFAULT_TYPE
             if not (need_simple or need_deep):
                 continue
 
+            if use_batch:
+                srcv = (r[i_src] if len(r) > i_src else "").strip()
+                if not srcv or srcv in batch_pending_src_ids:
+                    continue
+                attempted_rows += 1
+                for kind, need, col_name, kwargs in (
+                    ("simple", need_simple, "comments", {}),
+                    ("deep", need_deep, "deep_comments", {"body_hint": bodyv, "avoid_text": comments_raw}),
+                ):
+                    if not need:
+                        continue
+                    built = _build_export_comment_prompt(base_title, sport_label=sportv, mode=kind, **kwargs)
+                    if built is None:
+                        continue
+                    prompt, system, count = built
+                    cid = f"c{len(batch_lines)}"
+                    batch_lines.append(_openai_batch_request_line(
+                        cid, model=batch_model, system=system, prompt=prompt, temperature=batch_temperature,
+                    ))
+                    batch_items[cid] = {"sheet": sheet_name, "src_id": srcv, "column": col_name, "count": count}
+                continue
+
             attempted_rows += 1
 
             # 생성
@@ -3851,20 +4821,23 @@ async def export_comment_fill(update: Update, context: ContextTypes.DEFAULT_TYPE
             try:
                 if need_simple and need_deep and (not comments_raw) and (not deep_raw):
                     # 둘 다 비어있으면 pair 생성(중복 회피 유도)
-                    new_comments, new_deep = generate_export_comments_pair(
+                    new_comments, new_deep = await _run_llm_in_thread(
+                        generate_export_comments_pair,
                         title=base_title,
                         sport_label=sportv,
                         body_hint=bodyv,
                     )
                 else:
                     if need_simple:
-                        new_comments = generate_export_comments(
+                        new_comments = await _run_llm_in_thread(
+                            generate_export_comments,
                             title=base_title,
                             sport_label=sportv,
                             mode="simple",
                         )
                     if need_deep:
-                        new_deep = generate_export_comments(
+                        new_deep = await _run_llm_in_thread(
+                            generate_export_comments,
                             title=base_title,
                             sport_label=sportv,
                             mode="deep",
@@ -3954,6 +4927,23 @@ async def export_comment_fill(update: Update, context: ContextTypes.DEFAULT_TYPE
         total_gen_fail_deep += gen_fail_deep
         total_write_fail += write_fail
 
+    if use_batch:
+        if not batch_lines:
+            await update.message.reply_text(f"배치로 보낼 댓글 생성 대상이 없습니다. (대상 시트: {', '.join(sheet_names)})")
+            return
+        batch_id = await asyncio.to_thread(
+            submit_openai_batch, "export_comment", batch_lines, batch_items, chat_id=update.effective_chat.id,
+        )
+        if not batch_id:
+            await update.message.reply_text("OpenAI 배치 제출에 실패했습니다. 로그를 확인하세요.")
+            return
+        await update.message.reply_text(
+            f"📦 export 댓글 배치 제출 완료: {batch_id}\n"
+            f"- 대상 시트: {', '.join(sheet_names)} / 행 {total_attempt_rows} / 요청 {len(batch_lines)}건\n"
+            "- 완료되면 자동으로 시트에 반영하고 알려드립니다. (/llm_batch 로 상태 확인)"
+        )
+        return
+
     msg = "✅ export 댓글 채우기 완료\n"
     msg += f"- mode: {mode}\n"
     msg += f"- 대상 시트: {', '.join(sheet_names)}\n"
@@ -4029,6 +5019,100 @@ def _build_export_comment_txt_markup_bv(which: str, limit_matches: int | None =
     ])
 
 
+# TXT 문서 묶음 전송
+# - send_media_group로 최대 10개씩 묶어 보내고, RetryAfter(flood wait)는 지시된 시간만큼 기다린 뒤 같은 묶음을 재시도
+# - flood wait를 만나면 묶음 간 간격을 늘리고, 성공이 이어지면 다시 줄인다.
+EXPORT_COMMENT_TXT_GROUP_SIZE = max(1, min(10, int(os.getenv("EXPORT_COMMENT_TXT_GROUP_SIZE", "10"))))
+EXPORT_COMMENT_TXT_MAX_RETRIES = max(0, int(os.getenv("EXPORT_COMMENT_TXT_MAX_RETRIES", "5")))
+EXPORT_COMMENT_TXT_ZIP_THRESHOLD = max(0, int(os.getenv("EXPORT_COMMENT_TXT_ZIP_THRESHOLD", "60")))  # 0이면 ZIP 전환 안 함
+
+
+def _retry_after_sec(e: RetryAfter) -> float:
+    ra = getattr(e, "retry_after", 1)
+    try:
+        return float(ra.total_seconds())  # 일부 버전은 timedelta
+    except AttributeError:
+        return float(ra or 1)
+
+
+async def _send_documents_one_by_one(
+    context: ContextTypes.DEFAULT_TYPE,
+    chat_id: int,
+    docs: list[tuple[str, bytes]],
+    *,
+    log_tag: str = "[EXPORT][TXT]",
+) -> int:
+    """묶음 전송이 실패했을 때의 폴백: send_document 로 한 개씩 보내고 성공한 수만 센다."""
+    sent = 0
+    for fname, data in docs:
+        attempt = 0
+        while True:
+            try:
+                await context.bot.send_document(chat_id=chat_id, document=InputFile(io.BytesIO(data), filename=fname))
+                sent += 1
+                break
+            except RetryAfter as e:
+                attempt += 1
+                if attempt > EXPORT_COMMENT_TXT_MAX_RETRIES:
+                    print(f"{log_tag} flood wait 재시도 초과 → {fname} 건너뜀")
+                    break
+                await asyncio.sleep(_retry_after_sec(e) + 0.5)
+            except Exception as e:
+                print(f"{log_tag} 개별 전송 실패({fname}): {e}")
+                break
+    return sent
+
+
+async def _send_documents_bulk(
+    context: ContextTypes.DEFAULT_TYPE,
+    chat_id: int,
+    docs: list[tuple[str, bytes]],
+    *,
+    base_delay: float = 0.0,
+    log_tag: str = "[EXPORT][TXT]",
+) -> int:
+    """(파일명, 내용) 목록을 묶음 전송하고 전송 성공한 파일 수를 반환."""
+    group_size = EXPORT_COMMENT_TXT_GROUP_SIZE
+    delay = max(0.0, base_delay)
+    sent = 0
+
+    for start in range(0, len(docs), group_size):
+        chunk = docs[start:start + group_size]
+        attempt = 0
+        while True:
+            try:
+                if len(chunk) == 1:
+                    fname, data = chunk[0]
+                    await context.bot.send_document(chat_id=chat_id, document=InputFile(io.BytesIO(data), filename=fname))
+                else:
+                    # media group은 2~10개. 요청마다 새 BytesIO를 만든다(재시도 시 스트림 위치 문제 방지).
+                    media = [InputMediaDocument(media=io.BytesIO(data), filename=fname) for fname, data in chunk]
+                    await context.bot.send_media_group(chat_id=chat_id, media=media)
+                sent += len(chunk)
+                # 성공이 이어지면 간격을 원래 값 쪽으로 줄인다.
+                delay = max(base_delay, delay * 0.7)
+                break
+            except RetryAfter as e:
+                wait = _retry_after_sec(e)
+                attempt += 1
+                if attempt > EXPORT_COMMENT_TXT_MAX_RETRIES:
+                    print(f"{log_tag} flood wait 재시도 초과 → {len(chunk)}개 건너뜀")
+                    break
+                delay = min(10.0, max(delay * 2, 1.0))
+                print(f"{log_tag} RetryAfter {wait:.0f}s (재시도 {attempt}/{EXPORT_COMMENT_TXT_MAX_RETRIES}, 간격 {delay:.1f}s)")
+                await asyncio.sleep(wait + 0.5)
+            except Exception as e:
+                # TimedOut/NetworkError 등: 묶음 전체를 버리지 않고 한 개씩 다시 보낸다.
+                print(f"{log_tag} 묶음 전송 실패({chunk[0][0]} 외 {len(chunk) - 1}개): {e} → 개별 전송")
+                sent += await _send_documents_one_by_one(context, chat_id, chunk, log_tag=log_tag)
+                break
+
+        if delay > 0 and start + group_size < len(docs):
+            await asyncio.sleep(delay)
+
+    return sent
+
+
 async def _send_export_comment_txt_files(
     chat_id: int,
     context: ContextTypes.DEFAULT_TYPE,
@@ -4097,40 +5181,38 @@ async def _send_export_comment_txt_files(
         await context.bot.send_message(chat_id=chat_id, text=msg)
         return 0, 0
 
-    total_files = 0
     total_matches = len(selected)
 
-    # 너무 많이 보내면 운영이 힘들어서 제한
+    # 파일이 많으면 낱개 전송 대신 ZIP 1개로 보낸다.
     est_files = sum(len(x[2]) for x in selected)
+    if EXPORT_COMMENT_TXT_ZIP_THRESHOLD and est_files > EXPORT_COMMENT_TXT_ZIP_THRESHOLD:
+        await context.bot.send_message(
+            chat_id=chat_id,
+            text=f"댓글 파일이 {est_files}개라 ZIP 1개로 묶어서 보낼게.",
+        )
+        files_cnt, matches_cnt, _ = await _send_export_comment_zip_file(
+            chat_id, context, which, limit_matches, sport_filter=sport_filter, mode="simple",
+        )
+        return files_cnt, matches_cnt
+
+    # 너무 많이 보내면 운영이 힘들어서 제한
     if est_files > max_files:
         await context.bot.send_message(
             chat_id=chat_id,
             text=f"댓글 파일이 너무 많아서 {max_files}개까지만 보낼게. (예상 {est_files}개)",
         )
 
+    docs: list[tuple[str, bytes]] = []
     for (sid, title, lines_) in selected:
         for idx, text in enumerate(lines_, start=1):
-            if total_files >= max_files:
+            if len(docs) >= max_files:
                 break
             # 파일명(너무 길면 문제되니 src_id 위주)
             safe_sid = re.sub(r"[^0-9A-Za-z_\-]+", "_", sid) or "comment"
-            filename = f"{safe_sid}_{idx:02d}.txt"
-
-            bio = io.BytesIO(text.encode("utf-8"))
-            doc = InputFile(bio, filename=filename)
-            try:
-                await context.bot.send_document(chat_id=chat_id, document=doc)
-                total_files += 1
-            except Exception as e:
-                print(f"[EXPORT][TXT] send_document 실패({filename}): {e}")
-                continue
-
-            # 텔레그램 rate-limit 완화
-            if delay > 0:
-                await asyncio.sleep(delay)
+            docs.append((f"{safe_sid}_{idx:02d}.txt", text.encode("utf-8")))
 
-        if total_files >= max_files:
-            break
+    # 텔레그램 rate-limit 완화: 묶음(최대 10개) 단위 전송 + RetryAfter 대응
+    total_files = await _send_documents_bulk(context, chat_id, docs, base_delay=delay)
 
     return total_files, total_matches
 
@@ -4817,14 +5899,23 @@ async def _analysis_clean_by_sports(
         await update.message.reply_text(f"tomorrow 시트를 열지 못했습니다: {e}")
         return
 
+    # 헤더 + sport 열만 읽는다. 삭제는 해당 행 구간만 deleteDimension(아래→위)으로 처리해
+    # 남는 행은 다시 쓰지 않고, 그 사이 크롤링 append로 붙은 행도 잃지 않는다.
     try:
-        rows = ws.get_all_values()
+        resp = await _gsheet_call_with_backoff(
+            "analysis_clean.read",
+            sh.values_batch_get,
+            [f"'{ws.title}'!1:1", f"'{ws.title}'!A:A"],
+        )
+        vrs = (resp or {}).get("valueRanges") or []
+        header_vals = (vrs[0].get("values") if len(vrs) > 0 else None) or []
+        sport_col = (vrs[1].get("values") if len(vrs) > 1 else None) or []
     except Exception as e:
         await update.message.reply_text(f"시트 읽기 오류: {e}")
         return
 
     # 데이터가 아예 없으면 헤더만 복구
-    if not rows:
+    if not header_vals and not sport_col:
         header = ["sport", "id", "title", "summary"]
         try:
             ws.clear()
@@ -4836,8 +5927,7 @@ async def _analysis_clean_by_sports(
         await update.message.reply_text(f"tomorrow 시트를 초기화했습니다. ({label})")
         return
 
-    header = rows[0]
-    data_rows = rows[1:]
+    header = header_vals[0] if header_vals else []
 
     # sport 컬럼 인덱스 찾기 (기본은 0)
     try:
@@ -4845,27 +5935,47 @@ async def _analysis_clean_by_sports(
     except ValueError:
         idx_sport = 0
 
-    kept_rows = [header]
+    requests: list[dict] = []
     deleted_count = 0
 
+    grid_rows = int(ws.row_count or 0)
     if sports_to_clear is None:
-        # 전체 삭제 (헤더만 남김)
-        deleted_count = len(data_rows)
+        # 전체 삭제 (헤더만 남김): 2행~끝 값만 비운다(_gsheet_rollover_requests 와 같은 방식).
+        # 행을 지우면 1행이 고정된 시트에서 "고정되지 않은 행을 모두 삭제할 수 없음" 오류가 난다.
+        deleted_count = max(0, len(sport_col) - 1)
+        if grid_rows > 1:
+            requests.append({"updateCells": {"range": {"sheetId": ws.id, "startRowIndex": 1}, "fields": "userEnteredValue"}})
     else:
-        # 해당 종목만 제외하고 유지
-        for row in data_rows:
-            sport_val = row[idx_sport] if len(row) > idx_sport else ""
-            if sport_val in sports_to_clear:
-                deleted_count += 1
-                continue
-            kept_rows.append(row)
+        if idx_sport != 0:
+            letter = _col_letter(idx_sport + 1)
+            try:
+                sport_col = await _gsheet_call_with_backoff(
+                    "analysis_clean.read_sport", ws.get, f"{letter}:{letter}"
+                ) or []
+            except Exception as e:
+                await update.message.reply_text(f"시트 읽기 오류: {e}")
+                return
 
-    try:
-        ws.clear()
-        ws.update(range_name="A1", values=kept_rows)
-    except Exception as e:
-        await update.message.reply_text(f"시트 쓰기 오류: {e}")
-        return
+        # 해당 종목 행만 삭제 대상으로 표시 → 연속 구간으로 묶는다
+        flags = [bool(r) and r[0] in sports_to_clear for r in list(sport_col)[1:]]
+        deleted_count = sum(flags)
+        runs = _gsheet_row_runs(flags, offset=1)
+        if runs and deleted_count >= grid_rows - 1:
+            # 헤더 아래가 전부 지울 대상이면 빈 행을 먼저 붙여 고정 행 삭제 오류를 피한다.
+            requests.append({"appendDimension": {"sheetId": ws.id, "dimension": "ROWS", "length": deleted_count}})
+        for a, b in sorted(runs, reverse=True):
+            requests.append({
+                "deleteDimension": {
+                    "range": {"sheetId": ws.id, "dimension": "ROWS", "startIndex": a, "endIndex": b}
+                }
+            })
+
+    if requests:
+        try:
+            await _gsheet_call_with_backoff("analysis_clean.batch_update", sh.batch_update, {"requests": requests})
+        except Exception as e:
+            await update.message.reply_text(f"시트 쓰기 오류: {e}")
+            return
 
     reload_analysis_from_sheet()
 
@@ -4959,63 +6069,200 @@ async def analysisclean(update: Update, context: ContextTypes.DEFAULT_TYPE):
         label="전체 분석",
     )
 
-# 🔹 4) /rollover – 내일 분석 → 오늘 분석으로 복사
-async def rollover(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not is_admin(update):
-        await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
-        return
-
-    client = get_gs_client()
-    spreadsheet_id = os.getenv("SPREADSHEET_ID")
-
-    if client and spreadsheet_id:
-        try:
-            sh = client.open_by_key(spreadsheet_id)
+# 🔹 롤오버 엔진: 시트 간 이동을 spreadsheets.batchUpdate 1회로 서버에서 처리
+# - 데이터가 봇을 거치지 않고(copyPaste), batchUpdate는 요청 전체가 함께 적용/실패하므로
+#   중간에 끊겨 today만 비워지는 상태가 생기지 않는다.
+def _gsheet_rollover_requests(
+    src_ws,
+    dst_ws,
+    *,
+    runs: list[tuple[int, int]],
+    dst_start_row: int = 0,
+    header: list[str] | None = None,
+) -> list[dict]:
+    """src → dst 롤오버 batchUpdate 요청 목록.
+
+    - runs: 옮길 원본 행 구간 [(start, end)] (0-based, end 미포함). dst_start_row부터 빈틈없이 붙인다.
+    - dst는 값만 전부 비운 뒤 붙이고(서식 유지), src는 2행부터 값만 비운다(헤더 유지).
+    - header를 주면 두 탭의 1행을 그 헤더로 다시 쓴다.
+    """
+    src_id, dst_id = src_ws.id, dst_ws.id
+    cols = max(int(src_ws.col_count or 0), len(header or []), 1)
+    need_rows = dst_start_row + sum(max(0, b - a) for a, b in runs)
+
+    requests: list[dict] = []
+    grid: dict[str, int] = {}
+    if int(dst_ws.row_count or 0) < need_rows:
+        grid["rowCount"] = need_rows
+    if int(dst_ws.col_count or 0) < cols:
+        grid["columnCount"] = cols
+    if grid:
+        requests.append({
+            "updateSheetProperties": {
+                "properties": {"sheetId": dst_id, "gridProperties": grid},
+                "fields": ",".join(f"gridProperties.{k}" for k in grid),
+            }
+        })
 
-            sheet_today_name = os.getenv("SHEET_TODAY_NAME", "today")
-            sheet_tomorrow_name = os.getenv("SHEET_TOMORROW_NAME", "tomorrow")
+    requests.append({"updateCells": {"range": {"sheetId": dst_id, "startRowIndex": 0}, "fields": "userEnteredValue"}})
 
-            ws_today = sh.worksheet(sheet_today_name)
-            ws_tomorrow = sh.worksheet(sheet_tomorrow_name)
+    cur = dst_start_row
+    for a, b in runs:
+        if b <= a:
+            continue
+        requests.append({
+            "copyPaste": {
+                "source": {"sheetId": src_id, "startRowIndex": a, "endRowIndex": b, "startColumnIndex": 0, "endColumnIndex": cols},
+                "destination": {"sheetId": dst_id, "startRowIndex": cur, "endRowIndex": cur + (b - a), "startColumnIndex": 0, "endColumnIndex": cols},
+                "pasteType": "PASTE_VALUES",
+            }
+        })
+        cur += b - a
 
-            rows = ws_tomorrow.get_all_values()
+    if header:
+        header_rows = [{"values": [{"userEnteredValue": {"stringValue": str(h)}} for h in header]}]
+        for sid in (dst_id, src_id):
+            requests.append({
+                "updateCells": {
+                    "start": {"sheetId": sid, "rowIndex": 0, "columnIndex": 0},
+                    "rows": header_rows,
+                    "fields": "userEnteredValue",
+                }
+            })
 
-            if rows:
-                ws_today.clear()
-                ws_today.update(range_name="A1", values=rows)
+    requests.append({"updateCells": {"range": {"sheetId": src_id, "startRowIndex": 1}, "fields": "userEnteredValue"}})
+    return requests
 
-                header = rows[0]
-                ws_tomorrow.clear()
-                ws_tomorrow.update(range_name="A1", values=[header])
-            else:
-                print("[GSHEET] tomorrow 탭에 데이터가 없어 시트 롤오버는 생략합니다.")
 
-        except Exception as e:
-            print(f"[GSHEET] 롤오버 중 시트 복사 실패: {e}")
+def _gsheet_row_runs(flags: list[bool], *, offset: int = 0) -> list[tuple[int, int]]:
+    """[True, True, False, True] → [(0, 2), (3, 4)] (offset만큼 밀어서)."""
+    runs: list[tuple[int, int]] = []
+    start = None
+    for i, ok in enumerate(flags):
+        if ok and start is None:
+            start = i
+        elif not ok and start is not None:
+            runs.append((offset + start, offset + i))
+            start = None
+    if start is not None:
+        runs.append((offset + start, offset + len(flags)))
+    return runs
 
-    else:
-        print("[GSHEET] 클라이언트 또는 SPREADSHEET_ID 없음 → 시트 롤오버는 건너뜀.")
 
-    reload_analysis_from_sheet()
+def _rollover_dry_run_arg(context) -> bool:
+    return any(str(a or "").strip().lower() in ("dry", "dryrun", "dry-run", "--dry-run", "미리보기") for a in (context.args or []))
 
-    await update.message.reply_text(
-        "✅ 롤오버 완료!\n"
-        "구글시트 'tomorrow' 탭 내용을 'today' 탭으로 복사했고,\n"
-        "'tomorrow' 탭은 헤더만 남기고 초기화했어.\n\n"
-        "이제 오늘 경기 분석은 'today' 탭에서, 내일 경기는 'tomorrow' 탭에서 작성하면 돼."
-    )
 
+def _analysis_catalog_flip(new_today: dict[str, list[dict]]) -> None:
+    """시트 롤오버 직후 메모리 카탈로그를 한 번에 교체: today ← new_today(롤오버 후 시트에서 읽은 값), tomorrow ← 빈 값.
 
-def simple_summarize(text: str, max_chars: int = 400) -> str:
-    """
-    아주 단순 요약: 문장 사이 공백 정리 후,
-    max_chars 안쪽에서 '다.' 기준으로 잘라서 반환.
-    (Gemini 오류 시 fallback 용)
+    새 dict를 다 만든 뒤 전역 3개를 한 블록에서 바꿔, 조회 핸들러가 섞인 상태를 보지 않게 한다.
     """
-    if not text:
-        return ""
+    global ANALYSIS_TODAY, ANALYSIS_TOMORROW, ANALYSIS_DATA_MAP
+    new_tomorrow: dict[str, list[dict]] = {}
+    ANALYSIS_TODAY, ANALYSIS_TOMORROW, ANALYSIS_DATA_MAP = (
+        new_today,
+        new_tomorrow,
+        {"today": new_today, "tomorrow": new_tomorrow},
+    )
 
-    text = re.sub(r"\s+", " ", text).strip()
+
+# 🔹 4) /rollover – 내일 분석 → 오늘 분석으로 복사
+async def rollover(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """/rollover [dry] : tomorrow 탭 → today 탭 (서버측 복사). dry면 행 수만 보고."""
+    if not is_admin(update):
+        await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
+        return
+
+    dry_run = _rollover_dry_run_arg(context)
+    client = get_gs_client()
+    spreadsheet_id = os.getenv("SPREADSHEET_ID")
+
+    if not (client and spreadsheet_id):
+        print("[GSHEET] 클라이언트 또는 SPREADSHEET_ID 없음 → 시트 롤오버는 건너뜀.")
+        if dry_run:
+            await update.message.reply_text("구글시트 설정이 없어 미리보기를 할 수 없습니다.")
+            return
+        reload_analysis_from_sheet()
+        await update.message.reply_text("구글시트 설정이 없어 시트 롤오버는 건너뛰고 데이터만 다시 불러왔습니다.")
+        return
+
+    sheet_today_name = os.getenv("SHEET_TODAY_NAME", "today")
+    sheet_tomorrow_name = os.getenv("SHEET_TOMORROW_NAME", "tomorrow")
+
+    try:
+        sh = client.open_by_key(spreadsheet_id)
+        ws_today = sh.worksheet(sheet_today_name)
+        ws_tomorrow = sh.worksheet(sheet_tomorrow_name)
+
+        # 행 수 확인은 A열만 (두 탭 1회 호출)
+        resp = await _gsheet_call_with_backoff(
+            "rollover.count",
+            sh.values_batch_get,
+            [f"'{sheet_tomorrow_name}'!A:A", f"'{sheet_today_name}'!A:A"],
+        )
+        vrs = (resp or {}).get("valueRanges") or []
+        col_tomo = (vrs[0].get("values") if len(vrs) > 0 else None) or []
+        col_today = (vrs[1].get("values") if len(vrs) > 1 else None) or []
+        tomo_rows = sum(1 for r in col_tomo[1:] if r and str(r[0]).strip())
+        today_rows = sum(1 for r in col_today[1:] if r and str(r[0]).strip())
+    except Exception as e:
+        print(f"[GSHEET] 롤오버 준비 실패: {e}")
+        await update.message.reply_text(f"롤오버 준비 중 오류: {e}")
+        return
+
+    if dry_run:
+        await update.message.reply_text(
+            "🔎 롤오버 미리보기 (변경 없음)\n"
+            f"- '{sheet_tomorrow_name}' 데이터 {tomo_rows}행 → '{sheet_today_name}'로 이동\n"
+            f"- '{sheet_today_name}' 기존 {today_rows}행은 덮어써짐\n"
+            f"- 이동 후 '{sheet_tomorrow_name}'은 헤더만 남음"
+        )
+        return
+
+    if not col_tomo:
+        print("[GSHEET] tomorrow 탭에 데이터가 없어 시트 롤오버는 생략합니다.")
+        await update.message.reply_text(f"'{sheet_tomorrow_name}' 탭에 데이터가 없어 롤오버를 건너뜁니다.")
+        return
+
+    try:
+        requests = _gsheet_rollover_requests(
+            ws_tomorrow,
+            ws_today,
+            runs=[(0, int(ws_tomorrow.row_count or len(col_tomo)))],
+        )
+        await _gsheet_call_with_backoff("rollover.batch_update", sh.batch_update, {"requests": requests})
+    except Exception as e:
+        print(f"[GSHEET] 롤오버 중 시트 복사 실패: {e}")
+        await update.message.reply_text(f"롤오버 중 오류(시트는 변경되지 않음): {e}")
+        return
+
+    # 직원이 시트를 직접 고친 내용까지 반영되도록 today는 롤오버 후 시트에서 한 번 읽어 교체
+    try:
+        new_today = await asyncio.to_thread(_load_analysis_sheet, sh, sheet_today_name)
+    except Exception as e:
+        print(f"[GSHEET] 롤오버 후 today 탭 읽기 실패 → 메모리의 tomorrow로 대체: {e}")
+        new_today = ANALYSIS_TOMORROW
+    _analysis_catalog_flip(new_today)
+
+    await update.message.reply_text(
+        "✅ 롤오버 완료!\n"
+        f"구글시트 'tomorrow' 탭 내용({tomo_rows}행)을 'today' 탭으로 복사했고,\n"
+        "'tomorrow' 탭은 헤더만 남기고 초기화했어.\n\n"
+        "이제 오늘 경기 분석은 'today' 탭에서, 내일 경기는 'tomorrow' 탭에서 작성하면 돼."
+    )
+
+
+def simple_summarize(text: str, max_chars: int = 400) -> str:
+    """
+    아주 단순 요약: 문장 사이 공백 정리 후,
+    max_chars 안쪽에서 '다.' 기준으로 잘라서 반환.
+    (Gemini 오류 시 fallback 용)
+    """
+    if not text:
+        return ""
+
+    text = re.sub(r"\s+", " ", text).strip()
 
     if len(text) <= max_chars:
         return text
@@ -5044,13 +6291,265 @@ def get_openai_client():
         return None
 
     try:
-        _openai_client = OpenAI(api_key=api_key)
+        _openai_client = OpenAI(api_key=api_key, max_retries=0)  # 재시도는 LLM 게이트웨이에서 처리
         print("[OPENAI] OpenAI 클라이언트 초기화 완료")
     except Exception as e:
         print(f"[OPENAI] 클라이언트 초기화 실패: {e}")
         _openai_client = None
     return _openai_client
 
+# ───────────────── LLM 게이트웨이 (모델 라우팅 / 모델별 동시성 / 재시도 / 토큰 집계) ─────────────────
+# 모든 텍스트 생성 호출은 llm_chat()/llm_responses()를 거친다.
+# - 모델 라우팅: LLM_MODEL_ROUTES="site_rewrite=gpt-4.1,news_long=gpt-4.1-mini" (호출 지점 → 모델)
+# - 모델별 동시성: LLM_MODEL_CONCURRENCY(기본) + LLM_MODEL_CONCURRENCY_MAP="gpt-4o=2,gpt-4.1-mini=6"
+# - 429/5xx/타임아웃/연결오류는 지수 백오프 재시도, 요청 전체는 LLM_DEADLINE_SEC 안에서 끝낸다.
+# - 호출 지점별 호출수/실패/재시도/프롬프트·완성 토큰/소요시간을 _LLM_USAGE에 누적(/llm_stats)
+
+LLM_MAX_RETRIES = max(0, int(os.getenv("LLM_MAX_RETRIES", "4")))
+LLM_BACKOFF_BASE_SEC = float(os.getenv("LLM_BACKOFF_BASE_SEC", "1.5"))
+LLM_BACKOFF_MAX_SEC = float(os.getenv("LLM_BACKOFF_MAX_SEC", "30"))
+LLM_DEADLINE_SEC = float(os.getenv("LLM_DEADLINE_SEC", "120"))
+LLM_MODEL_CONCURRENCY = max(1, int(os.getenv("LLM_MODEL_CONCURRENCY") or os.getenv("PIPELINE_LLM_CONCURRENCY") or "4"))
+
+
+def _parse_kv_env(raw: str) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for part in (raw or "").split(","):
+        if "=" not in part:
+            continue
+        k, v = part.split("=", 1)
+        k, v = k.strip(), v.strip()
+        if k and v:
+            out[k] = v
+    return out
+
+
+LLM_MODEL_ROUTES = _parse_kv_env(os.getenv("LLM_MODEL_ROUTES", ""))
+LLM_MODEL_CONCURRENCY_MAP = {
+    k: max(1, int(v)) for k, v in _parse_kv_env(os.getenv("LLM_MODEL_CONCURRENCY_MAP", "")).items() if v.isdigit()
+}
+
+_LLM_MODEL_SEMAPHORES: dict[str, threading.BoundedSemaphore] = {}
+_LLM_USAGE: dict[str, dict] = {}
+_LLM_LOCK = threading.Lock()
+
+
+class LLMError(Exception):
+    """게이트웨이 호출 실패(클라이언트 없음/재시도 소진/데드라인 초과/빈 응답)."""
+
+
+def _llm_route_model(call_site: str, model: str) -> str:
+    return (LLM_MODEL_ROUTES.get(call_site) or model or "gpt-4.1-mini").strip()
+
+
+def _llm_model_semaphore(model: str) -> threading.BoundedSemaphore:
+    with _LLM_LOCK:
+        sem = _LLM_MODEL_SEMAPHORES.get(model)
+        if sem is None:
+            sem = threading.BoundedSemaphore(LLM_MODEL_CONCURRENCY_MAP.get(model, LLM_MODEL_CONCURRENCY))
+            _LLM_MODEL_SEMAPHORES[model] = sem
+        return sem
+
+
+def _llm_is_retryable(exc: Exception) -> bool:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    return type(exc).__name__ in ("APITimeoutError", "APIConnectionError", "RateLimitError", "InternalServerError")
+
+
+def _llm_usage_tokens(resp) -> tuple[int, int]:
+    usage = getattr(resp, "usage", None)
+    if usage is None:
+        return 0, 0
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    if prompt_tokens is None:
+        prompt_tokens = getattr(usage, "input_tokens", 0)
+    completion_tokens = getattr(usage, "completion_tokens", None)
+    if completion_tokens is None:
+        completion_tokens = getattr(usage, "output_tokens", 0)
+    return int(prompt_tokens or 0), int(completion_tokens or 0)
+
+
+def _llm_record(call_site: str, model: str, *, ok: bool, retries: int, resp=None, latency: float = 0.0) -> None:
+    prompt_tokens, completion_tokens = _llm_usage_tokens(resp)
+    with _LLM_LOCK:
+        st = _LLM_USAGE.setdefault(call_site, {
+            "calls": 0, "ok": 0, "fail": 0, "retries": 0,
+            "prompt_tokens": 0, "completion_tokens": 0, "latency_sec": 0.0, "models": {},
+        })
+        st["calls"] += 1
+        st["ok" if ok else "fail"] += 1
+        st["retries"] += retries
+        st["prompt_tokens"] += prompt_tokens
+        st["completion_tokens"] += completion_tokens
+        st["latency_sec"] += latency
+        st["models"][model] = st["models"].get(model, 0) + 1
+    span_record(f"llm.{call_site}", latency, ok=ok, retries=retries)
+
+
+def _llm_call(call_site: str, model: str, do_request, *, deadline_sec: float | None = None):
+    """do_request(client, timeout) 를 모델 슬롯 안에서 재시도/데드라인과 함께 실행하고 응답 객체를 돌려준다."""
+    client = get_openai_client()
+    if not client:
+        raise LLMError("OPENAI_API_KEY 미설정 또는 클라이언트 초기화 실패")
+
+    deadline = time.monotonic() + float(deadline_sec or LLM_DEADLINE_SEC)
+    sem = _llm_model_semaphore(model)
+    t0 = time.perf_counter()
+    retries = 0
+    last_exc: Exception | None = None
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        if not sem.acquire(timeout=remaining):
+            last_exc = LLMError(f"모델 슬롯 대기 중 데드라인 초과({model})")
+            break
+        try:
+            resp = do_request(client, max(1.0, deadline - time.monotonic()))
+            _llm_record(call_site, model, ok=True, retries=retries, resp=resp, latency=time.perf_counter() - t0)
+            return resp
+        except Exception as e:
+            last_exc = e
+            if not _llm_is_retryable(e) or retries >= LLM_MAX_RETRIES:
+                break
+        finally:
+            sem.release()
+
+        delay = min(LLM_BACKOFF_MAX_SEC, LLM_BACKOFF_BASE_SEC * (2 ** retries)) * (0.7 + 0.6 * _random.random())
+        if time.monotonic() + delay >= deadline:
+            break
+        retries += 1
+        print(f"[LLM][RETRY] site={call_site} model={model} attempt={retries} wait={delay:.1f}s err={last_exc}")
+        time.sleep(delay)
+
+    _llm_record(call_site, model, ok=False, retries=retries, latency=time.perf_counter() - t0)
+    if isinstance(last_exc, LLMError):
+        raise last_exc
+    raise LLMError(f"{call_site}/{model} 실패: {last_exc or '데드라인 초과'}") from last_exc
+
+
+def llm_chat(
+    call_site: str,
+    *,
+    model: str,
+    system: str,
+    prompt: str,
+    temperature: float | None = None,
+    max_completion_tokens: int | None = None,
+    deadline_sec: float | None = None,
+) -> str:
+    """Chat Completions 호출(게이트웨이 경유). 빈 응답이면 LLMError."""
+    model = _llm_route_model(call_site, model)
+    kwargs: dict = {}
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+    if max_completion_tokens:
+        kwargs["max_completion_tokens"] = int(max_completion_tokens)
+
+    def _req(client, timeout):
+        return client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system or ""},
+                {"role": "user", "content": prompt or ""},
+            ],
+            timeout=timeout,
+            **kwargs,
+        )
+
+    resp = _llm_call(call_site, model, _req, deadline_sec=deadline_sec)
+    text = (resp.choices[0].message.content or "").strip()
+    if not text:
+        raise LLMError(f"empty response ({call_site})")
+    return text
+
+
+def llm_responses(
+    call_site: str,
+    *,
+    model: str,
+    input_text: str,
+    temperature: float | None = None,
+    deadline_sec: float | None = None,
+) -> str:
+    """Responses API 호출(게이트웨이 경유). 빈 응답이면 LLMError."""
+    model = _llm_route_model(call_site, model)
+
+    def _req(client, timeout):
+        if not (hasattr(client, "responses") and hasattr(client.responses, "create")):
+            raise LLMError("Responses API 미지원 SDK")
+        kwargs: dict = {"model": model, "input": input_text, "timeout": timeout}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        return client.responses.create(**kwargs)
+
+    resp = _llm_call(call_site, model, _req, deadline_sec=deadline_sec)
+    text = _extract_text_from_responses_obj(resp)
+    if not text:
+        raise LLMError(f"empty response ({call_site})")
+    return text
+
+
+def llm_usage_snapshot() -> dict[str, dict]:
+    with _LLM_LOCK:
+        return {k: {**v, "models": dict(v["models"])} for k, v in _LLM_USAGE.items()}
+
+
+async def llm_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """/llm_stats [reset] : 호출 지점별 LLM 호출/재시도/토큰 사용량."""
+    if not is_admin(update):
+        await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
+        return
+
+    snap = llm_usage_snapshot()
+    if context.args and (context.args[0] or "").strip().lower() == "reset":
+        with _LLM_LOCK:
+            _LLM_USAGE.clear()
+
+    if not snap:
+        await update.message.reply_text("아직 기록된 LLM 호출이 없습니다.")
+        return
+
+    lines = ["🤖 LLM 사용량 (프로세스 시작 이후)"]
+    total_in = total_out = 0
+    for site, st in sorted(snap.items(), key=lambda kv: -(kv[1]["prompt_tokens"] + kv[1]["completion_tokens"])):
+        avg = st["latency_sec"] / st["calls"] if st["calls"] else 0.0
+        models = ", ".join(f"{m}×{n}" for m, n in st["models"].items())
+        lines.append(
+            f"- {site}: 호출 {st['calls']} (실패 {st['fail']}, 재시도 {st['retries']}) / "
+            f"토큰 in {st['prompt_tokens']:,} out {st['completion_tokens']:,} / 평균 {avg:.1f}s / {models}"
+        )
+        total_in += st["prompt_tokens"]
+        total_out += st["completion_tokens"]
+    lines.append(f"합계 토큰: in {total_in:,} / out {total_out:,}")
+    await update.message.reply_text("\n".join(lines))
+
+
+async def timing_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """/timing [reset] : 단계별(maz/LLM/시트/네이버) 누적 소요 시간·바이트·재시도·HTTP 상태."""
+    if not is_admin(update):
+        await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
+        return
+
+    snap = span_totals_snapshot()
+    if context.args and (context.args[0] or "").strip().lower() == "reset":
+        with _SPAN_LOCK:
+            _SPAN_TOTALS.clear()
+
+    if not snap:
+        await update.message.reply_text("아직 기록된 단계 계측이 없습니다.")
+        return
+
+    lines = ["⏱ 단계별 누적 소요 (프로세스 시작 이후)"]
+    lines.extend(format_span_stats(snap))
+    await update.message.reply_text("\n".join(lines)[:4000])
+
+
 # 🔹 mazgtv 홍보 문구/해시태그 공통 제거용 패턴
 MAZ_REMOVE_PATTERNS = [
     # 기본 홍보 문구
@@ -5292,24 +6791,17 @@ def summarize_analysis_with_gemini(
 """.strip()
 
     try:
-        resp = client_oa.chat.completions.create(
+        text_out = llm_chat(
+            "analysis_summary",
             model=os.getenv("OPENAI_MODEL_ANALYSIS", "gpt-4.1-mini"),
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "너는 축구 경기 분석을 요약해서 정리하는 한국어 전문가다. "
-                        "문장은 간결하고 직설적으로 쓰고, 형식을 반드시 지킨다."
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ],
+            system=(
+                "너는 축구 경기 분석을 요약해서 정리하는 한국어 전문가다. "
+                "문장은 간결하고 직설적으로 쓰고, 형식을 반드시 지킨다."
+            ),
+            prompt=prompt,
             temperature=0.4,
             max_completion_tokens=700,
         )
-        text_out = (resp.choices[0].message.content or "").strip()
-        if not text_out:
-            raise ValueError("empty response from OpenAI (analysis)")
 
         # 제목 / 요약 분리
         m_title = re.search(r"제목\s*[:：]\s*(.+)", text_out)
@@ -5344,30 +6836,20 @@ def summarize_analysis_with_gemini(
         )
         return (base_title or "[경기 분석]", body)
         
-def rewrite_for_site_openai(
+def _build_site_rewrite_request(
     full_text: str,
     *,
     league: str = "",
     home_team: str = "",
     away_team: str = "",
-    max_chars: int = 3500,
-) -> tuple[str, str]:
-    """
-    사이트 게시용: '원문 기반 재작성' 전용.
-
-    ✅ 목표
-    - 원문을 그대로 복붙하지 않고, 구조화된 서술형(팀 분석/경기 흐름/핵심 포인트/최종 픽)으로 재작성
-    - 원문 사실(부상/전술/기록/선수 등)에서 벗어나는 임의 생성 금지
-    - 매치업 표기에서 'vs/VS/대' 같은 구분자 사용 금지(팀명 공백 연결)
+) -> dict | None:
+    """사이트 게시용 재작성 요청(프롬프트/모델/제목/footer)을 만든다. 원문이 비면 None.
 
-    ⚠️ 금지
-    - '고트티비', 'GOATTV', 'goat-tv' 등 특정 사이트/브랜드명 언급 금지
+    실시간 재작성(rewrite_for_site_openai)과 Batch API 백필이 같이 쓴다.
     """
-    client_oa = get_openai_client()
-
     full_text_clean = clean_maz_text(full_text or "").strip()
     if not full_text_clean:
-        return ("[분석글 없음]", "")
+        return None
 
     # 너무 길면 잘라서 토큰 폭주 방지
     if len(full_text_clean) > 9000:
@@ -5380,13 +6862,6 @@ def rewrite_for_site_openai(
     else:
         base_title = f"[{_league}] 스포츠분석"
 
-    # OpenAI 키 없으면 최소 폴백(=원문 기반 요약)만 반환
-    if not client_oa:
-        body_fb = simple_summarize(full_text_clean, max_chars=max_chars)
-        # 안전장치: 브랜드/구분자 제거
-        body_fb = _postprocess_site_body_text(body_fb)
-        return (base_title, body_fb)
-
     home_label = (home_team or "").strip() or "홈팀"
     away_label = (away_team or "").strip() or "원정팀"
 
@@ -5455,47 +6930,97 @@ def rewrite_for_site_openai(
     if footer_line:
         prompt += "\n\n마지막 줄에 다음 문장을 그대로 1회만 추가하라:\n" + footer_line.strip()
 
-    try:
-        resp = client_oa.chat.completions.create(
-            model=os.getenv("OPENAI_MODEL_SITE", os.getenv("OPENAI_MODEL_ANALYSIS", "gpt-4.1-mini")),
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "너는 스포츠 분석 글을 사이트 게시용으로 재작성하는 한국어 लेखक이다. "
-                        "원문 사실에서 벗어나지 않고, 문장을 간결하고 직설적으로 쓴다."
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.4,
-            max_completion_tokens=1200,
-        )
+    return {
+        "full_text_clean": full_text_clean,
+        "base_title": base_title,
+        "home_label": home_label,
+        "away_label": away_label,
+        "footer_line": footer_line,
+        "prompt": prompt,
+        "system": (
+            "너는 스포츠 분석 글을 사이트 게시용으로 재작성하는 한국어 लेखक이다. "
+            "원문 사실에서 벗어나지 않고, 문장을 간결하고 직설적으로 쓴다."
+        ),
+        "model": os.getenv("OPENAI_MODEL_SITE", os.getenv("OPENAI_MODEL_ANALYSIS", "gpt-4.1-mini")),
+        "temperature": 0.4,
+        "max_completion_tokens": 1200,
+    }
 
-        body = (resp.choices[0].message.content or "").strip()
-        if not body:
-            raise ValueError("empty response from OpenAI (site)")
 
-        # 팀명 헤더 강제 치환(모델이 [팀1 분석]/[팀2 분석]로 출력하는 경우 대비)
-        body = re.sub(r"\[\s*팀1\s*분석\s*\]", f"[{home_label} 분석]", body)
-        body = re.sub(r"\[\s*팀2\s*분석\s*\]", f"[{away_label} 분석]", body)
-        # 혹시 모델이 제목을 섞어 출력하면 제거
-        body = re.sub(r"^제목\s*[:：].*\n+", "", body).strip()
+def _finalize_site_rewrite_body(body: str, req: dict, *, max_chars: int = 3500) -> str:
+    """모델 출력 본문 후처리(팀명 헤더 치환, 제목 제거, 브랜드/구분자 제거, 길이 컷)."""
+    body = (body or "").strip()
+    home_label = req.get("home_label") or "홈팀"
+    away_label = req.get("away_label") or "원정팀"
+
+    # 팀명 헤더 강제 치환(모델이 [팀1 분석]/[팀2 분석]로 출력하는 경우 대비)
+    body = re.sub(r"\[\s*팀1\s*분석\s*\]", f"[{home_label} 분석]", body)
+    body = re.sub(r"\[\s*팀2\s*분석\s*\]", f"[{away_label} 분석]", body)
+    # 혹시 모델이 제목을 섞어 출력하면 제거
+    body = re.sub(r"^제목\s*[:：].*\n+", "", body).strip()
+
+    # ✅ 마지막 안전 처리: 브랜드/구분자 제거 + footer 위치 정리
+    body = _postprocess_site_body_text(body, footer_line=req.get("footer_line") or "")
+
+    # 너무 길면 자르기
+    if len(body) > max_chars:
+        body = body[:max_chars].rstrip()
+    return body
+
+
+def _site_rewrite_fallback_body(req: dict, *, max_chars: int = 3500) -> str:
+    body_fb = simple_summarize(req.get("full_text_clean") or "", max_chars=max_chars)
+    return _postprocess_site_body_text(body_fb, footer_line=req.get("footer_line") or "")
+
+
+def rewrite_for_site_openai(
+    full_text: str,
+    *,
+    league: str = "",
+    home_team: str = "",
+    away_team: str = "",
+    max_chars: int = 3500,
+) -> tuple[str, str]:
+    """
+    사이트 게시용: '원문 기반 재작성' 전용.
+
+    ✅ 목표
+    - 원문을 그대로 복붙하지 않고, 구조화된 서술형(팀 분석/경기 흐름/핵심 포인트/최종 픽)으로 재작성
+    - 원문 사실(부상/전술/기록/선수 등)에서 벗어나는 임의 생성 금지
+    - 매치업 표기에서 'vs/VS/대' 같은 구분자 사용 금지(팀명 공백 연결)
+
+    ⚠️ 금지
+    - '고트티비', 'GOATTV', 'goat-tv' 등 특정 사이트/브랜드명 언급 금지
+    """
+    client_oa = get_openai_client()
+
+    req = _build_site_rewrite_request(full_text, league=league, home_team=home_team, away_team=away_team)
+    if req is None:
+        return ("[분석글 없음]", "")
+    base_title = req["base_title"]
 
-        # ✅ 마지막 안전 처리: 브랜드/구분자 제거 + footer 위치 정리
-        body = _postprocess_site_body_text(body, footer_line=footer_line)
+    # OpenAI 키 없으면 최소 폴백(=원문 기반 요약)만 반환
+    if not client_oa:
+        body_fb = simple_summarize(req["full_text_clean"], max_chars=max_chars)
+        # 안전장치: 브랜드/구분자 제거
+        body_fb = _postprocess_site_body_text(body_fb)
+        return (base_title, body_fb)
 
-        # 너무 길면 자르기
-        if len(body) > max_chars:
-            body = body[:max_chars].rstrip()
+    try:
+        body = llm_chat(
+            "site_rewrite",
+            model=req["model"],
+            system=req["system"],
+            prompt=req["prompt"],
+            temperature=req["temperature"],
+            max_completion_tokens=req["max_completion_tokens"],
+        )
 
-        return (base_title, body)
+        return (base_title, _finalize_site_rewrite_body(body, req, max_chars=max_chars))
 
     except Exception as e:
         print(f"[OPENAI][SITE] 재작성 실패 → simple_summarize 폴백: {e}")
-        body_fb = simple_summarize(full_text_clean, max_chars=max_chars)
-        body_fb = _postprocess_site_body_text(body_fb, footer_line=footer_line)
-        return (base_title, body_fb)
+        return (base_title, _site_rewrite_fallback_body(req, max_chars=max_chars))
 
 
 
@@ -5536,22 +7061,15 @@ def summarize_with_gemini(full_text: str, orig_title: str = "", max_chars: int =
     )
 
     try:
-        resp = client_oa.chat.completions.create(
+        text_out = llm_chat(
+            "news_summary",
             model=os.getenv("OPENAI_MODEL_NEWS", "gpt-4.1-mini"),
-            messages=[
-                {
-                    "role": "system",
-                    "content": "너는 스포츠 뉴스를 간결하게 요약하는 한국어 기자다. "
-                               "형식을 정확히 지키고, 중복 표현은 줄인다.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+            system="너는 스포츠 뉴스를 간결하게 요약하는 한국어 기자다. "
+                   "형식을 정확히 지키고, 중복 표현은 줄인다.",
+            prompt=prompt,
             temperature=0.5,
             max_completion_tokens=450,
         )
-        text_out = (resp.choices[0].message.content or "").strip()
-        if not text_out:
-            raise ValueError("empty response from OpenAI (news)")
 
         new_title = ""
         summary = ""
@@ -5647,7 +7165,7 @@ async def fetch_daum_news_json(client: httpx.AsyncClient, category_id: str, size
         "discoveryTag[0]": discovery_tag_value,
     }
 
-    r = await client.get(base_url, params=params, timeout=10.0)
+    r = await _host_limited_get(client, base_url, params=params, timeout=10.0)
     r.raise_for_status()
     data = r.json()
 
@@ -5716,6 +7234,7 @@ async def crawl_daum_news_common(
         return
 
     if not category_id:
+        _pipeline_job_fail(f"{sport_label} 카테고리 ID 없음")
         await update.message.reply_text(
             f"{sport_label} 카테고리 ID가 설정되어 있지 않습니다.\n"
             "코드 상단 DAUM_CATEGORY_IDS 또는 환경변수를 확인해 주세요."
@@ -5735,6 +7254,7 @@ async def crawl_daum_news_common(
             contents = await fetch_daum_news_json(client, category_id, size=max_articles)
 
             if not contents:
+                _pipeline_job_fail(f"{sport_label} 기사 목록 없음")
                 await update.message.reply_text(f"{sport_label} JSON 데이터에서 기사를 찾지 못했습니다.")
                 return
 
@@ -5775,6 +7295,7 @@ async def crawl_daum_news_common(
                     break
 
             if not articles:
+                _pipeline_job_fail(f"{sport_label} 제목/URL 파싱 실패")
                 await update.message.reply_text(
                     f"JSON은 받았지만, {sport_label} 제목/URL 정보를 찾지 못했습니다."
                 )
@@ -5789,44 +7310,22 @@ async def crawl_daum_news_common(
                 print(f"[NEWS_QUEUE] enqueue 실패: {_e}")
 
             # 2) 각 기사 페이지 들어가서 본문 크롤링 + 요약
+            #    (파싱 결과는 news_article_cache에 남겨 카페 뉴스 업로드 때 재사용)
             for art in articles:
                 try:
-                    r2 = await client.get(art["link"], timeout=10.0)
-                    r2.raise_for_status()
-                    s2 = BeautifulSoup(r2.text, "html.parser")
-
-                    body_el = (
-                        s2.select_one("div#harmonyContainer")
-                        or s2.select_one("section#article-view-content-div")
-                        or s2.select_one("div.article_view")
-                        or s2.select_one("div#mArticle")
-                        or s2.find("article")
-                        or s2.body
-                    )
-
-                    raw_body = ""
-                    if body_el:
-                        # 이미지 설명 캡션 제거
-                        try:
-                            for cap in body_el.select(
-                                "figcaption, .txt_caption, .photo_desc, .caption, "
-                                "em.photo_desc, span.caption, p.caption"
-                            ):
-                                try:
-                                    cap.extract()
-                                except Exception:
-                                    pass
-                        except Exception:
-                            # select가 안 되는 경우는 그냥 무시
-                            pass
-
-                        raw_body = body_el.get_text("\n", strip=True)
-                    
-                    clean_text = clean_daum_body_text(raw_body)
+                    cached = news_article_cache_get(art["link"])
+                    if cached is not None:
+                        clean_text = cached[0]
+                    else:
+                        r2 = await _host_limited_get(client, art["link"], timeout=10.0)
+                        r2.raise_for_status()
+                        clean_text, img_url = parse_daum_article_html(r2.text, art["link"])
+                        news_article_cache_put(art["link"], clean_text, img_url, save=False)
                     clean_text = remove_title_prefix(art["title"], clean_text)
                     
                     # ✅ Gemini로 "새 제목 + 요약" 생성 (400자 내외)
-                    new_title, new_summary = summarize_with_gemini(
+                    new_title, new_summary = await _run_llm_in_thread(
+                        summarize_with_gemini,
                         clean_text,
                         orig_title=art["title"],
                         max_chars=400,
@@ -5840,8 +7339,11 @@ async def crawl_daum_news_common(
                     # 크롤링 실패 시에도 최소한 뭔가 넣어두기
                     art["summary"] = "(본문 크롤링 실패)"
 
+            news_article_cache_save()
+
     except Exception as e:
         _log_httpx_exception("[MAZ][Exception]", e)
+        _pipeline_job_fail(f"요청 오류: {e}")
         await update.message.reply_text(f"요청 오류가 발생했습니다: {e}")
         return
 
@@ -5850,6 +7352,7 @@ async def crawl_daum_news_common(
     spreadsheet_id = os.getenv("SPREADSHEET_ID")
 
     if not (client_gs and spreadsheet_id):
+        _pipeline_job_fail("구글시트 설정 없음")
         await update.message.reply_text(
             "구글시트 설정(GOOGLE_SERVICE_KEY 또는 SPREADSHEET_ID)이 없어 시트에 저장하지 못했습니다."
         )
@@ -5859,6 +7362,7 @@ async def crawl_daum_news_common(
         sh = client_gs.open_by_key(spreadsheet_id)
         ws = sh.worksheet(os.getenv("SHEET_NEWS_NAME", "news"))
     except Exception as e:
+        _pipeline_job_fail(f"뉴스 시트 열기 실패: {e}")
         await update.message.reply_text(f"뉴스 시트를 열지 못했습니다: {e}")
         return
 
@@ -5874,6 +7378,7 @@ async def crawl_daum_news_common(
     try:
         ws.append_rows(rows_to_append, value_input_option="RAW", table_range="A1")
     except Exception as e:
+        _pipeline_job_fail(f"시트 쓰기 오류: {e}")
         await update.message.reply_text(f"시트 쓰기 오류: {e}")
         return
 
@@ -6008,6 +7513,11 @@ def _parse_maz_page_window(args: list[str] | None, default_pages: int = 5) -> tu
     return start_page, page_count
 
 
+def _maz_args_want_batch(args: list[str] | None) -> bool:
+    """maz 크롤링 인자에 'batch' 가 있으면 export 본문 재작성을 Batch API로 보낸다."""
+    return any((a or "").strip().lower() == "batch" for a in (args or []))
+
+
 def _format_maz_page_window(start_page: int, page_count: int) -> str:
     start_page = max(1, int(start_page or 1))
     page_count = max(1, int(page_count or 1))
@@ -6152,6 +7662,7 @@ def _maz_list_param_variants(*, page: int, board_type: int, category: int) -> li
     return out
 
 
+@traced("maz.list")
 async def fetch_maz_list_items(
     client: httpx.AsyncClient,
     *,
@@ -6174,7 +7685,8 @@ async def fetch_maz_list_items(
         for params in _maz_list_param_variants(page=page, board_type=board_type, category=category):
             try:
                 headers = _browser_headers_for(list_api, accept_json=True)
-                r = await client.get(list_api, params=params, headers=headers, timeout=15.0)
+                r = await _host_limited_get(client, list_api, params=params, headers=headers, timeout=15.0)
+                span_note(status=r.status_code, nbytes=len(r.content or b""), request=True)
                 print(f"[MAZ][LIST] page={page} status={r.status_code} url={r.url}", flush=True)
 
                 if r.status_code in (401, 403, 418, 429):
@@ -6272,6 +7784,7 @@ def _extract_maz_detail_content(detail: dict) -> str:
     return _first_nonempty(payload, ["content", "body", "html", "contents", "description", "text"])
 
 
+@traced("maz.detail")
 async def fetch_maz_detail_payload(
     client: httpx.AsyncClient,
     board_id: str,
@@ -6283,7 +7796,8 @@ async def fetch_maz_detail_payload(
     for detail_url in _maz_detail_api_candidates(board_id, list_api_url=list_api_url):
         try:
             headers = _browser_headers_for(detail_url, accept_json=True)
-            r = await client.get(detail_url, headers=headers, timeout=15.0)
+            r = await _host_limited_get(client, detail_url, headers=headers, timeout=15.0)
+            span_note(status=r.status_code, nbytes=len(r.content or b""), request=True)
             print(f"[MAZ][DETAIL] id={board_id} status={r.status_code} url={r.url}", flush=True)
 
             if r.status_code in (401, 403, 418, 429):
@@ -6318,6 +7832,93 @@ async def fetch_maz_detail_payload(
 
     return {}, "", (last_err or "NO_MAZ_DETAIL_RESPONSE")
 
+def _maz_row_sport(sport_label: str, league: str) -> str:
+    """mazgtv league 값 기준으로 analysis/export 시트 sport 세부 분류를 정한다."""
+    row_sport = sport_label
+
+    if sport_label == "축구":
+        if "K리그" in league:
+            row_sport = "K리그"
+        elif "J리그" in league:
+            row_sport = "J리그"
+        else:
+            row_sport = "해외축구"
+
+    elif sport_label == "야구":
+        upper_league = (league or "").upper()
+        if "KBO" in upper_league:
+            row_sport = "KBO"
+        elif "NPB" in upper_league:
+            row_sport = "NPB"
+        elif "MLB" in upper_league:
+            row_sport = "해외야구"
+        else:
+            row_sport = "해외야구"
+
+    elif sport_label in ("농구", "농구/배구"):
+        row_sport = classify_basketball_volleyball_sport(league or "")
+
+    return row_sport
+
+
+def _maz_site_export_title(target_date, sport_label: str, row_sport: str, league: str, league_default: str, home: str, away: str) -> str:
+    # ✅ 팀명/구분자 정규화 (표시용 키워드: '팀1 팀2')
+    _norm_key = infer_norm_sport_key(sport_label, row_sport, league or "")
+    _league_for_title = (league or league_default or "").strip()
+    return build_export_title(target_date, _league_for_title, home, away, _norm_key)
+
+
+def _build_site_export_body_and_simple(
+    site_body: str,
+    *,
+    site_title: str,
+    sport_label: str,
+    row_sport: str,
+    league: str,
+    home: str,
+    away: str,
+    row_id: str,
+) -> tuple[str, str]:
+    """재작성된 사이트 본문 → export E열(body) / G열(simple) 값."""
+    _norm_key = infer_norm_sport_key(sport_label, row_sport, league or "")
+    # body(E열)에도 팀명/구분자 표기를 정리(FC/CF/워리어스 등 제거 + vs/대 제거)
+    site_body = normalize_text_teamnames(site_body, sport_key=_norm_key, home_raw=home, away_raw=away)
+    site_body = _postprocess_site_body_text(site_body)
+
+    # ✅ export 시트 G열(simple) 생성: 팀 태그/해시태그 유지
+    try:
+        _hd, _ad, _ = build_matchup_display(home, away, _norm_key)
+        site_simple = build_dynamic_cafe_simple(
+            site_title,
+            site_body,
+            sport=row_sport,
+            seed=str(row_id),
+            home_team=_hd,
+            away_team=_ad,
+            use_openai_core=False,
+        )
+    except Exception:
+        site_simple = ""
+
+    # ✅ E열(body) 하단에 해시태그를 같이 붙이기(원하는 형식)
+    #   - G열(simple) 마지막 줄은 해시태그 라인으로 생성됨
+    try:
+        _last_line = (site_simple or "").strip().splitlines()[-1].strip()
+        if _last_line.startswith("#") and _last_line not in (site_body or ""):
+            site_body = (site_body or "").rstrip() + "\n\n" + _last_line
+    except Exception:
+        pass
+
+    return site_body, site_simple
+
+
+def _maz_target_date_for_day(day_key: str) -> date:
+    base_date = get_kst_now().date()
+    if day_key == "tomorrow":
+        base_date += timedelta(days=1)
+    return base_date
+
+
 async def crawl_maz_analysis_common(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -6332,60 +7933,114 @@ async def crawl_maz_analysis_common(
     category: int = 1,
     target_ymd: str | None = None,
     export_site: bool = False,
+    day_keys: list[str] | tuple[str, ...] | None = None,
+    site_rewrite_batch: bool = False,
 ):
+    """mazgtv 목록/상세를 읽어 analysis(today/tomorrow) + export 시트에 저장한다.
+
+    day_keys 를 주면 멀티 타깃 모드:
+      - 목록 페이지는 한 번만 훑고, 경기 날짜에 따라 today/tomorrow 로 나눠 저장
+      - 각 목적지(analysis/export × today/tomorrow)는 페이지마다 배치로 flush
+      - target_ymd 는 단일 모드(day_key)에서만 사용
+
+    site_rewrite_batch=True 이면 export 본문 재작성(rewrite_for_site_openai)을 즉시 하지 않고
+    OpenAI Batch API로 제출한다. export 행은 본문/simple 없이 먼저 저장되고, 배치 완료 시 채워진다.
+    """
     if not is_admin(update):
         await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
         return
 
-    # ✅ 날짜 기준 설정 (today/tomorrow)
-    if target_ymd is None:
-        base_date = get_kst_now().date()
-        if day_key == "tomorrow":
-            base_date += timedelta(days=1)
-        target_ymd = base_date.strftime("%Y-%m-%d")
+    # ✅ 날짜 기준 설정 (today/tomorrow) → {경기 날짜: day_key}
+    targets: dict[date, str] = {}
+    if day_keys:
+        for dk in day_keys:
+            targets.setdefault(_maz_target_date_for_day(dk), dk)
+    else:
+        if target_ymd is None:
+            target_ymd = _maz_target_date_for_day(day_key).strftime("%Y-%m-%d")
+        targets[datetime.strptime(target_ymd, "%Y-%m-%d").date()] = day_key
 
-    target_date = datetime.strptime(target_ymd, "%Y-%m-%d").date()
+    target_dates = sorted(targets.keys())
+    target_label = ", ".join(d.strftime("%Y-%m-%d") for d in target_dates)
+    active_day_keys = list(dict.fromkeys(targets.values()))
 
     page_window_text = _format_maz_page_window(start_page, max_pages)
 
     await update.message.reply_text(
-        f"mazgtv {sport_label} 분석 페이지에서 {target_ymd} 경기 분석글을 가져옵니다. ({page_window_text}) 잠시만 기다려 주세요..."
+        f"mazgtv {sport_label} 분석 페이지에서 {target_label} 경기 분석글을 가져옵니다. ({page_window_text}) 잠시만 기다려 주세요..."
     )
 
-    rows_to_append: list[list[str]] = []
-
-    # ✅ 중복 방지: 이미 today/tomorrow 시트에 있는 src_id 모으기
-    existing_ids = get_existing_analysis_ids(day_key)
+    # ✅ 중복 방지: 이미 today/tomorrow 시트에 있는 src_id 모으기 (목적지별)
+    existing_ids: dict[str, set[str]] = {dk: get_existing_analysis_ids(dk) for dk in active_day_keys}
 
     # ✅ site_export 시트 중복 방지용
-    export_sheet_name = EXPORT_TODAY_SHEET_NAME if day_key == "today" else EXPORT_TOMORROW_SHEET_NAME
-    existing_export_src_ids = get_existing_export_src_ids(export_sheet_name) if export_site else set()
-    site_rows_to_append: list[list[str]] = []
-    saved_analysis_cnt = 0
-    saved_export_cnt = 0
-
-    def _flush_pending_rows() -> bool:
-        nonlocal rows_to_append, site_rows_to_append, saved_analysis_cnt, saved_export_cnt
-
-        # export를 먼저 저장해서 analysis만 있고 export가 비는 상황을 줄인다.
-        if export_site and site_rows_to_append:
-            ok2 = append_export_rows(export_sheet_name, site_rows_to_append, fill_comments=False)
-            if not ok2:
-                return False
-            saved_export_cnt += len(site_rows_to_append)
-            site_rows_to_append = []
-
-        if rows_to_append:
-            ok = append_analysis_rows(day_key, rows_to_append)
-            if not ok:
-                return False
-            saved_analysis_cnt += len(rows_to_append)
-            rows_to_append = []
+    export_sheet_names: dict[str, str] = {
+        dk: (EXPORT_TODAY_SHEET_NAME if dk == "today" else EXPORT_TOMORROW_SHEET_NAME)
+        for dk in active_day_keys
+    }
+    existing_export_src_ids: dict[str, set[str]] = {
+        dk: (get_existing_export_src_ids(export_sheet_names[dk]) if export_site else set())
+        for dk in active_day_keys
+    }
 
-        return True
+    rows_to_append: dict[str, list[list[str]]] = {dk: [] for dk in active_day_keys}
+    site_rows_to_append: dict[str, list[list[str]]] = {dk: [] for dk in active_day_keys}
+    saved_analysis_cnt: dict[str, int] = {dk: 0 for dk in active_day_keys}
+    saved_export_cnt: dict[str, int] = {dk: 0 for dk in active_day_keys}
+    site_batch_lines: list[dict] = []
+    site_batch_items: dict[str, dict] = {}
 
-    try:
-        async with httpx.AsyncClient(
+    site_batch_done = False
+
+    def _has_pending_rows() -> bool:
+        return any(rows_to_append.values()) or any(site_rows_to_append.values())
+
+    async def _finish_site_batch(submit: bool = True) -> str:
+        """본문이 빈 채로 저장된 export 행의 배치를 한 번만 마무리한다.
+
+        제출하지 못했거나(submit=False: 중간 종료) 제출에 실패하면
+        원문 기반 본문/simple 을 바로 채워서 빈 행이 남지 않게 한다.
+        """
+        nonlocal site_batch_done
+        if site_batch_done or not site_batch_lines:
+            return ""
+        site_batch_done = True
+        if submit:
+            batch_id = await asyncio.to_thread(
+                submit_openai_batch, "site_rewrite", site_batch_lines, site_batch_items, chat_id=update.effective_chat.id,
+            )
+            if batch_id:
+                return f"\n📦 export 본문 재작성 {len(site_batch_lines)}건은 배치({batch_id})로 제출했습니다. 완료 시 자동 반영됩니다."
+        cells, _ = _openai_batch_results_to_cells("site_rewrite", site_batch_items, {})
+        written, missing, err = await asyncio.to_thread(_openai_batch_write_cells, cells)
+        print(f"[MAZ][BATCH] 원문 기반 본문으로 대체: 셀 {written} / 행 없음 {missing} / err={err}")
+        msg = f"\n⚠️ export 본문 재작성 배치를 제출하지 못해 원문 기반 본문으로 채웠습니다. (셀 {written})"
+        if err:
+            msg += f"\n- 시트 반영 오류: {err[:200]}"
+        return msg
+
+    async def _flush_pending_rows() -> bool:
+        for dk in active_day_keys:
+            # export를 먼저 저장해서 analysis만 있고 export가 비는 상황을 줄인다.
+            if export_site and site_rows_to_append[dk]:
+                await fill_export_simple(site_rows_to_append[dk])
+                ok2 = append_export_rows(export_sheet_names[dk], site_rows_to_append[dk], fill_comments=False)
+                if not ok2:
+                    return False
+                saved_export_cnt[dk] += len(site_rows_to_append[dk])
+                site_rows_to_append[dk] = []
+
+            if rows_to_append[dk]:
+                ok = append_analysis_rows(dk, rows_to_append[dk])
+                if not ok:
+                    return False
+                saved_analysis_cnt[dk] += len(rows_to_append[dk])
+                rows_to_append[dk] = []
+
+        return True
+
+    try:
+        async with httpx.AsyncClient(
             headers=BROWSER_HEADERS,
             follow_redirects=True,
         ) as client:
@@ -6404,6 +8059,7 @@ async def crawl_maz_analysis_common(
                 if list_err:
                     print(f"[MAZ][LIST] page={page} 목록 요청 실패: {list_err}")
                     if page == start_page:
+                        _pipeline_job_fail(f"mazgtv 목록 실패: {list_err[:200]}")
                         await update.message.reply_text(
                             "⚠️ mazgtv 목록 API가 차단되었거나 응답 구조가 바뀌었습니다.\n"
                             f"- 마지막 오류: {list_err[:350]}\n"
@@ -6429,15 +8085,6 @@ async def crawl_maz_analysis_common(
 
                     row_id = f"maz_{board_id}"
 
-                    # ✅ 중복 처리
-                    needs_analysis = row_id not in existing_ids
-                    needs_export = bool(export_site) and (row_id not in existing_export_src_ids)
-                    if (not needs_analysis) and (not needs_export):
-                        print(f"[MAZ][SKIP_DUP] already exists (analysis+export): {row_id}")
-                        continue
-                    if (not needs_analysis) and needs_export:
-                        print(f"[MAZ][BACKFILL] analysis exists but export missing: {row_id}")
-
                     game_start_at = _first_nonempty(item, [
                         "gameStartAt", "game_start_at", "gameDate", "game_date",
                         "startAt", "start_at", "kickoff", "kickoffAt", "kickoff_at",
@@ -6458,22 +8105,36 @@ async def crawl_maz_analysis_common(
 
                     # 2) 실패하면 item 전체에서 날짜 패턴 탐색 (연도 보정용)
                     if not item_date:
-                        item_date = detect_game_date_from_item(item, target_date)
+                        for _td in target_dates:
+                            item_date = detect_game_date_from_item(item, _td)
+                            if item_date:
+                                break
 
                     print(f"[MAZ][DEBUG_DATE] page={page} id={board_id} item_date={item_date}")
 
                     if not item_date:
                         continue
 
-                    # ✅ 날짜 필터링 (전 종목 공통: target_date와 정확히 일치만 허용)
+                    # ✅ 날짜 필터링 (전 종목 공통: target 날짜와 정확히 일치만 허용)
                     # 이전에는 야구만 같은 주(0~6일)까지 허용해서,
                     # /crawlmazbaseball_tomorrow 실행 시 내일 경기가 아닌 글도 함께 저장될 수 있었다.
-                    if item_date != target_date:
+                    item_day_key = targets.get(item_date)
+                    if item_day_key is None:
                         print(
                             f"[MAZ][SKIP_DATE] page={page} id={board_id} "
-                            f"sport={sport_label} target_date={target_date} item_date={item_date}"
+                            f"sport={sport_label} target_date={target_label} item_date={item_date}"
                         )
                         continue
+                    target_date = item_date
+
+                    # ✅ 중복 처리 (경기 날짜에 해당하는 목적지 기준)
+                    needs_analysis = row_id not in existing_ids[item_day_key]
+                    needs_export = bool(export_site) and (row_id not in existing_export_src_ids[item_day_key])
+                    if (not needs_analysis) and (not needs_export):
+                        print(f"[MAZ][SKIP_DUP] already exists (analysis+export): {row_id}")
+                        continue
+                    if (not needs_analysis) and needs_export:
+                        print(f"[MAZ][BACKFILL] analysis exists but export missing: {row_id}")
 
                     league = _first_nonempty(item, [
                         "leagueName", "league_name", "league", "competition", "categoryName", "category_name",
@@ -6520,7 +8181,8 @@ async def crawl_maz_analysis_common(
                         continue
 
                     if needs_analysis:
-                        new_title, new_body = summarize_analysis_with_gemini(
+                        new_title, new_body = await _run_llm_in_thread(
+                            summarize_analysis_with_gemini,
                             full_text,
                             league=league,
                             home_team=home,
@@ -6531,45 +8193,60 @@ async def crawl_maz_analysis_common(
                         new_title, new_body = "", ""
 
                     # ✅ today/tomorrow 크롤링 제목 앞에 날짜 프리픽스 추가 (중복 방지)
-                    if new_title and day_key in ("today", "tomorrow"):
+                    if new_title and item_day_key in ("today", "tomorrow"):
                         _dp = f"{target_date.month}월 {target_date.day}일 "
                         if not str(new_title).startswith(_dp):
                             new_title = _dp + str(new_title).strip()
 
                     # ✅ sport 세부 분류
-                    row_sport = sport_label
-
-                    if sport_label == "축구":
-                        if "K리그" in league:
-                            row_sport = "K리그"
-                        elif "J리그" in league:
-                            row_sport = "J리그"
-                        else:
-                            row_sport = "해외축구"
-
-                    elif sport_label == "야구":
-                        upper_league = (league or "").upper()
-                        if "KBO" in upper_league:
-                            row_sport = "KBO"
-                        elif "NPB" in upper_league:
-                            row_sport = "NPB"
-                        elif "MLB" in upper_league:
-                            row_sport = "해외야구"
-                        else:
-                            row_sport = "해외야구"
-
-                    elif sport_label in ("농구", "농구/배구"):
-                        row_sport = classify_basketball_volleyball_sport(league or "")
+                    row_sport = _maz_row_sport(sport_label, league)
 
                     if needs_analysis:
-                        rows_to_append.append([row_sport, row_id, new_title, new_body])
-                        existing_ids.add(row_id)
+                        rows_to_append[item_day_key].append([row_sport, row_id, new_title, new_body])
+                        existing_ids[item_day_key].add(row_id)
 
                     # ✅ 사이트 업로드용(site_export)도 같이 저장
-                    if export_site and needs_export:
+                    if export_site and needs_export and site_rewrite_batch:
+                        # 배치 모드: export 행은 본문 없이 먼저 저장하고, 재작성 요청은 배치로 모은다.
+                        site_req = _build_site_rewrite_request(full_text, league=league, home_team=home, away_team=away)
+                        if site_req is not None:
+                            site_title = _maz_site_export_title(target_date, sport_label, row_sport, league, league_default, home, away)
+                            cid = f"s{len(site_batch_lines)}"
+                            site_batch_lines.append(_openai_batch_request_line(
+                                cid,
+                                model=site_req["model"],
+                                system=site_req["system"],
+                                prompt=site_req["prompt"],
+                                temperature=site_req["temperature"],
+                                max_completion_tokens=site_req["max_completion_tokens"],
+                            ))
+                            site_batch_items[cid] = {
+                                "sheet": export_sheet_names[item_day_key],
+                                "src_id": row_id,
+                                "site_title": site_title,
+                                "sport_label": sport_label,
+                                "row_sport": row_sport,
+                                "league": league,
+                                "home": home,
+                                "away": away,
+                                "req": {k: site_req[k] for k in ("full_text_clean", "home_label", "away_label", "footer_line")},
+                            }
+                            site_rows_to_append[item_day_key].append([
+                                item_day_key,
+                                row_sport,
+                                row_id,
+                                site_title,
+                                "",
+                                get_kst_now().strftime("%Y-%m-%d %H:%M:%S"),
+                                "",
+                            ])
+                            existing_export_src_ids[item_day_key].add(row_id)
+
+                    elif export_site and needs_export:
                         # export 시트에만 백필/저장
                         try:
-                            _tmp_title, site_body = rewrite_for_site_openai(
+                            _tmp_title, site_body = await _run_llm_in_thread(
+                                rewrite_for_site_openai,
                                 full_text,
                                 league=league,
                                 home_team=home,
@@ -6578,40 +8255,20 @@ async def crawl_maz_analysis_common(
                         except Exception as e:
                             print(f"[SITE_EXPORT][ERR] id={board_id}: {e}")
                         else:
-                            # ✅ 팀명/구분자 정규화 (표시용 키워드: '팀1 팀2')
-                            _norm_key = infer_norm_sport_key(sport_label, row_sport, league or "")
-                            _league_for_title = (league or league_default or "").strip()
-                            site_title = build_export_title(target_date, _league_for_title, home, away, _norm_key)
-                            # body(E열)에도 팀명/구분자 표기를 정리(FC/CF/워리어스 등 제거 + vs/대 제거)
-                            site_body = normalize_text_teamnames(site_body, sport_key=_norm_key, home_raw=home, away_raw=away)
-                            site_body = _postprocess_site_body_text(site_body)
-                    
-                            # ✅ export 시트 G열(simple) 생성: 팀 태그/해시태그 유지
-                            try:
-                                _hd, _ad, _ = build_matchup_display(home, away, _norm_key)
-                                site_simple = build_dynamic_cafe_simple(
-                                    site_title,
-                                    site_body,
-                                    sport=row_sport,
-                                    seed=str(row_id),
-                                    home_team=_hd,
-                                    away_team=_ad,
-                                    use_openai_core=False,
-                                )
-                            except Exception:
-                                site_simple = ""
+                            site_title = _maz_site_export_title(target_date, sport_label, row_sport, league, league_default, home, away)
+                            site_body, site_simple = _build_site_export_body_and_simple(
+                                site_body,
+                                site_title=site_title,
+                                sport_label=sport_label,
+                                row_sport=row_sport,
+                                league=league,
+                                home=home,
+                                away=away,
+                                row_id=row_id,
+                            )
 
-                            # ✅ E열(body) 하단에 해시태그를 같이 붙이기(원하는 형식)
-                            #   - G열(simple) 마지막 줄은 해시태그 라인으로 생성됨
-                            try:
-                                _last_line = (site_simple or "").strip().splitlines()[-1].strip()
-                                if _last_line.startswith("#") and _last_line not in (site_body or ""):
-                                    site_body = (site_body or "").rstrip() + "\n\n" + _last_line
-                            except Exception:
-                                pass
-                    
-                            site_rows_to_append.append([
-                                day_key,
+                            site_rows_to_append[item_day_key].append([
+                                item_day_key,
                                 row_sport,
                                 row_id,
                                 site_title,
@@ -6619,38 +8276,56 @@ async def crawl_maz_analysis_common(
                                 get_kst_now().strftime("%Y-%m-%d %H:%M:%S"),
                                 site_simple,
                             ])
-                            existing_export_src_ids.add(row_id)
+                            existing_export_src_ids[item_day_key].add(row_id)
 
-                if rows_to_append or site_rows_to_append:
-                    if not _flush_pending_rows():
-                        await update.message.reply_text("analysis/export 시트 저장 중 오류가 발생했습니다.")
+                if _has_pending_rows():
+                    if not await _flush_pending_rows():
+                        _pipeline_job_fail("analysis/export 시트 저장 오류")
+                        await update.message.reply_text(
+                            "analysis/export 시트 저장 중 오류가 발생했습니다." + await _finish_site_batch(submit=False)
+                        )
                         return
 
     except Exception as e:
         # ✅ 여기 except는 try와 같은 들여쓰기 레벨이어야 함
-        await update.message.reply_text(f"요청 오류가 발생했습니다: {e}")
+        _pipeline_job_fail(f"요청 오류: {e}")
+        await update.message.reply_text(f"요청 오류가 발생했습니다: {e}" + await _finish_site_batch(submit=False))
         return
 
-    if (not rows_to_append) and (not site_rows_to_append) and saved_analysis_cnt == 0 and saved_export_cnt == 0:
+    if (not _has_pending_rows()) and sum(saved_analysis_cnt.values()) == 0 and sum(saved_export_cnt.values()) == 0:
         await update.message.reply_text(
-            f"mazgtv {sport_label} 분석에서 {target_ymd} 경기 분석글을 찾지 못했습니다."
+            f"mazgtv {sport_label} 분석에서 {target_label} 경기 분석글을 찾지 못했습니다."
         )
         return
 
-    if rows_to_append or site_rows_to_append:
-        if not _flush_pending_rows():
-            await update.message.reply_text("analysis/export 시트 저장 중 오류가 발생했습니다.")
+    if _has_pending_rows():
+        if not await _flush_pending_rows():
+            _pipeline_job_fail("analysis/export 시트 저장 오류")
+            await update.message.reply_text(
+                "analysis/export 시트 저장 중 오류가 발생했습니다." + await _finish_site_batch(submit=False)
+            )
             return
 
     reload_analysis_from_sheet()
 
+    total_export_cnt = sum(saved_export_cnt.values())
     extra = ""
     if export_site:
-        extra = f"\nexport 시트에도 {saved_export_cnt}건을 저장했습니다. (comments/deep_comments 자동 생성은 건너뜀)"
+        extra = f"\nexport 시트에도 {total_export_cnt}건을 저장했습니다. (comments/deep_comments 자동 생성은 건너뜀)"
+    extra += await _finish_site_batch()
+
+    if len(active_day_keys) > 1:
+        per_day = ", ".join(
+            f"{dk} 분석 {saved_analysis_cnt[dk]}건/export {saved_export_cnt[dk]}건" for dk in active_day_keys
+        )
+        saved_text = f"{per_day}."
+    else:
+        dk = active_day_keys[0]
+        saved_text = f"분석시트 {saved_analysis_cnt[dk]}건, export {saved_export_cnt[dk]}건."
 
     await update.message.reply_text(
-        f"mazgtv {sport_label} 분석에서 {target_ymd} 저장 완료: "
-        f"분석시트 {saved_analysis_cnt}건, export {saved_export_cnt}건." + extra + "\n"
+        f"mazgtv {sport_label} 분석에서 {target_label} 저장 완료: "
+        + saved_text + extra + "\n"
         "텔레그램에서 경기 분석픽 메뉴를 열어 확인해보세요."
     )
 
@@ -6741,37 +8416,81 @@ def _news_is_rate_limited(err: str) -> bool:
     return ("429" in s) or ("rate" in s) or ("limit" in s) or ("too many" in s)
 
 
-def fetch_daum_article_text_and_image(url: str, orig_title: str = "") -> tuple[str, str]:
-    """다음/다음스포츠/다음뉴스(v.daum.net 포함) 기사 URL에서
-    - 본문 텍스트
-    - 대표 이미지 URL(가능하면)
-    를 추출한다.
+# 다음 기사 본문 캐시 (normalized URL → 정리된 본문/대표 이미지/수집 시각)
+# - crawl_daum_news_common에서 이미 받아 파싱한 기사를 cafe_news_upload가 다시 받지 않도록 로컬에 저장
+# - 본문은 제목 프리픽스 제거 전 상태로 저장하고, 꺼낼 때 orig_title 기준으로 제거한다.
+NEWS_ARTICLE_CACHE_PATH = (os.getenv("NEWS_ARTICLE_CACHE_PATH") or "news_article_cache.json").strip()
+NEWS_ARTICLE_CACHE_TTL_SEC = max(0, int(os.getenv("NEWS_ARTICLE_CACHE_TTL_SEC", str(3 * 24 * 3600))))
+NEWS_ARTICLE_CACHE_MAX = max(50, int(os.getenv("NEWS_ARTICLE_CACHE_MAX", "1000")))
 
-    ⚠️ 주의:
-    - v.daum.net(다음뉴스) 페이지는 div#harmonyContainer가 없을 수 있어,
-      본문 컨테이너(body_el) 기준으로 첫 img를 추가로 탐색한다.
-    """
-    if not url:
-        return "", ""
+_NEWS_ARTICLE_CACHE: dict[str, dict] | None = None
+_NEWS_ARTICLE_CACHE_LOCK = threading.Lock()
 
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-        # 일부 CDN이 referer 없는 호출을 막는 케이스가 있어 안전장치로 넣음
-        "Referer": url,
-    }
 
-    r = requests.get(url, headers=headers, timeout=25)
-    r.raise_for_status()
+def _news_article_cache() -> dict[str, dict]:
+    """캐시 dict(최초 1회 디스크에서 로드). _NEWS_ARTICLE_CACHE_LOCK 안에서 호출."""
+    global _NEWS_ARTICLE_CACHE
+    if _NEWS_ARTICLE_CACHE is None:
+        try:
+            with open(NEWS_ARTICLE_CACHE_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            _NEWS_ARTICLE_CACHE = data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            _NEWS_ARTICLE_CACHE = {}
+        except Exception as e:
+            print(f"[NEWS_CACHE] 로드 실패(무시): {e}")
+            _NEWS_ARTICLE_CACHE = {}
+    return _NEWS_ARTICLE_CACHE
 
-    # requests가 간혹 encoding을 못 잡는 케이스가 있어 UTF-8로 폴백
-    try:
-        if not r.encoding:
-            r.encoding = "utf-8"
-    except Exception:
-        pass
 
-    soup = BeautifulSoup(r.text, "html.parser")
+def news_article_cache_get(url: str) -> tuple[str, str] | None:
+    """TTL 안의 캐시가 있으면 (clean_text, img_url), 없으면 None."""
+    key = _normalize_news_url(url)
+    if not key or NEWS_ARTICLE_CACHE_TTL_SEC <= 0:
+        return None
+    with _NEWS_ARTICLE_CACHE_LOCK:
+        ent = _news_article_cache().get(key)
+    if not isinstance(ent, dict) or not ent.get("text"):
+        return None
+    if time.time() - float(ent.get("fetched_at") or 0) > NEWS_ARTICLE_CACHE_TTL_SEC:
+        return None
+    return str(ent.get("text") or ""), str(ent.get("img_url") or "")
+
+
+def news_article_cache_put(url: str, text: str, img_url: str, *, save: bool = True) -> None:
+    key = _normalize_news_url(url)
+    if not key or not text:
+        return
+    with _NEWS_ARTICLE_CACHE_LOCK:
+        _news_article_cache()[key] = {"text": text, "img_url": img_url or "", "fetched_at": time.time()}
+    if save:
+        news_article_cache_save()
+
+
+def news_article_cache_save() -> None:
+    """만료 항목/초과분(오래된 순)을 정리하고 tmp → os.replace로 저장."""
+    with _NEWS_ARTICLE_CACHE_LOCK:
+        store = _news_article_cache()
+        now_ts = time.time()
+        for k in [k for k, v in store.items() if now_ts - float((v or {}).get("fetched_at") or 0) > NEWS_ARTICLE_CACHE_TTL_SEC]:
+            store.pop(k, None)
+        if len(store) > NEWS_ARTICLE_CACHE_MAX:
+            keep = sorted(store.items(), key=lambda kv: float(kv[1].get("fetched_at") or 0), reverse=True)
+            store.clear()
+            store.update(keep[:NEWS_ARTICLE_CACHE_MAX])
+        snapshot = dict(store)
+    tmp = NEWS_ARTICLE_CACHE_PATH + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp, NEWS_ARTICLE_CACHE_PATH)
+    except Exception as e:
+        print(f"[NEWS_CACHE] 저장 실패(무시): {e}")
+
+
+def parse_daum_article_html(html_text: str, url: str) -> tuple[str, str]:
+    """다음 기사 HTML → (정리된 본문, 대표 이미지 URL). 제목 프리픽스 제거는 호출부에서 한다."""
+    soup = BeautifulSoup(html_text or "", "html.parser")
 
     def _pick_img_attr(tag) -> str:
         if not tag:
@@ -6869,35 +8588,60 @@ def fetch_daum_article_text_and_image(url: str, orig_title: str = "") -> tuple[s
 
         raw_body = body_el.get_text("\n", strip=True)
 
-    clean_text = clean_daum_body_text(raw_body)
-    if orig_title:
-        clean_text = remove_title_prefix(orig_title, clean_text)
+    return clean_daum_body_text(raw_body), img_url
 
-    return clean_text, img_url
 
-def _download_image_bytes(img_url: str, *, referer: str = "") -> tuple[bytes, str, str]:
-    """이미지 URL을 다운로드해서 (bytes, filename, mime_type) 반환. 실패하면 (b"", "", "").
 
-    ✅ 다운로드 안정성
-    - User-Agent/Referer 포함
-    - daumcdn thumb URL(?fname=...)이면 원본 URL을 우선 시도하고, 실패 시 thumb로 폴백
-    - Content-Type이 image/*가 아니면 '파일 시그니처'로 2차 판정(HTML 다운로드 방지)
+def fetch_daum_article_text_and_image(url: str, orig_title: str = "") -> tuple[str, str]:
+    """다음/다음스포츠/다음뉴스(v.daum.net 포함) 기사 URL에서
+    - 본문 텍스트
+    - 대표 이미지 URL(가능하면)
+    를 추출한다.
 
-    ✅ 카페 API 업로드 호환성
-    - 일부 CDN은 Accept 헤더에 webp/avif가 포함되면 webp로 내려주는 경우가 있습니다.
-      네이버 카페 Open API multipart 이미지 첨부는 JPEG/PNG 계열이 가장 안정적이라,
-      기본 Accept는 webp/avif를 광고하지 않도록 설정합니다.
-    - 혹시 webp로 받아진 경우에는 (가능하면) JPEG로 변환해서 반환합니다.
+    ⚠️ 주의:
+    - v.daum.net(다음뉴스) 페이지는 div#harmonyContainer가 없을 수 있어,
+      본문 컨테이너(body_el) 기준으로 첫 img를 추가로 탐색한다.
+    - 크롤링 때 받아 둔 기사(news_article_cache)가 있으면 다음에 다시 요청하지 않는다.
     """
-    if not img_url:
-        return b"", "", ""
+    if not url:
+        return "", ""
 
-    # --- URL 후보 만들기(원본 우선) ---
+    cached = news_article_cache_get(url)
+    if cached is not None:
+        clean_text, img_url = cached
+    else:
+        headers = {
+            "User-Agent": "Mozilla/5.0",
+            "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+            # 일부 CDN이 referer 없는 호출을 막는 케이스가 있어 안전장치로 넣음
+            "Referer": url,
+        }
+
+        r = requests.get(url, headers=headers, timeout=25)
+        r.raise_for_status()
+
+        # requests가 간혹 encoding을 못 잡는 케이스가 있어 UTF-8로 폴백
+        try:
+            if not r.encoding:
+                r.encoding = "utf-8"
+        except Exception:
+            pass
+
+        clean_text, img_url = parse_daum_article_html(r.text, url)
+        news_article_cache_put(url, clean_text, img_url)
+
+    if orig_title:
+        clean_text = remove_title_prefix(orig_title, clean_text)
+
+    return clean_text, img_url
+
+def _image_url_candidates(img_url: str, *, referer: str = "") -> list[str]:
+    """이미지 URL 후보 목록(원본 우선). daumcdn thumb URL(?fname=...)이면 fname 원본을 앞에 둔다."""
     from urllib.parse import urlparse, parse_qs, unquote, urljoin
 
     raw = html.unescape((img_url or "").strip()).strip(" \"'")
     if not raw or raw.startswith("data:"):
-        return b"", "", ""
+        return []
     if raw.startswith("//"):
         raw = "https:" + raw
     if raw.startswith("/") and referer:
@@ -6933,7 +8677,10 @@ def _download_image_bytes(img_url: str, *, referer: str = "") -> tuple[bytes, st
             continue
         seen.add(u2)
         cand2.append(u2)
+    return cand2
+
 
+def _image_request_headers(referer: str = "") -> dict[str, str]:
     headers = {
         "User-Agent": "Mozilla/5.0",
         # ✅ webp/avif를 광고하지 않음(= JPG/PNG로 받게 유도)
@@ -6942,46 +8689,104 @@ def _download_image_bytes(img_url: str, *, referer: str = "") -> tuple[bytes, st
     }
     if referer:
         headers["Referer"] = referer
+    return headers
 
-    def _sniff_mime(data: bytes) -> str:
-        if not data:
-            return ""
-        if data[:3] == b"\xFF\xD8\xFF":
-            return "image/jpeg"
-        if data[:8] == b"\x89PNG\r\n\x1a\n":
-            return "image/png"
-        if data[:6] in (b"GIF87a", b"GIF89a"):
-            return "image/gif"
-        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
-            return "image/webp"
-        # AVIF/HEIC 간단 시그니처(ftyp) 탐지
-        if len(data) >= 16 and data[4:8] == b"ftyp":
-            brand = data[8:12]
-            if brand in (b"avif", b"avis"):
-                return "image/avif"
-            if brand in (b"heic", b"heix", b"hevc", b"hevx", b"mif1", b"msf1"):
-                return "image/heic"
+
+def _sniff_image_mime(data: bytes) -> str:
+    if not data:
         return ""
+    if data[:3] == b"\xFF\xD8\xFF":
+        return "image/jpeg"
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    # AVIF/HEIC 간단 시그니처(ftyp) 탐지
+    if len(data) >= 16 and data[4:8] == b"ftyp":
+        brand = data[8:12]
+        if brand in (b"avif", b"avis"):
+            return "image/avif"
+        if brand in (b"heic", b"heix", b"hevc", b"hevx", b"mif1", b"msf1"):
+            return "image/heic"
+    return ""
+
 
-    def _convert_webp_to_jpeg(data: bytes) -> bytes:
-        """webp 등을 JPEG로 변환. Pillow가 없으면 b'' 반환."""
+def _image_response_mime(data: bytes, content_type: str) -> str:
+    """응답 Content-Type이 image가 아니면 시그니처로 판정(HTML 다운로드 방지). 이미지가 아니면 ''."""
+    content_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if content_type.startswith("image/"):
+        return content_type
+    return _sniff_image_mime(data)
+
+
+def _transcode_image(data: bytes, mime: str, *, max_dim: int = 0) -> tuple[bytes, str, str]:
+    """업로드용 이미지 정리 → (bytes, filename, mime).
+
+    - webp/avif/heic는 네이버 카페 업로드가 실패할 수 있어 가능하면 JPEG로 변환
+    - max_dim > 0이면 긴 변이 max_dim보다 큰 JPEG/PNG/변환 이미지를 축소(GIF는 애니메이션 보존을 위해 제외)
+    - Pillow가 없거나 변환에 실패하면 원본 그대로
+    CPU 작업이라 이벤트 루프에서 직접 부르지 말고 스레드로 넘긴다.
+    """
+    convert = mime in ("image/webp", "image/avif", "image/heic")
+    if convert or (max_dim > 0 and mime in ("image/jpeg", "image/png")):
         try:
             from PIL import Image  # type: ignore
             from io import BytesIO
             im = Image.open(BytesIO(data))
-            # 투명도 처리
-            if im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info):
-                im = im.convert("RGBA")
-                bg = Image.new("RGBA", im.size, (255, 255, 255, 255))
-                bg.paste(im, mask=im.split()[-1])
-                im = bg.convert("RGB")
-            else:
-                im = im.convert("RGB")
-            out = BytesIO()
-            im.save(out, format="JPEG", quality=92, optimize=True)
-            return out.getvalue()
-        except Exception:
-            return b""
+            too_big = max_dim > 0 and max(im.size) > max_dim
+            if convert or too_big:
+                if too_big:
+                    im.thumbnail((max_dim, max_dim))
+                if convert or mime == "image/jpeg":
+                    # 투명도 처리
+                    if im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info):
+                        im = im.convert("RGBA")
+                        bg = Image.new("RGBA", im.size, (255, 255, 255, 255))
+                        bg.paste(im, mask=im.split()[-1])
+                        im = bg.convert("RGB")
+                    else:
+                        im = im.convert("RGB")
+                    out = BytesIO()
+                    im.save(out, format="JPEG", quality=92, optimize=True)
+                    data, mime = out.getvalue(), "image/jpeg"
+                else:
+                    out = BytesIO()
+                    im.save(out, format="PNG", optimize=True)
+                    data = out.getvalue()
+        except Exception as e:
+            print(f"[NEWS_IMAGE] 변환 실패(원본 사용): {e}")
+
+    # 확장자 결정
+    ext = ".jpg"
+    if "png" in mime:
+        ext = ".png"
+    elif "gif" in mime:
+        ext = ".gif"
+    return data, f"news_image{ext}", mime
+
+
+def _download_image_bytes(img_url: str, *, referer: str = "") -> tuple[bytes, str, str]:
+    """이미지 URL을 다운로드해서 (bytes, filename, mime_type) 반환. 실패하면 (b"", "", "").
+
+    ✅ 다운로드 안정성
+    - User-Agent/Referer 포함
+    - daumcdn thumb URL(?fname=...)이면 원본 URL을 우선 시도하고, 실패 시 thumb로 폴백
+    - Content-Type이 image/*가 아니면 '파일 시그니처'로 2차 판정(HTML 다운로드 방지)
+
+    ✅ 카페 API 업로드 호환성
+    - 일부 CDN은 Accept 헤더에 webp/avif가 포함되면 webp로 내려주는 경우가 있습니다.
+      네이버 카페 Open API multipart 이미지 첨부는 JPEG/PNG 계열이 가장 안정적이라,
+      기본 Accept는 webp/avif를 광고하지 않도록 설정합니다.
+    - 혹시 webp로 받아진 경우에는 (가능하면) JPEG로 변환해서 반환합니다.
+
+    (동기 버전. 이벤트 루프 안에서는 fetch_news_image()를 쓴다.)
+    """
+    cand2 = _image_url_candidates(img_url, referer=referer)
+    if not cand2:
+        return b"", "", ""
+    headers = _image_request_headers(referer)
 
     last_err = ""
     for u in cand2:
@@ -6994,34 +8799,12 @@ def _download_image_bytes(img_url: str, *, referer: str = "") -> tuple[bytes, st
                 last_err = "EMPTY_IMAGE"
                 continue
 
-            content_type = (r.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
-
-            # Content-Type이 image가 아니면 시그니처로 판정(HTML 다운로드 방지)
-            if not content_type.startswith("image/"):
-                sniff = _sniff_mime(data)
-                if not sniff:
-                    last_err = f"NOT_IMAGE:{content_type or 'unknown'}"
-                    continue
-                content_type = sniff
-
-            # ✅ webp/avif 등은 네이버 카페 업로드가 실패할 수 있어 가능하면 jpeg로 변환
-            if content_type in ("image/webp", "image/avif", "image/heic"):
-                conv = _convert_webp_to_jpeg(data)
-                if conv:
-                    data = conv
-                    content_type = "image/jpeg"
-
-            # 확장자 결정
-            ext = ".jpg"
-            if "png" in content_type:
-                ext = ".png"
-            elif "gif" in content_type:
-                ext = ".gif"
-            else:
-                ext = ".jpg"
+            content_type = _image_response_mime(data, r.headers.get("Content-Type") or "")
+            if not content_type:
+                last_err = f"NOT_IMAGE:{r.headers.get('Content-Type') or 'unknown'}"
+                continue
 
-            filename = f"news_image{ext}"
-            return data, filename, content_type
+            return _transcode_image(data, content_type, max_dim=NEWS_IMAGE_MAX_DIM)
 
         except Exception as e:
             last_err = str(e)
@@ -7030,6 +8813,148 @@ def _download_image_bytes(img_url: str, *, referer: str = "") -> tuple[bytes, st
     return b"", "", ""
 
 
+# 뉴스 이미지 비동기 단계
+# - 후보 URL(원본/thumb)을 동시에 받아 먼저 성공한 것을 쓰고, 변환(JPEG/축소)은 스레드에서 처리
+# - 원본 바이트와 변환 결과를 URL 해시로 디스크에 캐시(같은 이미지를 다시 받거나 다시 변환하지 않음)
+NEWS_IMAGE_MAX_DIM = max(0, int(os.getenv("NEWS_IMAGE_MAX_DIM", "0")))  # 0이면 축소 안 함
+NEWS_IMAGE_CACHE_DIR = (os.getenv("NEWS_IMAGE_CACHE_DIR") or "news_image_cache").strip()
+NEWS_IMAGE_CACHE_TTL_SEC = max(0, int(os.getenv("NEWS_IMAGE_CACHE_TTL_SEC", str(3 * 24 * 3600))))
+NEWS_IMAGE_CACHE_MAX_FILES = max(20, int(os.getenv("NEWS_IMAGE_CACHE_MAX_FILES", "600")))
+
+
+def _news_image_cache_paths(img_url: str) -> tuple[str, str, str]:
+    """(원본, 변환본, 메타) 경로. 변환본은 축소 설정이 바뀌면 다른 파일이 되도록 max_dim을 키에 넣는다."""
+    h = _hashlib.sha1(str(img_url).encode("utf-8")).hexdigest()
+    base = os.path.join(NEWS_IMAGE_CACHE_DIR, h)
+    return base + ".raw", f"{base}.{NEWS_IMAGE_MAX_DIM}.img", base + ".json"
+
+
+def _news_image_cache_read(path: str) -> bytes:
+    try:
+        if NEWS_IMAGE_CACHE_TTL_SEC and time.time() - os.path.getmtime(path) > NEWS_IMAGE_CACHE_TTL_SEC:
+            return b""
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return b""
+    except Exception as e:
+        print(f"[NEWS_IMAGE] 캐시 읽기 실패(무시): {e}")
+        return b""
+
+
+def _news_image_cache_write(path: str, data: bytes) -> None:
+    try:
+        os.makedirs(NEWS_IMAGE_CACHE_DIR, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"[NEWS_IMAGE] 캐시 저장 실패(무시): {e}")
+
+
+def _news_image_cache_prune() -> None:
+    """만료 파일과 개수 초과분(오래된 순)을 지운다."""
+    try:
+        entries = [os.path.join(NEWS_IMAGE_CACHE_DIR, n) for n in os.listdir(NEWS_IMAGE_CACHE_DIR)]
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        print(f"[NEWS_IMAGE] 캐시 정리 실패(무시): {e}")
+        return
+    now_ts = time.time()
+    files = []
+    for p in entries:
+        try:
+            files.append((os.path.getmtime(p), p))
+        except Exception:
+            continue
+    files.sort(reverse=True)
+    for i, (mtime, p) in enumerate(files):
+        if i >= NEWS_IMAGE_CACHE_MAX_FILES or (NEWS_IMAGE_CACHE_TTL_SEC and now_ts - mtime > NEWS_IMAGE_CACHE_TTL_SEC):
+            try:
+                os.remove(p)
+            except Exception:
+                pass
+
+
+async def _news_image_download_first(img_url: str, *, referer: str = "") -> tuple[bytes, str]:
+    """후보 URL을 동시에 요청해 먼저 받은 유효 이미지 (bytes, mime)를 반환. 나머지 요청은 취소."""
+    cands = _image_url_candidates(img_url, referer=referer)
+    if not cands:
+        return b"", ""
+    headers = _image_request_headers(referer)
+    errors: list[str] = []
+
+    async with httpx.AsyncClient(follow_redirects=True, timeout=25.0) as client:
+        async def _one(u: str) -> tuple[bytes, str]:
+            r = await _host_limited_get(client, u, headers=headers)
+            r.raise_for_status()
+            data = r.content or b""
+            if not data:
+                raise ValueError("EMPTY_IMAGE")
+            mime = _image_response_mime(data, r.headers.get("Content-Type") or "")
+            if not mime:
+                raise ValueError(f"NOT_IMAGE:{r.headers.get('Content-Type') or 'unknown'}")
+            return data, mime
+
+        tasks = [asyncio.create_task(_one(u)) for u in cands]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                try:
+                    return await fut
+                except Exception as e:
+                    errors.append(str(e) or type(e).__name__)
+        finally:
+            for t in tasks:
+                if not t.done():
+                    t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    print(f"[NEWS_IMAGE] download 실패: {img_url} / last_err={errors[-1] if errors else ''}")
+    return b"", ""
+
+
+async def fetch_news_image(img_url: str, *, referer: str = "") -> tuple[bytes, str, str]:
+    """_download_image_bytes()의 비동기 버전 + 캐시. (bytes, filename, mime), 실패하면 (b"", "", "")."""
+    if not img_url:
+        return b"", "", ""
+    raw_path, out_path, meta_path = _news_image_cache_paths(img_url)
+
+    meta: dict = {}
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f) or {}
+    except Exception:
+        meta = {}
+
+    out = _news_image_cache_read(out_path)
+    if out and meta.get("out_mime") and meta.get("out_max_dim") == NEWS_IMAGE_MAX_DIM:
+        return out, str(meta.get("filename") or "news_image.jpg"), str(meta["out_mime"])
+
+    raw = _news_image_cache_read(raw_path)
+    raw_mime = str(meta.get("raw_mime") or "") if raw else ""
+    if not (raw and raw_mime):
+        raw, raw_mime = await _news_image_download_first(img_url, referer=referer)
+        if not raw:
+            return b"", "", ""
+        _news_image_cache_write(raw_path, raw)
+
+    data, filename, mime = await asyncio.to_thread(_transcode_image, raw, raw_mime, max_dim=NEWS_IMAGE_MAX_DIM)
+    _news_image_cache_write(out_path, data)
+    meta = {"raw_mime": raw_mime, "out_mime": mime, "out_max_dim": NEWS_IMAGE_MAX_DIM, "filename": filename, "url": img_url}
+    try:
+        os.makedirs(NEWS_IMAGE_CACHE_DIR, exist_ok=True)
+        tmp = meta_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, meta_path)
+    except Exception as e:
+        print(f"[NEWS_IMAGE] 캐시 메타 저장 실패(무시): {e}")
+    _news_image_cache_prune()
+    return data, filename, mime
+
+
 def _needs_url_decode(s: str) -> bool:
     s = s or ""
     # %HH 형태가 있으면 URL 인코딩 문자열일 가능성이 높다.
@@ -7333,24 +9258,17 @@ def rewrite_news_full_with_openai(
     for attempt in range(2):
         prompt = _make_prompt(strict=(attempt == 1))
         try:
-            resp = client_oa.chat.completions.create(
+            out = llm_chat(
+                "news_long",
                 model=os.getenv("OPENAI_MODEL_NEWS_LONG", os.getenv("OPENAI_MODEL_NEWS", "gpt-4.1-mini")),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "너는 스포츠 전문 기자이자 에디터다. "
-                            "표절 위험이 없도록 완전히 새로운 문장으로 재작성하며, 문단/소제목/불릿/해시태그 구조를 지킨다."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+                system=(
+                    "너는 스포츠 전문 기자이자 에디터다. "
+                    "표절 위험이 없도록 완전히 새로운 문장으로 재작성하며, 문단/소제목/불릿/해시태그 구조를 지킨다."
+                ),
+                prompt=prompt,
                 temperature=0.65,
                 max_completion_tokens=2100,
             )
-            out = (resp.choices[0].message.content or "").strip()
-            if not out:
-                raise ValueError("empty response from OpenAI (news_long)")
 
             new_title = ""
             body_lines: list[str] = []
@@ -7715,7 +9633,6 @@ async def cafe_news_upload(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # ── 2차: 본문 첫부분 해시 기반 중복(동일 이슈/동일 기사) 필터
     body_hash_len = int(os.getenv("NEWS_DUP_BODY_HASH_CHARS", "550"))
-    seen_body_hash = set()
 
     def _body_hash(text: str) -> str:
         t = (text or "").strip()
@@ -7740,66 +9657,107 @@ async def cafe_news_upload(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return "<img src=#0 style=display:block;margin-left:auto;margin-right:auto;max-width:100%;height:auto><br>"
 
 
-    for it in candidates:
-        row_num = it["row"]
-        url = it["url"]
-        orig_title = it["title"]
-        sport = it["sport"]
-
-        # (안전) 이미 로그에 OK로 남아있으면 중복 업로드 방지
-        if url in posted_urls:
-            posted_at = now_kst().isoformat()
-            _queue_update_status(ws_q, row_num, "POSTED", posted_at, "")
-            skip_cnt += 1
-            continue
-
-        try:
-            # 1) 원문 다시 가져오기 + 대표 이미지 추출
-            text_body, img_url = fetch_daum_article_text_and_image(url, orig_title=orig_title)
-            if not text_body:
-                raise ValueError("EMPTY_BODY")
-
-            # 2) 본문 해시 기반 중복 필터(1차 통과 항목들 사이에서만)
-            h = _body_hash(text_body)
-            if h and (h in seen_body_hash):
-                _queue_append_error_only(row_num, "DUP_TOPIC_BODY", it.get("error", ""))
-                skip_cnt += 1
-                if ws_log:
-                    try:
-                        ws_log.append_row([url, orig_title, now_kst().isoformat(), "SKIP", "DUP_TOPIC_BODY"], value_input_option="RAW")
-                    except Exception:
-                        pass
-                continue
-            if h:
-                seen_body_hash.add(h)
-
-            # 3) 완전 재작성
-            new_title, rewritten = rewrite_news_full_with_openai(
-                text_body,
-                orig_title=orig_title or "스포츠 뉴스",
-                sport_label=sport or "",
-                has_image=bool(img_url),
+    # ── 준비(원문/재작성/이미지)와 게시를 겹쳐서 실행
+    # - 게시는 한 번에 1건, 직전 게시가 끝난 뒤 CAFE_NEWS_UPLOAD_DELAY_SEC 간격을 지킨다.
+    # - 그 대기 동안 다음 CAFE_NEWS_PREFETCH건의 준비 작업을 미리 돌린다.
+    post_delay = float(os.getenv("CAFE_NEWS_UPLOAD_DELAY_SEC", "7"))
+    prefetch = max(0, int(os.getenv("CAFE_NEWS_PREFETCH", "2")))
+    initial_posted = set(posted_urls)
+    fetch_tasks: dict[int, asyncio.Task] = {}
+    prep_tasks: dict[int, asyncio.Task] = {}
+
+    def _fetch_task(idx: int) -> asyncio.Task:
+        if idx not in fetch_tasks:
+            it = candidates[idx]
+            fetch_tasks[idx] = asyncio.create_task(
+                asyncio.to_thread(fetch_daum_article_text_and_image, it["url"], orig_title=it["title"])
             )
+        return fetch_tasks[idx]
 
-            # 4) 카페 업로드용 HTML(기존 방식 유지)
-            content_html, content_plain = _make_cafe_center_html(rewritten)
-
-            # 5) 이미지 다운로드(가능하면 multipart 업로드) - 실패해도 글은 업로드
-            img_bytes, img_name, img_mime = _download_image_bytes(img_url, referer=url)
+    async def _fetched_hash(idx: int) -> str:
+        try:
+            text_body, _ = await _fetch_task(idx)
+        except Exception:
+            return ""
+        return _body_hash(text_body) if text_body else ""
+
+    async def _prepare(idx: int) -> dict:
+        it = candidates[idx]
+        if it["url"] in initial_posted:
+            return {"kind": "posted"}
+
+        # 1) 원문 다시 가져오기 + 대표 이미지 추출 (크롤링 캐시가 있으면 재사용)
+        text_body, img_url = await _fetch_task(idx)
+        if not text_body:
+            raise ValueError("EMPTY_BODY")
+
+        # 2) 본문 해시 기반 중복 필터(1차 통과 항목들 사이에서만, 앞 순서 항목 기준)
+        h = _body_hash(text_body)
+        if h:
+            for j in range(idx):
+                if candidates[j]["url"] in initial_posted:
+                    continue
+                if await _fetched_hash(j) == h:
+                    return {"kind": "dup"}
+
+        # 3) 완전 재작성
+        new_title, rewritten = await _run_llm_in_thread(
+            rewrite_news_full_with_openai,
+            text_body,
+            orig_title=it["title"] or "스포츠 뉴스",
+            sport_label=it["sport"] or "",
+            has_image=bool(img_url),
+        )
 
-            posted_at = now_kst().isoformat()
-            clubid = NAVER_CAFE_CLUBID
-            menuid = NAVER_CAFE_NEWS_MENU_ID  # ✅ 고정 31
+        # 4) 카페 업로드용 HTML(기존 방식 유지)
+        content_html, content_plain = _make_cafe_center_html(rewritten)
+
+        # 5) 이미지 다운로드(가능하면 multipart 업로드) - 실패해도 글은 업로드
+        img_bytes, img_name, img_mime = await fetch_news_image(img_url, referer=it["url"])
+
+        return {
+            "kind": "ready",
+            "new_title": new_title,
+            "rewritten": rewritten,
+            "content_html": content_html,
+            "content_plain": content_plain,
+            "img_bytes": img_bytes,
+            "img_name": img_name,
+            "img_mime": img_mime,
+        }
 
-            success = False
-            info = ""
+    def _post(prep: dict) -> tuple[bool, str]:
+        new_title = prep["new_title"]
+        content_html = prep["content_html"]
+        content_plain = prep["content_plain"]
+        img_bytes = prep["img_bytes"]
+        img_name = prep["img_name"]
+        img_mime = prep["img_mime"]
+        clubid = NAVER_CAFE_CLUBID
+        menuid = NAVER_CAFE_NEWS_MENU_ID  # ✅ 고정 31
+
+        success = False
+        info = ""
+
+        # 5-1) 이미지가 있으면: multipart로 여러 변형을 시도 (실패해도 글 업로드는 계속)
+        if img_bytes:
+            # 1) 가장 보수적인 본문(이미지 태그 없음)으로 multipart 시도
+            success, info = _naver_news_cafe_post_multipart(
+                new_title,
+                content_html,
+                clubid,
+                menuid,
+                image_bytes=img_bytes,
+                filename=img_name or "image.jpg",
+                mime_type=img_mime or "image/jpeg",
+            )
 
-            # 5-1) 이미지가 있으면: multipart로 여러 변형을 시도 (실패해도 글 업로드는 계속)
-            if img_bytes:
-                # 1) 가장 보수적인 본문(이미지 태그 없음)으로 multipart 시도
+            # 2) 그래도 실패하면 plain 텍스트로 한 번 더 (필터 회피 목적)
+            if not success:
+                print(f"[NEWS_IMAGE] multipart(본문 그대로) 실패 → plain 본문으로 1회 더: {info}")
                 success, info = _naver_news_cafe_post_multipart(
                     new_title,
-                    content_html,
+                    content_plain,
                     clubid,
                     menuid,
                     image_bytes=img_bytes,
@@ -7807,51 +9765,94 @@ async def cafe_news_upload(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     mime_type=img_mime or "image/jpeg",
                 )
 
-                # 2) 그래도 실패하면 plain 텍스트로 한 번 더 (필터 회피 목적)
-                if not success:
-                    print(f"[NEWS_IMAGE] multipart(본문 그대로) 실패 → plain 본문으로 1회 더: {info}")
-                    success, info = _naver_news_cafe_post_multipart(
-                        new_title,
-                        content_plain,
-                        clubid,
-                        menuid,
-                        image_bytes=img_bytes,
-                        filename=img_name or "image.jpg",
-                        mime_type=img_mime or "image/jpeg",
-                    )
-
-                # 3) (옵션) inline(#0) 태그 버전도 1회 더 시도
-                if not success:
-                    print(f"[NEWS_IMAGE] multipart(plain)도 실패 → inline(#0)로 1회 더: {info}")
-                    content_html_img, _ = _make_cafe_center_html(rewritten, raw_prefix_html=_image_prefix_html())
-                    success, info = _naver_news_cafe_post_multipart(
-                        new_title,
-                        content_html_img,
-                        clubid,
-                        menuid,
-                        image_bytes=img_bytes,
-                        filename=img_name or "image.jpg",
-                        mime_type=img_mime or "image/jpeg",
-                    )
-
-                if not success:
-                    print(f"[NEWS_IMAGE] 업로드 실패 → 이미지 없이 재시도: {info}")
-
-# 5-2) 이미지 업로드 실패/이미지 없음 → 글만 업로드
+            # 3) (옵션) inline(#0) 태그 버전도 1회 더 시도
             if not success:
-                success, info = _naver_news_cafe_post(new_title, content_html, clubid, menuid)
-
-                # HTML에서 999 등이 뜨면 plain 텍스트로 재시도
-                if (not success) and ("999" in (info or "")):
-                    success, info = _naver_news_cafe_post(new_title, content_plain, clubid, menuid)
-
-            if success:
-                _queue_update_status(ws_q, row_num, "POSTED", posted_at, "")
+                print(f"[NEWS_IMAGE] multipart(plain)도 실패 → inline(#0)로 1회 더: {info}")
+                content_html_img, _ = _make_cafe_center_html(prep["rewritten"], raw_prefix_html=_image_prefix_html())
+                success, info = _naver_news_cafe_post_multipart(
+                    new_title,
+                    content_html_img,
+                    clubid,
+                    menuid,
+                    image_bytes=img_bytes,
+                    filename=img_name or "image.jpg",
+                    mime_type=img_mime or "image/jpeg",
+                )
+
+            if not success:
+                print(f"[NEWS_IMAGE] 업로드 실패 → 이미지 없이 재시도: {info}")
+
+        # 5-2) 이미지 업로드 실패/이미지 없음 → 글만 업로드
+        if not success:
+            success, info = _naver_news_cafe_post(new_title, content_html, clubid, menuid)
+
+            # HTML에서 999 등이 뜨면 plain 텍스트로 재시도
+            if (not success) and ("999" in (info or "")):
+                success, info = _naver_news_cafe_post(new_title, content_plain, clubid, menuid)
+
+        return success, info
+
+    last_post_end = 0.0
+    try:
+        for idx, it in enumerate(candidates):
+            for j in range(idx, min(len(candidates), idx + 1 + prefetch)):
+                if j not in prep_tasks:
+                    prep_tasks[j] = asyncio.create_task(_prepare(j))
+
+            row_num = it["row"]
+            url = it["url"]
+            orig_title = it["title"]
+
+            try:
+                prep = await prep_tasks[idx]
+            except Exception as e:
+                err = _safe_truncate(f"EXC:{e}", 300)
+                _queue_update_status(ws_q, row_num, "FAIL", "", err)
+                fail_cnt += 1
+
+                if ws_log:
+                    try:
+                        ws_log.append_row([url, orig_title, "", "FAIL", err], value_input_option="RAW")
+                    except Exception:
+                        pass
+                continue
+
+            # (안전) 이미 로그에 OK로 남아있으면 중복 업로드 방지
+            if prep["kind"] == "posted" or url in posted_urls:
+                posted_at = now_kst().isoformat()
+                _queue_update_status(ws_q, row_num, "POSTED", posted_at, "")
+                skip_cnt += 1
+                continue
+
+            if prep["kind"] == "dup":
+                _queue_append_error_only(row_num, "DUP_TOPIC_BODY", it.get("error", ""))
+                skip_cnt += 1
+                if ws_log:
+                    try:
+                        ws_log.append_row([url, orig_title, now_kst().isoformat(), "SKIP", "DUP_TOPIC_BODY"], value_input_option="RAW")
+                    except Exception:
+                        pass
+                continue
+
+            # 요청 간 텀(과도한 호출 방지): 직전 게시 종료 기준
+            wait = last_post_end + post_delay - time.monotonic() if last_post_end else 0.0
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            posted_at = now_kst().isoformat()
+            try:
+                success, info = await asyncio.to_thread(_post, prep)
+            except Exception as e:
+                success, info = False, f"EXC:{e}"
+            last_post_end = time.monotonic()
+
+            if success:
+                _queue_update_status(ws_q, row_num, "POSTED", posted_at, "")
                 ok_cnt += 1
 
                 if ws_log:
                     try:
-                        ws_log.append_row([url, new_title, posted_at, "OK", ""], value_input_option="RAW")
+                        ws_log.append_row([url, prep["new_title"], posted_at, "OK", ""], value_input_option="RAW")
                     except Exception:
                         pass
                 posted_urls.add(url)
@@ -7867,25 +9868,14 @@ async def cafe_news_upload(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     except Exception:
                         pass
 
-                # rate limit이면 잠깐 쉬었다가 계속
+                # rate limit이면 잠깐 더 쉬었다가 계속
                 if _news_is_rate_limited(info):
-                    await asyncio.sleep(2.0)
-
-            # 요청 간 약간의 텀(과도한 호출 방지)
-            await asyncio.sleep(float(os.getenv("CAFE_NEWS_UPLOAD_DELAY_SEC", "7")))
-
-        except Exception as e:
-            err = _safe_truncate(f"EXC:{e}", 300)
-            _queue_update_status(ws_q, row_num, "FAIL", "", err)
-            fail_cnt += 1
-
-            if ws_log:
-                try:
-                    ws_log.append_row([url, orig_title, "", "FAIL", err], value_input_option="RAW")
-                except Exception:
-                    pass
-
-            await asyncio.sleep(0.5)
+                    last_post_end += 2.0
+    finally:
+        for t in list(prep_tasks.values()) + list(fetch_tasks.values()):
+            if not t.done():
+                t.cancel()
+        await asyncio.gather(*prep_tasks.values(), *fetch_tasks.values(), return_exceptions=True)
 
     await update.message.reply_text(f"뉴스 카페 업로드 완료: OK {ok_cnt} / FAIL {fail_cnt} / SKIP {skip_cnt}")
 
@@ -8158,6 +10148,7 @@ async def on_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def crawlmazsoccer_tomorrow(update: Update, context: ContextTypes.DEFAULT_TYPE):
     start_page, max_pages = _parse_maz_page_window(context.args, default_pages=5)
+    site_batch = _maz_args_want_batch(context.args)  # 'batch' → 본문 재작성은 Batch API로
 
     # 1) 해외축구
     await crawl_maz_analysis_common(
@@ -8167,6 +10158,7 @@ async def crawlmazsoccer_tomorrow(update: Update, context: ContextTypes.DEFAULT_
         sport_label="축구",
         league_default="해외축구",
         day_key="tomorrow",
+        site_rewrite_batch=site_batch,
         start_page=start_page,
         max_pages=max_pages,
         board_type=2,
@@ -8182,6 +10174,7 @@ async def crawlmazsoccer_tomorrow(update: Update, context: ContextTypes.DEFAULT_
         sport_label="축구",
         league_default="K리그/J리그",
         day_key="tomorrow",
+        site_rewrite_batch=site_batch,
         start_page=start_page,
         max_pages=max_pages,
         board_type=2,
@@ -8202,6 +10195,7 @@ async def crawlmazbaseball_tomorrow(update: Update, context: ContextTypes.DEFAUL
     'tomorrow' 시트에 저장한다. 축구용과 동일한 구조.
     """
     start_page, max_pages = _parse_maz_page_window(context.args, default_pages=5)
+    site_batch = _maz_args_want_batch(context.args)  # 'batch' → 본문 재작성은 Batch API로
 
     # 해외야구(MLB)
     await crawl_maz_analysis_common(
@@ -8211,6 +10205,7 @@ async def crawlmazbaseball_tomorrow(update: Update, context: ContextTypes.DEFAUL
         sport_label="야구",
         league_default="해외야구",
         day_key="tomorrow",
+        site_rewrite_batch=site_batch,
         start_page=start_page,
         max_pages=max_pages,
         board_type=2,
@@ -8226,6 +10221,7 @@ async def crawlmazbaseball_tomorrow(update: Update, context: ContextTypes.DEFAUL
         sport_label="야구",
         league_default="KBO/NPB",
         day_key="tomorrow",
+        site_rewrite_batch=site_batch,
         start_page=start_page,
         max_pages=max_pages,
         board_type=2,
@@ -8247,6 +10243,7 @@ async def bvcrawl_tomorrow(update: Update, context: ContextTypes.DEFAULT_TYPE):
     두 곳에서 '내일 경기' 분석글을 크롤링해서 tomorrow 시트에 저장한다.
     """
     start_page, max_pages = _parse_maz_page_window(context.args, default_pages=5)
+    site_batch = _maz_args_want_batch(context.args)  # 'batch' → 본문 재작성은 Batch API로
 
 
     # 1) NBA (해외 농구)
@@ -8257,6 +10254,7 @@ async def bvcrawl_tomorrow(update: Update, context: ContextTypes.DEFAULT_TYPE):
         sport_label="농구",          # 시트에는 NBA/KBL/WKBL 등으로 나뉨
         league_default="NBA",
         day_key="tomorrow",
+        site_rewrite_batch=site_batch,
         start_page=start_page,
         max_pages=max_pages,
         board_type=2,                # ⚠️ 실제 boardType 값으로 수정 필요
@@ -8273,6 +10271,7 @@ async def bvcrawl_tomorrow(update: Update, context: ContextTypes.DEFAULT_TYPE):
         sport_label="농구/배구",     # 분류 함수에서 KBL/WKBL/V리그/배구 등으로 세분화
         league_default="국내농구/배구",
         day_key="tomorrow",
+        site_rewrite_batch=site_batch,
         start_page=start_page,
         max_pages=max_pages,
         board_type=2,                # ⚠️ 실제 boardType 값으로 수정 필요
@@ -8421,17 +10420,340 @@ async def bvcrawl_today(update: Update, context: ContextTypes.DEFAULT_TYPE):
     )
 
 
+# ───────────────── mazgtv 오늘+내일 통합 크롤링 (목록 1회 순회) ─────────────────
+# 같은 목록 API를 today/tomorrow로 두 번 훑지 않도록, 경기 날짜 기준으로
+# today/tomorrow 시트(analysis + export)에 나눠 저장한다.
+
+MAZ_BOTH_DAY_KEYS = ("today", "tomorrow")
+
+
+async def crawlmazsoccer_both(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """mazgtv 해외축구 + K리그/J리그 분석(오늘+내일)을 목록 1회 순회로 저장."""
+    start_page, max_pages = _parse_maz_page_window(context.args, default_pages=5)
+
+    # 1) 해외축구
+    await crawl_maz_analysis_common(
+        update,
+        context,
+        base_url="https://mazgtv1.com/analyze/overseas",
+        sport_label="축구",
+        league_default="해외축구",
+        start_page=start_page,
+        max_pages=max_pages,
+        board_type=2,
+        category=1,
+        export_site=True,
+        day_keys=MAZ_BOTH_DAY_KEYS,
+    )
+
+    # 2) K리그/J리그(asia)
+    await crawl_maz_analysis_common(
+        update,
+        context,
+        base_url="https://mazgtv1.com/analyze/asia",
+        sport_label="축구",
+        league_default="K리그/J리그",
+        start_page=start_page,
+        max_pages=max_pages,
+        board_type=2,
+        category=2,
+        export_site=True,
+        day_keys=MAZ_BOTH_DAY_KEYS,
+    )
+
+    await update.message.reply_text(
+        f"⚽ 해외축구 + K리그/J리그 오늘+내일 경기 분석 크롤링을 모두 실행했습니다. ({_format_maz_page_window(start_page, max_pages)})",
+        reply_markup=_build_export_comment_zip_markup("tomorrow", "soccer"),
+    )
+
+
+async def crawlmazbaseball_both(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """mazgtv 야구(MLB · KBO · NPB) 분석(오늘+내일)을 목록 1회 순회로 저장."""
+    start_page, max_pages = _parse_maz_page_window(context.args, default_pages=5)
+
+    # 해외야구(MLB)
+    await crawl_maz_analysis_common(
+        update,
+        context,
+        base_url="https://mazgtv1.com/analyze/mlb",
+        sport_label="야구",
+        league_default="해외야구",
+        start_page=start_page,
+        max_pages=max_pages,
+        board_type=2,
+        category=3,
+        export_site=True,
+        day_keys=MAZ_BOTH_DAY_KEYS,
+    )
+
+    # KBO + NPB
+    await crawl_maz_analysis_common(
+        update,
+        context,
+        base_url="https://mazgtv1.com/analyze/baseball",
+        sport_label="야구",
+        league_default="KBO/NPB",
+        start_page=start_page,
+        max_pages=max_pages,
+        board_type=2,
+        category=4,
+        export_site=True,
+        day_keys=MAZ_BOTH_DAY_KEYS,
+    )
+
+    await update.message.reply_text(
+        f"⚾ 야구(MLB · KBO · NPB) 오늘+내일 경기 분석 크롤링을 모두 실행했습니다. ({_format_maz_page_window(start_page, max_pages)})",
+        reply_markup=_build_export_comment_zip_markup("tomorrow", "baseball"),
+    )
+
+
+async def bvcrawl_both(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """mazgtv NBA + 국내 농구/배구 분석(오늘+내일)을 목록 1회 순회로 저장."""
+    start_page, max_pages = _parse_maz_page_window(context.args, default_pages=5)
+
+    # 1) NBA (해외 농구)
+    await crawl_maz_analysis_common(
+        update,
+        context,
+        base_url="https://mazgtv1.com/analyze/nba",
+        sport_label="농구",
+        league_default="NBA",
+        start_page=start_page,
+        max_pages=max_pages,
+        board_type=2,
+        category=5,
+        export_site=True,
+        day_keys=MAZ_BOTH_DAY_KEYS,
+    )
+
+    # 2) 국내 농구 + 배구 (KBL / WKBL / V리그 등)
+    await crawl_maz_analysis_common(
+        update,
+        context,
+        base_url="https://mazgtv1.com/analyze/volleyball",
+        sport_label="농구/배구",
+        league_default="국내농구/배구",
+        start_page=start_page,
+        max_pages=max_pages,
+        board_type=2,
+        category=7,
+        export_site=True,
+        day_keys=MAZ_BOTH_DAY_KEYS,
+    )
+
+    await update.message.reply_text(
+        f"NBA + 국내 농구/배구(오늘+내일 경기) 분석 크롤링을 모두 실행했습니다. ({_format_maz_page_window(start_page, max_pages)})\n"
+        "/syncsheet 로 텔레그램 메뉴 데이터를 갱신할 수 있습니다.",
+        reply_markup=_build_export_comment_zip_markup_bv("tomorrow"),
+    )
+
+
+# ───────────────── 전 종목 파이프라인 (/pipeline) ─────────────────
+# 1) 크롤링: mazgtv 축구/야구/농구배구 + Daum 뉴스 6종을 동시에 실행
+#    (호스트별 동시성은 PIPELINE_HOST_CONCURRENCY, LLM은 게이트웨이의 모델별 슬롯으로 공유 제한)
+# 2) export_comment_fill → 3) cafe_* 업로드 + cafe_news_upload 순서로 이어서 실행
+# 단계별 소요 시간을 마지막에 보고한다.
+
+PIPELINE_UPLOAD_SPORTS = ("soccer", "baseball", "basketball", "volleyball")
+
+
+class _PipelineContext:
+    """기존 명령어 핸들러를 파이프라인 단계로 재사용할 때 args만 바꿔 끼우는 컨텍스트 래퍼."""
+
+    def __init__(self, context: ContextTypes.DEFAULT_TYPE, args: list[str] | None = None):
+        self._context = context
+        self.args = list(args or [])
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+
+def _parse_pipeline_args(args: list[str] | None) -> dict:
+    """/pipeline [today|tomorrow|both] [페이지수] [nocomment] [noupload] [nonews]"""
+    opts = {
+        "day": "tomorrow",
+        "pages": 5,
+        "comments": True,
+        "upload": True,
+        "news": True,
+    }
+    for raw in (args or []):
+        s = (raw or "").strip().lower()
+        if not s:
+            continue
+        if s in ("today", "tomorrow", "both"):
+            opts["day"] = s
+        elif s.isdigit():
+            opts["pages"] = max(1, min(int(s), 20))
+        elif s in ("nocomment", "nocomments"):
+            opts["comments"] = False
+        elif s == "noupload":
+            opts["upload"] = False
+        elif s == "nonews":
+            opts["news"] = False
+    return opts
+
+
+# 기존 명령어 핸들러는 오류를 reply_text로만 알리고 정상 종료하므로,
+# 실패 지점에서 _pipeline_job_fail()로 남긴 사유를 파이프라인 작업 결과로 모은다. (단독 실행 시엔 무시)
+_PIPELINE_JOB_ERRORS: contextvars.ContextVar[list | None] = contextvars.ContextVar("pipeline_job_errors", default=None)
+
+
+def _pipeline_job_fail(reason: str) -> None:
+    errs = _PIPELINE_JOB_ERRORS.get()
+    if errs is not None:
+        errs.append(str(reason))
+
+
+async def _run_pipeline_stage(stage_name: str, jobs: list[tuple[str, object]]) -> tuple[float, list[tuple[str, float]], list[str]]:
+    """jobs(이름, 코루틴)를 동시에 실행하고 (단계 소요, 작업별 소요, 오류 목록)을 돌려준다.
+
+    작업이 예외를 던졌거나 핸들러가 _pipeline_job_fail()로 실패를 알린 경우 오류로 센다.
+    """
+
+    async def _timed(name: str, coro) -> tuple[str, float, str]:
+        t0 = time.perf_counter()
+        err = ""
+        job_errors: list[str] = []
+        token = _PIPELINE_JOB_ERRORS.set(job_errors)
+        try:
+            await coro
+        except Exception as e:
+            err = f"{name}: {type(e).__name__}: {e}"
+            traceback.print_exc()
+        finally:
+            _PIPELINE_JOB_ERRORS.reset(token)
+        if not err and job_errors:
+            err = f"{name}: " + " / ".join(job_errors[:3])
+        if err:
+            print(f"[PIPELINE][{stage_name}] {err}")
+        return name, time.perf_counter() - t0, err
+
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*[_timed(name, coro) for name, coro in jobs])
+    elapsed = time.perf_counter() - t0
+    job_times = [(name, dt) for name, dt, _err in results]
+    errors = [err for _name, _dt, err in results if err]
+    return elapsed, job_times, errors
+
+
+async def _run_pipeline_sequential(stage_name: str, jobs: list[tuple[str, object]]) -> tuple[float, list[tuple[str, float]], list[str]]:
+    """업로드처럼 계정 단위 속도 제한이 있는 작업은 순서대로 실행한다."""
+    t0 = time.perf_counter()
+    job_times: list[tuple[str, float]] = []
+    errors: list[str] = []
+    for name, coro in jobs:
+        _elapsed, times, errs = await _run_pipeline_stage(stage_name, [(name, coro)])
+        job_times.extend(times)
+        errors.extend(errs)
+    return time.perf_counter() - t0, job_times, errors
+
+
+async def pipeline(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """/pipeline [today|tomorrow|both] [페이지수] [nocomment] [noupload] [nonews]
+
+    크롤링(전 종목 동시) → 댓글 생성 → 카페 업로드를 한 번에 실행한다.
+    앞 단계 작업이 실패하면(예외 또는 핸들러가 알린 실패) 뒤 단계(댓글/업로드)는 건너뛴다.
+    """
+    if not is_admin(update):
+        await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
+        return
+
+    opts = _parse_pipeline_args(context.args)
+    day = opts["day"]
+    page_args = [str(opts["pages"])]
+
+    maz_commands = {
+        "today": (crawlmazsoccer_today, crawlmazbaseball_today, bvcrawl_today),
+        "tomorrow": (crawlmazsoccer_tomorrow, crawlmazbaseball_tomorrow, bvcrawl_tomorrow),
+        "both": (crawlmazsoccer_both, crawlmazbaseball_both, bvcrawl_both),
+    }[day]
+
+    await update.message.reply_text(
+        f"🚀 파이프라인 시작: {day} / {opts['pages']}페이지 / "
+        f"댓글 {'O' if opts['comments'] else 'X'} / 업로드 {'O' if opts['upload'] else 'X'} / 뉴스 {'O' if opts['news'] else 'X'}"
+    )
+
+    stage_report: list[tuple[str, float, list[tuple[str, float]], list[str]]] = []
+    t_all = time.perf_counter()
+
+    # 1) 크롤링 (종목 간 동시 실행)
+    crawl_jobs: list[tuple[str, object]] = [
+        ("maz_soccer", maz_commands[0](update, _PipelineContext(context, page_args))),
+        ("maz_baseball", maz_commands[1](update, _PipelineContext(context, page_args))),
+        ("maz_bv", maz_commands[2](update, _PipelineContext(context, page_args))),
+    ]
+    if opts["news"]:
+        for name, func in (
+            ("daum_soccer", crawlsoccer),
+            ("daum_soccerkr", crawlsoccerkr),
+            ("daum_baseball", crawlbaseball),
+            ("daum_overbaseball", crawloverbaseball),
+            ("daum_basketball", crawlbasketball),
+            ("daum_volleyball", crawlvolleyball),
+        ):
+            crawl_jobs.append((name, func(update, _PipelineContext(context))))
+
+    elapsed, job_times, errors = await _run_pipeline_stage("crawl", crawl_jobs)
+    stage_report.append(("crawl", elapsed, job_times, errors))
+
+    upload_days = ["today", "tomorrow"] if day == "both" else [day]
+    skipped: list[str] = []
+
+    # 2) 댓글 생성 (크롤링 완료 후)
+    if opts["comments"] and errors:
+        skipped.append("comments")
+    elif opts["comments"]:
+        fill_target = "all" if day == "both" else day
+        elapsed, job_times, errors = await _run_pipeline_stage(
+            "comments",
+            [("export_comment_fill", export_comment_fill(update, _PipelineContext(context, [fill_target])))],
+        )
+        stage_report.append(("comments", elapsed, job_times, errors))
+
+    # 3) 카페 업로드 (댓글 생성 완료 후, 계정별 속도 제한 때문에 순차 실행)
+    if opts["upload"] and (errors or skipped):
+        skipped.append("upload")
+    elif opts["upload"]:
+        upload_jobs: list[tuple[str, object]] = []
+        for which in upload_days:
+            for sport in PIPELINE_UPLOAD_SPORTS:
+                for mode in ("simple", "deep"):
+                    upload_jobs.append((
+                        f"cafe_{sport}_{mode}_{which}",
+                        cafe_post_from_export(update, _PipelineContext(context), which, sport_filter=sport, mode=mode),
+                    ))
+        if opts["news"]:
+            upload_jobs.append(("cafe_news_upload", cafe_news_upload(update, _PipelineContext(context))))
+        elapsed, job_times, errors = await _run_pipeline_sequential("upload", upload_jobs)
+        stage_report.append(("upload", elapsed, job_times, errors))
+
+    total = time.perf_counter() - t_all
+
+    lines = [f"🏁 파이프라인 완료 ({day}) 총 {total:.1f}s"]
+    for stage_name, elapsed, job_times, stage_errors in stage_report:
+        slowest = max(job_times, key=lambda x: x[1]) if job_times else ("-", 0.0)
+        lines.append(f"- {stage_name}: {elapsed:.1f}s (최장 {slowest[0]} {slowest[1]:.1f}s, 작업 {len(job_times)}개)")
+        for err in stage_errors[:5]:
+            lines.append(f"  ⚠️ {err[:200]}")
+    if skipped:
+        lines.append(f"⚠️ 앞 단계 오류로 건너뜀: {', '.join(skipped)}")
+    await update.message.reply_text("\n".join(lines))
+
+
 # ───────────────── 실행부 ─────────────────
 
 async def export_rollover(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """export_tomorrow → export_today 롤오버 (덮어쓰기).
     - export_today 기존 데이터는 모두 비우고(헤더 재설정) export_tomorrow 데이터를 그대로 복사
     - 이후 export_tomorrow는 헤더만 남김
+    - 복사/초기화는 batchUpdate 1회(서버측 copyPaste). /export_rollover dry 는 행 수만 보고
     """
     if not is_admin(update):
         await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
         return
 
+    dry_run = _rollover_dry_run_arg(context)
     today_ws = get_export_ws(EXPORT_TODAY_SHEET_NAME)
     tomo_ws = get_export_ws(EXPORT_TOMORROW_SHEET_NAME)
     if not today_ws or not tomo_ws:
@@ -8439,49 +10761,68 @@ async def export_rollover(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     try:
-        tomo_vals = tomo_ws.get_all_values()
-        if not tomo_vals or len(tomo_vals) <= 1:
-            await update.message.reply_text("export_tomorrow에 옮길 데이터가 없습니다.")
-            return
-
-        # 옮길 데이터(헤더 제외). src_id가 비어있는 행은 제외.
-        header = [c.strip() for c in (tomo_vals[0] if tomo_vals else EXPORT_HEADER)]
-        src_idx = header.index("src_id") if "src_id" in header else 2
-
-        to_move = []
-        for r in tomo_vals[1:]:
-            sid = r[src_idx].strip() if len(r) > src_idx else ""
-            if not sid:
-                continue
-            to_move.append(r)
+        sh = tomo_ws.spreadsheet
+        src_letter = _col_letter(EXPORT_HEADER.index("src_id") + 1)
+        resp = await _gsheet_call_with_backoff(
+            "export_rollover.read",
+            sh.values_batch_get,
+            [
+                f"'{EXPORT_TOMORROW_SHEET_NAME}'!1:1",
+                f"'{EXPORT_TOMORROW_SHEET_NAME}'!{src_letter}:{src_letter}",
+                f"'{EXPORT_TODAY_SHEET_NAME}'!{src_letter}:{src_letter}",
+            ],
+        )
+        vrs = (resp or {}).get("valueRanges") or []
 
-        # export_today는 덮어쓰기: 전체 비우고 헤더 재설정 후, 내일 데이터를 그대로 넣는다.
-        try:
-            today_ws.clear()
-        except Exception:
-            try:
-                today_ws.batch_clear(["A2:Z"])
-            except Exception:
-                pass
+        def _vals(i: int) -> list[list[str]]:
+            return (vrs[i].get("values") if len(vrs) > i else None) or []
 
-        try:
-            today_ws.update(range_name="A1", values=[EXPORT_HEADER])
-        except Exception:
-            today_ws.update(values=[EXPORT_HEADER], range_name="A1")
+        header_row = _vals(0)
+        header = [str(c).strip() for c in (header_row[0] if header_row else EXPORT_HEADER)]
+        src_idx = header.index("src_id") if "src_id" in header else 2
+        tomo_col = _vals(1)
+        if _col_letter(src_idx + 1) != src_letter:
+            # 헤더가 기본 순서와 다르면 실제 src_id 열을 다시 읽는다.
+            letter = _col_letter(src_idx + 1)
+            tomo_col = await _gsheet_call_with_backoff(
+                "export_rollover.read_src", tomo_ws.get, f"{letter}:{letter}"
+            ) or []
+        today_rows = sum(1 for r in _vals(2)[1:] if r and str(r[0]).strip())
+
+        # 옮길 데이터(헤더 제외). src_id가 비어있는 행은 제외 → 남는 행 구간만 서버에서 복사.
+        keep = [bool(r and str(r[0]).strip()) for r in list(tomo_col)[1:]]
+        runs = _gsheet_row_runs(keep, offset=1)
+        move_cnt = sum(keep)
+        skip_cnt = len(keep) - move_cnt
+
+        if dry_run:
+            await update.message.reply_text(
+                "🔎 export 롤오버 미리보기 (변경 없음)\n"
+                f"- {EXPORT_TOMORROW_SHEET_NAME}: 옮길 행 {move_cnt}건 (src_id 없는 행 {skip_cnt}건 제외)\n"
+                f"- {EXPORT_TODAY_SHEET_NAME}: 기존 {today_rows}건은 덮어써짐\n"
+                f"- 복사 구간 {len(runs)}개, batchUpdate 1회"
+            )
+            return
 
-        if to_move:
-            today_ws.append_rows(to_move, value_input_option="RAW", table_range="A1")
+        if not move_cnt:
+            await update.message.reply_text("export_tomorrow에 옮길 데이터가 없습니다.")
+            return
 
-        # export_tomorrow 초기화(헤더만)
-        tomo_ws.clear()
-        tomo_ws.update(range_name="A1", values=[EXPORT_HEADER])
+        requests = _gsheet_rollover_requests(
+            tomo_ws,
+            today_ws,
+            runs=runs,
+            dst_start_row=1,
+            header=EXPORT_HEADER,
+        )
+        await _gsheet_call_with_backoff("export_rollover.batch_update", sh.batch_update, {"requests": requests})
 
         await update.message.reply_text(
-            f"롤오버 완료(덮어쓰기): export_today에 {len(to_move)}건 반영, export_tomorrow 초기화 완료."
+            f"롤오버 완료(덮어쓰기): export_today에 {move_cnt}건 반영, export_tomorrow 초기화 완료."
         )
 
     except Exception as e:
-        await update.message.reply_text(f"롤오버 중 오류: {e}")
+        await update.message.reply_text(f"롤오버 중 오류(시트는 변경되지 않음): {e}")
         return
 
 
@@ -8822,18 +11163,22 @@ def _youtoo_find_header_index(old_header: list[str], col: str) -> int | None:
     return None
 
 
-def ensure_youtoo_header(ws) -> None:
+def ensure_youtoo_header(ws, values: list[list[str]] | None = None) -> list[list[str]]:
     """youtoo 시트 헤더를 최신 스펙으로 맞춘다.
 
     - A~N: 봇이 자동 수집/갱신하는 컬럼
     - O~P: 사람이 수기로 입력하는 컬럼(적중건제출여부/지급여부) → ✅ 봇이 절대 덮어쓰지 않음
 
     헤더가 어긋난 과거 버전(구/신 헤더 혼재)도 가능한 범위 내에서 자동 마이그레이션한다.
+
+    values(=이미 읽어둔 get_all_values 스냅샷)를 넘기면 시트를 다시 읽지 않는다.
+    반환값은 헤더 보정/마이그레이션 이후의 시트 값(스냅샷)이다.
     """
-    try:
-        values = ws.get_all_values()
-    except Exception:
-        values = []
+    if values is None:
+        try:
+            values = ws.get_all_values()
+        except Exception:
+            values = []
 
     # 시트가 비어있으면 헤더부터 세팅
     if not values:
@@ -8843,7 +11188,7 @@ def ensure_youtoo_header(ws) -> None:
         except Exception:
             pass
         ws.update("A1", [YOUTOO_HEADER])
-        return
+        return [list(YOUTOO_HEADER)]
 
     # get_all_values()는 "헤더 행의 빈 셀"을 끝까지 반환하지 않을 수 있으므로,
     # 전체 데이터에서 가장 긴 열 길이를 기준으로 헤더를 패딩한다.
@@ -8881,7 +11226,7 @@ def ensure_youtoo_header(ws) -> None:
                     ws.update(f"{_col_letter(col_idx_1based)}1", [[name]])
                 except Exception:
                     pass
-        return
+        return [header] + [list(r) for r in values[1:]]
 
     # ✅ 헤더가 과거 버전이면: 가능한 범위에서 전체 마이그레이션(수기 L/M도 보존)
     old_header = header  # 패딩된 헤더
@@ -8918,9 +11263,14 @@ def ensure_youtoo_header(ws) -> None:
         pass
 
     ws.update("A1", [YOUTOO_HEADER] + new_rows, value_input_option="RAW")
+    _youtoo_index_cache_clear()
+    return [list(YOUTOO_HEADER)] + new_rows
 
-def get_youtoo_ws():
-    """youtoo 탭 워크시트 반환(없으면 생성 + 헤더 세팅)."""
+def get_youtoo_ws(*, ensure_header: bool = True):
+    """youtoo 탭 워크시트 반환(없으면 생성 + 헤더 세팅).
+
+    ensure_header=False 이면 헤더 점검(=전체 읽기)을 생략한다. (upsert 쪽에서 스냅샷과 함께 처리)
+    """
     client_gs = get_gs_client()
     spreadsheet_id = os.getenv("SPREADSHEET_ID")
     if not (client_gs and spreadsheet_id):
@@ -8939,7 +11289,8 @@ def get_youtoo_ws():
         except Exception:
             pass
 
-        ensure_youtoo_header(ws)
+        if ensure_header:
+            ensure_youtoo_header(ws)
         return ws
     except Exception as e:
         print(f"[GSHEET][YOUTOO] 워크시트 준비 실패({YOUTOO_SHEET_NAME}): {e}")
@@ -8975,66 +11326,165 @@ def get_existing_youtoo_src_ids() -> set[str]:
         return set()
 
 
-async def upsert_youtoo_rows_top(rows: list[list[str]]) -> tuple[bool, int, int]:
-    """youtoo 시트에 rows를 upsert 하되, ✅ 신규는 2행(헤더 아래)에 삽입해서 '위로 업데이트'되게 만든다.
+# ───────── youtoo 시트 스냅샷 / 로컬 인덱스 캐시 ─────────
+# upsert 한 번에 youtoo 탭 전체(본문 미리보기 포함)를 여러 번 내려받지 않도록
+# 헤더 점검 · src_id 인덱스 · 변경 비교가 같은 스냅샷을 공유한다.
+# 로컬 인덱스 캐시(src_id 순서 + A~N 해시)가 시트의 src_id 열과 일치하면 전체 읽기 없이
+# 헤더 행 + src_id 열만 읽고 비교한다. (수기 행 추가/삭제 등으로 어긋나면 전체 읽기로 폴백)
 
-    반환: (ok, inserted_count, updated_count)
+YOUTOO_INDEX_CACHE_PATH = (os.getenv("YOUTOO_INDEX_CACHE_PATH") or "youtoo_index_cache.json").strip()
+# 사람이 A~N을 직접 고친 경우를 위해 캐시는 일정 시간 후 만료(전체 읽기로 재검증)
+YOUTOO_INDEX_CACHE_TTL_SEC = max(0, int(os.getenv("YOUTOO_INDEX_CACHE_TTL_SEC", "21600")))
 
-    - src_id 기준으로 중복을 판단한다.
-    - 이미 존재하면 A~N(자동 수집 컬럼)만 갱신한다.
-    - 현재 시트 값과 동일한 행은 업데이트를 생략한다.
-    - 기존 행 업데이트는 batch_update로 묶어서 처리해 Google Sheets write quota를 아낀다.
-    - 신규는 insert_rows(row=2) 1회로 상단 삽입한다.
-    - 본문20자미만 행의 노란색 표시도 유지한다.
-    """
-    if not rows:
-        return True, 0, 0
 
-    ws = get_youtoo_ws()
-    if not ws:
-        return False, 0, 0
+def _youtoo_auto_hash(auto_values: list[str]) -> str:
+    joined = "\x1f".join(str(v or "") for v in auto_values)
+    return _hashlib.sha1(joined.encode("utf-8")).hexdigest()
 
-    ensure_youtoo_header(ws)
 
+def _youtoo_index_cache_load() -> dict | None:
     try:
-        values = ws.get_all_values()
-    except Exception:
-        values = []
+        with open(YOUTOO_INDEX_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[GSHEET][YOUTOO] 인덱스 캐시 로드 실패(무시): {e}")
+        return None
+    if not isinstance(data, dict) or data.get("sheet") != YOUTOO_SHEET_NAME:
+        return None
+    if not isinstance(data.get("src_ids"), list) or not isinstance(data.get("hashes"), dict):
+        return None
+    if time.time() - float(data.get("saved_at") or 0) > YOUTOO_INDEX_CACHE_TTL_SEC:
+        return None
+    return data
 
-    if not values:
+
+def _youtoo_index_cache_save(src_ids: list[str], hashes: dict[str, str]) -> None:
+    tmp = YOUTOO_INDEX_CACHE_PATH + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {"sheet": YOUTOO_SHEET_NAME, "saved_at": time.time(), "src_ids": src_ids, "hashes": hashes},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp, YOUTOO_INDEX_CACHE_PATH)
+    except Exception as e:
+        print(f"[GSHEET][YOUTOO] 인덱스 캐시 저장 실패(무시): {e}")
+
+
+def _youtoo_index_cache_clear() -> None:
+    try:
+        os.remove(YOUTOO_INDEX_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[GSHEET][YOUTOO] 인덱스 캐시 삭제 실패(무시): {e}")
+
+
+class YoutooSheetSnapshot:
+    """youtoo 탭의 한 시점 상태.
+
+    - src_ids: 2행부터의 src_id 열(시트 순서 그대로, 빈 칸 포함)
+    - index: src_id -> (row_number(1-indexed), A~N 해시)  ※ 중복 src_id는 첫 행 기준
+    - from_cache=True 이면 전체 값을 읽지 않고 로컬 캐시의 해시로 비교한다.
+    """
+
+    def __init__(self, src_ids: list[str], hashes: dict[str, str], *, from_cache: bool):
+        self.src_ids = src_ids
+        self.from_cache = from_cache
+        self.index: dict[str, tuple[int, str]] = {}
+        for i, sid in enumerate(src_ids, start=2):
+            if sid and sid not in self.index and sid in hashes:
+                self.index[sid] = (i, hashes[sid])
+
+    @classmethod
+    def from_values(cls, values: list[list[str]]) -> "YoutooSheetSnapshot":
+        header = [str(c).strip() for c in (values[0] if values else [])]
         try:
-            await _youtoo_gsheet_call_with_backoff(
-                "header.update",
-                ws.update,
-                range_name="A1",
-                values=[YOUTOO_HEADER],
-                value_input_option="RAW",
+            idx_src = header.index("src_id")
+        except ValueError:
+            idx_src = 0
+        auto_len = len(YOUTOO_AUTO_HEADER)
+        src_ids: list[str] = []
+        hashes: dict[str, str] = {}
+        for row in values[1:]:
+            sid = (row[idx_src] if len(row) > idx_src else "") or ""
+            sid = sid.strip()
+            src_ids.append(sid)
+            if sid and sid not in hashes:
+                auto = list(row[:auto_len]) + [""] * max(0, auto_len - len(row))
+                hashes[sid] = _youtoo_auto_hash(auto)
+        return cls(src_ids, hashes, from_cache=False)
+
+    def hashes(self) -> dict[str, str]:
+        return {sid: h for sid, (_, h) in self.index.items()}
+
+
+async def _youtoo_load_snapshot(ws) -> YoutooSheetSnapshot | None:
+    """업서트용 스냅샷을 만든다. (가능하면 헤더+src_id 열만, 아니면 전체 1회 읽기)"""
+    cache = _youtoo_index_cache_load()
+    if cache is not None:
+        try:
+            header_rng, src_rng = await _youtoo_gsheet_call_with_backoff(
+                "snapshot.batch_get",
+                ws.batch_get,
+                ["1:1", "A2:A"],
             )
+            header = [str(c).strip() for c in ((header_rng or [[]])[0] or [])]
+            src_col = [str((r or [""])[0] if r else "").strip() for r in (src_rng or [])]
+            while src_col and not src_col[-1]:
+                src_col.pop()
+            if header[: len(YOUTOO_HEADER)] == YOUTOO_HEADER and src_col == list(cache["src_ids"]):
+                return YoutooSheetSnapshot(src_col, dict(cache["hashes"]), from_cache=True)
+            print("[GSHEET][YOUTOO] 인덱스 캐시 불일치 → 전체 읽기")
         except Exception as e:
-            print(f"[GSHEET][YOUTOO] header update 실패: {e}")
-            return False, 0, 0
-        values = [YOUTOO_HEADER]
+            print(f"[GSHEET][YOUTOO] 헤더/src_id 열 읽기 실패 → 전체 읽기: {e}")
 
-    header = [str(c).strip() for c in values[0]]
     try:
-        idx_src = header.index("src_id")
-    except ValueError:
-        idx_src = 0
+        values = await _youtoo_gsheet_call_with_backoff("snapshot.get_all_values", ws.get_all_values)
+    except Exception as e:
+        print(f"[GSHEET][YOUTOO] 시트 읽기 실패: {e}")
+        return None
 
-    auto_len = len(YOUTOO_AUTO_HEADER)
+    try:
+        values = await asyncio.to_thread(ensure_youtoo_header, ws, values)
+    except Exception as e:
+        print(f"[GSHEET][YOUTOO] 헤더 점검 실패: {e}")
+        return None
+    return YoutooSheetSnapshot.from_values(values)
 
-    # src_id -> (row_number(1-indexed), current_auto_values)
-    existing_map: dict[str, tuple[int, list[str]]] = {}
-    for i, row in enumerate(values[1:], start=2):
-        if len(row) <= idx_src:
-            continue
-        sid = (row[idx_src] or "").strip()
-        if (not sid) or (sid in existing_map):
-            continue
-        current_auto = list(row[:auto_len])
-        if len(current_auto) < auto_len:
-            current_auto += [""] * (auto_len - len(current_auto))
-        existing_map[sid] = (i, current_auto)
+
+async def upsert_youtoo_rows_top(rows: list[list[str]]) -> tuple[bool, int, int]:
+    """youtoo 시트에 rows를 upsert 하되, ✅ 신규는 2행(헤더 아래)에 삽입해서 '위로 업데이트'되게 만든다.
+
+    반환: (ok, inserted_count, updated_count)
+
+    - src_id 기준으로 중복을 판단한다.
+    - 이미 존재하면 A~N(자동 수집 컬럼)만 갱신한다.
+    - 현재 시트 값과 동일한 행은 업데이트를 생략한다.
+    - 기존 행 업데이트는 batch_update로 묶어서 처리해 Google Sheets write quota를 아낀다.
+    - 신규는 insert_rows(row=2) 1회로 상단 삽입한다.
+    - 본문20자미만 행의 노란색 표시도 유지한다.
+    - 헤더 점검/인덱스/비교는 YoutooSheetSnapshot 하나를 공유한다. (전체 읽기 최대 1회, 캐시 적중 시 0회)
+    """
+    if not rows:
+        return True, 0, 0
+
+    ws = get_youtoo_ws(ensure_header=False)
+    if not ws:
+        return False, 0, 0
+
+    snap = await _youtoo_load_snapshot(ws)
+    if snap is None:
+        return False, 0, 0
+
+    # src_id는 항상 A열(헤더 점검 이후)
+    idx_src = 0
+    auto_len = len(YOUTOO_AUTO_HEADER)
+    existing_map = snap.index
+    new_hashes = snap.hashes()
 
     updated = 0
     inserted = 0
@@ -9058,10 +11508,11 @@ async def upsert_youtoo_rows_top(rows: list[list[str]]) -> tuple[bool, int, int]
         seen.add(sid)
 
         rr_auto = rr[:auto_len]
+        rr_hash = _youtoo_auto_hash(rr_auto)
         is_short = _youtoo_is_short_row(rr)
         if sid in existing_map:
-            row_num, current_auto = existing_map[sid]
-            if current_auto == rr_auto:
+            row_num, current_hash = existing_map[sid]
+            if current_hash == rr_hash:
                 continue
             updates.append((
                 {
@@ -9089,6 +11540,8 @@ async def upsert_youtoo_rows_top(rows: list[list[str]]) -> tuple[bool, int, int]
                 )
                 updated += len(chunk)
                 updated_row_states.extend((row_num, is_short) for _, _, row_num, is_short in chunk)
+                for item, sid, _, _ in chunk:
+                    new_hashes[sid] = _youtoo_auto_hash(item["values"][0])
             except Exception as batch_err:
                 print(f"[GSHEET][YOUTOO] batch_update 실패 → 단건 폴백: {batch_err}")
                 for item, sid, row_num, is_short in chunk:
@@ -9102,6 +11555,7 @@ async def upsert_youtoo_rows_top(rows: list[list[str]]) -> tuple[bool, int, int]
                         )
                         updated += 1
                         updated_row_states.append((row_num, is_short))
+                        new_hashes[sid] = _youtoo_auto_hash(item["values"][0])
                     except Exception as e:
                         print(f"[GSHEET][YOUTOO] update 실패(src_id={sid}): {e}")
 
@@ -9123,9 +11577,16 @@ async def upsert_youtoo_rows_top(rows: list[list[str]]) -> tuple[bool, int, int]
             await _youtoo_apply_row_backgrounds(ws, inserted_row_states)
         except Exception as e:
             print(f"[GSHEET][YOUTOO] insert_rows 오류: {e}")
+            _youtoo_index_cache_clear()
             return False, inserted, updated
 
-    print(f"[GSHEET][YOUTOO] {YOUTOO_SHEET_NAME}: inserted={inserted}, updated={updated}")
+    # 다음 upsert가 전체 읽기 없이 비교할 수 있도록 인덱스 캐시 갱신
+    inserted_ids = [(rr[idx_src] or "").strip() for rr in to_insert]
+    for rr in to_insert:
+        new_hashes[(rr[idx_src] or "").strip()] = _youtoo_auto_hash(rr[:auto_len])
+    _youtoo_index_cache_save(inserted_ids + snap.src_ids, new_hashes)
+
+    print(f"[GSHEET][YOUTOO] {YOUTOO_SHEET_NAME}: inserted={inserted}, updated={updated} (cache={'hit' if snap.from_cache else 'miss'})")
     return True, inserted, updated
 
 # ───────────────── 네이버 카페(웹 API) 게시글 수집 → youtoo 시트 저장 ─────────────────
@@ -9272,6 +11733,52 @@ def _get_naver_web_cookie() -> str:
     ck = " ".join(ck.splitlines()).strip()
     return ck
 
+# ───────── 네이버 웹 API 요청 제한(쿠키 단위) ─────────
+# 같은 쿠키(=같은 계정)로 나가는 요청은 명령어/작업이 달라도 하나의 한도를 공유한다.
+# - NAVER_WEB_COOKIE_CONCURRENCY : 쿠키당 동시 요청 수
+# - NAVER_WEB_COOKIE_RPS         : 쿠키당 초당 요청 시작 수(0이면 제한 없음)
+NAVER_WEB_COOKIE_CONCURRENCY = max(1, int(os.getenv("NAVER_WEB_COOKIE_CONCURRENCY", "6")))
+NAVER_WEB_COOKIE_RPS = max(0.0, float(os.getenv("NAVER_WEB_COOKIE_RPS", "8")))
+
+
+class _NaverCookieLimiter:
+    def __init__(self, concurrency: int, rps: float):
+        self.sem = asyncio.Semaphore(max(1, concurrency))
+        self.min_interval = (1.0 / rps) if rps > 0 else 0.0
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def wait_turn(self) -> None:
+        if self.min_interval <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.min_interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_NAVER_COOKIE_LIMITERS: dict[str, _NaverCookieLimiter] = {}
+
+
+def _naver_cookie_limiter(cookie: str) -> _NaverCookieLimiter:
+    key = _hashlib.sha1((cookie or "").encode("utf-8")).hexdigest()
+    lim = _NAVER_COOKIE_LIMITERS.get(key)
+    if lim is None:
+        lim = _NaverCookieLimiter(NAVER_WEB_COOKIE_CONCURRENCY, NAVER_WEB_COOKIE_RPS)
+        _NAVER_COOKIE_LIMITERS[key] = lim
+    return lim
+
+
+async def _naver_limited_get(client: httpx.AsyncClient, url: str, *, cookie: str | None = None, **kwargs) -> httpx.Response:
+    """쿠키 단위 동시성/속도 제한을 지키며 GET."""
+    lim = _naver_cookie_limiter(_get_naver_web_cookie() if cookie is None else cookie)
+    async with lim.sem:
+        await lim.wait_turn()
+        return await client.get(url, **kwargs)
+
+
 def _naver_web_headers(cafe_id: str, menu_id: str) -> dict[str, str]:
     cookie = _get_naver_web_cookie()
     ua = (
@@ -9333,7 +11840,7 @@ async def _fetch_cafe_boardlist_page(
         "viewType": (view_type or "L"),
     }
     headers = _naver_web_headers(cafe_id, menu_id)
-    r = await client.get(url, params=params, headers=headers, timeout=20.0)
+    r = await _naver_limited_get(client, url, params=params, headers=headers, timeout=20.0)
     snippet = (r.text or "")[:500]
     if not (200 <= r.status_code < 300):
         return r.status_code, None, snippet
@@ -9343,6 +11850,120 @@ async def _fetch_cafe_boardlist_page(
         return r.status_code, None, snippet
 
 
+# ───────── 게시판 목록 미리보기(fast path) ─────────
+# 일부 viewType(카드형 등)은 목록 item에 본문 요약/미리보기 필드를 함께 내려준다.
+# 미리보기가 잘리지 않은(=본문 전체인) 글만 본문 API(_fetch_article_body_text, URL 후보 여러 개)를 생략한다.
+# 잘린 미리보기는 저장할 본문/글자수가 달라지므로 항상 본문 API로 다시 가져온다.
+# - NAVER_CAFE_PREVIEW_VIEW_TYPE : 미리보기를 요청할 viewType(기본 C, 비우면 기능 끔)
+# - NAVER_CAFE_PREVIEW_TRUNC_LEN : 미리보기가 이 길이 이상이면 잘린 것으로 간주
+NAVER_CAFE_PREVIEW_VIEW_TYPE = (os.getenv("NAVER_CAFE_PREVIEW_VIEW_TYPE", "C") or "").strip()
+NAVER_CAFE_PREVIEW_TRUNC_LEN = max(1, int(os.getenv("NAVER_CAFE_PREVIEW_TRUNC_LEN", "100")))
+_BOARDLIST_PREVIEW_KEYS = ("summary", "contents", "content", "previewContent", "articleSummary", "text")
+
+# 미리보기 viewType이 정상 응답인데도 쓸 수 없던 게시판(cafe_id, menu_id) → 이후엔 기본 viewType만 사용
+# (일시적인 5xx/타임아웃은 기록하지 않고 그 요청만 기본 viewType으로 다시 받는다)
+_BOARDLIST_PREVIEW_UNSUPPORTED: set[tuple[str, str]] = set()
+
+
+def _boardlist_has_core_fields(data: dict | None) -> bool:
+    """목록 응답이 기존 로직에 필요한 필드(articleId/작성시각)를 갖췄는지. (빈 목록도 정상)"""
+    result = data.get("result") if isinstance(data, dict) else None
+    article_list = (result or {}).get("articleList") if isinstance(result, dict) else None
+    if not isinstance(article_list, list):
+        return False
+    for entry in article_list:
+        item = entry.get("item") if isinstance(entry, dict) else None
+        if isinstance(item, dict):
+            return bool(item.get("articleId")) and item.get("writeDateTimestamp") is not None
+    return True
+
+
+def _boardlist_has_preview_fields(data: dict | None) -> bool:
+    """목록 item 중 하나라도 미리보기 필드를 갖고 있으면 True. (빈 목록은 판단 보류 → True)"""
+    result = data.get("result") if isinstance(data, dict) else None
+    article_list = (result or {}).get("articleList") if isinstance(result, dict) else None
+    items = [e.get("item") for e in (article_list or []) if isinstance(e, dict) and isinstance(e.get("item"), dict)]
+    if not items:
+        return True
+    return any(_boardlist_item_preview(it) is not None for it in items)
+
+
+async def _fetch_cafe_boardlist_page_preview(
+    client: httpx.AsyncClient,
+    *,
+    cafe_id: str,
+    menu_id: str,
+    page: int,
+    page_size: int,
+    sort_by: str,
+    view_type: str,
+) -> tuple[int, dict | None, str]:
+    """미리보기 필드가 있는 viewType으로 먼저 요청하고, 거부되면 기본 viewType으로 다시 요청한다."""
+    key = (str(cafe_id), str(menu_id))
+    rich_view = NAVER_CAFE_PREVIEW_VIEW_TYPE
+    if rich_view and rich_view != view_type and key not in _BOARDLIST_PREVIEW_UNSUPPORTED:
+        try:
+            status, data, snippet = await _fetch_cafe_boardlist_page(
+                client,
+                cafe_id=cafe_id,
+                menu_id=menu_id,
+                page=page,
+                page_size=page_size,
+                sort_by=sort_by,
+                view_type=rich_view,
+            )
+        except Exception as e:
+            status, data, snippet = 0, None, f"EXC:{type(e).__name__}: {e}"
+
+        if status in (401, 403):
+            return status, data, snippet
+        if isinstance(data, dict):
+            # 정상 응답: 핵심 필드가 없거나 미리보기 필드가 없으면 이 게시판은 기본 viewType만 사용
+            if _boardlist_has_core_fields(data):
+                if not _boardlist_has_preview_fields(data):
+                    print(f"[NAVER] viewType={rich_view} 목록에 미리보기 필드 없음(menuId={menu_id}) → 이후 viewType={view_type}")
+                    _BOARDLIST_PREVIEW_UNSUPPORTED.add(key)
+                return status, data, snippet
+            print(f"[NAVER] viewType={rich_view} 목록 형식 불일치(menuId={menu_id}) → 이후 viewType={view_type}")
+            _BOARDLIST_PREVIEW_UNSUPPORTED.add(key)
+        else:
+            print(f"[NAVER] viewType={rich_view} 목록 실패(HTTP {status}, menuId={menu_id}) → 이번만 viewType={view_type}")
+
+    return await _fetch_cafe_boardlist_page(
+        client,
+        cafe_id=cafe_id,
+        menu_id=menu_id,
+        page=page,
+        page_size=page_size,
+        sort_by=sort_by,
+        view_type=view_type,
+    )
+
+
+def _boardlist_item_preview(item: dict) -> tuple[str, bool] | None:
+    """목록 item의 본문 미리보기. (text, truncated) / 미리보기 필드가 없으면 None"""
+    if not isinstance(item, dict):
+        return None
+    for k in _BOARDLIST_PREVIEW_KEYS:
+        v = item.get(k)
+        if isinstance(v, str) and v.strip():
+            raw = v.strip()
+            text = _clean_naver_article_text(raw)
+            truncated = raw.endswith(("…", "...")) or len(raw) >= NAVER_CAFE_PREVIEW_TRUNC_LEN
+            if truncated:
+                text = re.sub(r"(?:…|\.\.\.)\s*$", "", text).rstrip()
+            return text, truncated
+    return None
+
+
+def _preview_full_text(preview: tuple[str, bool] | None) -> str | None:
+    """잘리지 않은 미리보기(=본문 전체)면 그 텍스트, 아니면 None(본문 API 필요)."""
+    if preview is None:
+        return None
+    text, truncated = preview
+    return None if truncated else text
+
+
 async def _fetch_first_comment(
     client: httpx.AsyncClient,
     *,
@@ -9375,7 +11996,7 @@ async def _fetch_first_comment(
 
     for url in _build_comment_url_candidates(cafe_id, str(article_id)):
         try:
-            r = await client.get(url, headers=headers, timeout=15.0)
+            r = await _naver_limited_get(client, url, cookie=cookie, headers=headers, timeout=15.0)
         except Exception:
             continue
 
@@ -9590,7 +12211,7 @@ async def _fetch_article_body_text(
 
     for url in _build_article_url_candidates(cafe_id, article_id, menu_id):
         try:
-            r = await client.get(url, headers=headers, timeout=15.0)
+            r = await _naver_limited_get(client, url, headers=headers, timeout=15.0)
         except Exception:
             continue
 
@@ -9677,6 +12298,207 @@ def _parse_youtoo_args(raw_args: list[str], *, single_page: bool = False) -> tup
     return start_page, pages, page_size, cafe_id, menu_id
 
 
+# /youtoo 글 단위 상세(본문/첫 댓글) 병렬 수집 개수
+YOUTOO_FETCH_CONCURRENCY = max(1, int(os.getenv("YOUTOO_FETCH_CONCURRENCY", "6")))
+
+
+def _youtoo_list_item_meta(item, *, cafe_id: str, menu_id: str) -> dict | None:
+    """게시판 목록 item → 행 조립에 필요한 메타 정보."""
+    if not isinstance(item, dict):
+        return None
+    article_id = item.get("articleId")
+    if not article_id:
+        return None
+
+    comment_cnt = item.get("commentCount")
+    if comment_cnt is None:
+        comment_cnt = item.get("replyArticleCount")
+    writer = item.get("writerInfo") if isinstance(item.get("writerInfo"), dict) else {}
+
+    return {
+        "article_id": str(article_id),
+        "src_id": f"navercafe:{cafe_id}:{menu_id}:{article_id}",
+        "subject": str(item.get("subject") or "").strip(),
+        "comment_cnt": str(comment_cnt or 0),
+        "read_cnt": str(item.get("readCount") or 0),
+        "like_cnt": str(item.get("likeCount") or 0),
+        "nick": str((writer or {}).get("nickName") or "").strip(),
+        "posted_at": _ms_to_kst_str(item.get("writeDateTimestamp")),
+        "preview": _boardlist_item_preview(item),
+        "last_update": str(
+            item.get("lastUpdateDate")
+            or item.get("lastUpdateTimestamp")
+            or item.get("updateDateTimestamp")
+            or item.get("updateDate")
+            or ""
+        ),
+    }
+
+
+async def _youtoo_fetch_detail(
+    client: httpx.AsyncClient,
+    meta: dict,
+    *,
+    cafe_id: str,
+    menu_id: str,
+    cookie: str,
+) -> dict:
+    """글 하나의 첫 댓글 + 본문을 동시에 가져온다."""
+    article_id = meta["article_id"]
+
+    async def _comment() -> tuple[str, str, str]:
+        # 첫 댓글(있을 때만 추가 호출)
+        try:
+            cc = int(str(meta.get("comment_cnt") or 0))
+        except Exception:
+            cc = 0
+        if cc <= 0:
+            return ("", "", "")
+        return await _fetch_first_comment(client, cafe_id=cafe_id, article_id=article_id, cookie=cookie)
+
+    async def _body() -> tuple[str, bool]:
+        # 본문(20자 미만 여부 판정용) - 목록 미리보기가 본문 전체면 본문 API 생략
+        full = _preview_full_text(meta.get("preview"))
+        if full is not None:
+            return full, True
+        try:
+            return await _fetch_article_body_text(client, cafe_id=cafe_id, menu_id=menu_id, article_id=article_id)
+        except Exception as e:
+            print(f"[YOUTOO] 본문 추출 실패(article_id={article_id}): {e}")
+            return "", False
+
+    (first_comment, first_nick, first_time), (body_text, body_ok) = await asyncio.gather(_comment(), _body())
+    return {
+        "first_comment": first_comment,
+        "first_comment_nick": first_nick,
+        "first_comment_time": first_time,
+        "body_text": body_text,
+        "body_ok": body_ok,
+    }
+
+
+async def _youtoo_fetch_details(
+    client: httpx.AsyncClient,
+    metas: list[dict],
+    *,
+    cafe_id: str,
+    menu_id: str,
+    cookie: str,
+) -> list[dict]:
+    """metas 순서대로 상세 결과 리스트를 돌려준다. (YOUTOO_FETCH_CONCURRENCY개씩 병렬)"""
+    sem = asyncio.Semaphore(YOUTOO_FETCH_CONCURRENCY)
+
+    async def _one(meta: dict) -> dict:
+        async with sem:
+            try:
+                return await _youtoo_fetch_detail(client, meta, cafe_id=cafe_id, menu_id=menu_id, cookie=cookie)
+            except Exception as e:
+                print(f"[YOUTOO] 상세 수집 실패(article_id={meta.get('article_id')}): {e}")
+                return {"first_comment": "", "first_comment_nick": "", "first_comment_time": "", "body_text": "", "body_ok": False}
+
+    return list(await asyncio.gather(*[_one(m) for m in metas]))
+
+
+# ───────── youtoo 증분 수집: 글 단위 지문(fingerprint) 저장소 ─────────
+# src_id → 마지막으로 본 commentCount / lastUpdate + 그때 가져온 첫 댓글·본문 미리보기.
+# 목록 메타(commentCount, lastUpdate)가 그대로면 본문/첫 댓글 호출을 생략하고
+# 조회수/좋아요 등 카운터만 목록 값으로 갱신한다. (/youtoo ... full 로 강제 전체 수집)
+YOUTOO_FINGERPRINT_PATH = (os.getenv("YOUTOO_FINGERPRINT_PATH") or "youtoo_fingerprints.json").strip()
+YOUTOO_FINGERPRINT_MAX = max(100, int(os.getenv("YOUTOO_FINGERPRINT_MAX", "5000")))
+
+
+def _youtoo_fingerprint_load() -> dict[str, dict]:
+    try:
+        with open(YOUTOO_FINGERPRINT_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"[YOUTOO] 지문 저장소 로드 실패(무시): {e}")
+        return {}
+
+
+def _youtoo_fingerprint_save(store: dict[str, dict]) -> None:
+    # 오래 안 보인 글부터 정리
+    if len(store) > YOUTOO_FINGERPRINT_MAX:
+        keep = sorted(store.items(), key=lambda kv: float(kv[1].get("seen_at") or 0), reverse=True)
+        store = dict(keep[:YOUTOO_FINGERPRINT_MAX])
+    tmp = YOUTOO_FINGERPRINT_PATH + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(store, f, ensure_ascii=False)
+        os.replace(tmp, YOUTOO_FINGERPRINT_PATH)
+    except Exception as e:
+        print(f"[YOUTOO] 지문 저장소 저장 실패(무시): {e}")
+
+
+def _youtoo_fingerprint_detail(store: dict[str, dict], meta: dict) -> dict | None:
+    """목록 메타가 지난번과 같으면 저장된 상세를 돌려준다. (다르거나 없으면 None)"""
+    fp = store.get(meta["src_id"])
+    if not isinstance(fp, dict) or not fp.get("body_ok"):
+        return None
+    if str(fp.get("comment_cnt")) != meta["comment_cnt"] or str(fp.get("last_update") or "") != meta["last_update"]:
+        return None
+    return {
+        "first_comment": fp.get("first_comment") or "",
+        "first_comment_nick": fp.get("first_comment_nick") or "",
+        "first_comment_time": fp.get("first_comment_time") or "",
+        "body_text": fp.get("body_text") or "",
+        "body_len": int(fp.get("body_len") or 0),
+        "body_ok": True,
+    }
+
+
+def _youtoo_fingerprint_update(store: dict[str, dict], meta: dict, detail: dict) -> None:
+    body_ok = bool(detail.get("body_ok"))
+    body_text = detail.get("body_text") or ""
+    body_len = detail["body_len"] if "body_len" in detail else (_youtoo_effective_body_len(body_text) if body_ok else 0)
+    store[meta["src_id"]] = {
+        "comment_cnt": meta["comment_cnt"],
+        "last_update": meta["last_update"],
+        "first_comment": detail.get("first_comment") or "",
+        "first_comment_nick": detail.get("first_comment_nick") or "",
+        "first_comment_time": detail.get("first_comment_time") or "",
+        "body_text": _youtoo_trim_body_preview(body_text) if body_ok else "",
+        "body_len": body_len,
+        "body_ok": body_ok,
+        "seen_at": time.time(),
+    }
+
+
+def _youtoo_build_row(meta: dict, detail: dict) -> tuple[list[str], bool, bool]:
+    """(youtoo 자동 수집 행, body_ok, body_short)"""
+    body_text = detail.get("body_text") or ""
+    body_ok = bool(detail.get("body_ok"))
+    body_len = 0
+    body_short = ""
+    if body_ok:
+        # 지문 저장소에서 재사용한 상세는 이미 잘린 미리보기 + 원래 길이를 들고 있다.
+        body_len = detail["body_len"] if "body_len" in detail else _youtoo_effective_body_len(body_text)
+        body_text = _youtoo_trim_body_preview(body_text)
+        if body_len < YOUTOO_SHORT_BODY_MIN_LEN:
+            body_short = "Y"
+
+    row = [
+        meta["src_id"],
+        meta["subject"],
+        meta["comment_cnt"],
+        meta["read_cnt"],
+        meta["like_cnt"],
+        f"{NAVER_CAFE_BASE_URL}/{meta['article_id']}",
+        detail.get("first_comment") or "",
+        detail.get("first_comment_nick") or "",
+        detail.get("first_comment_time") or "",
+        meta["posted_at"],
+        meta["nick"],
+        body_text,
+        str(body_len) if body_ok else "",
+        body_short,
+    ]
+    return row, body_ok, bool(body_short)
+
+
 async def _run_youtoo_collect(update: Update, context: ContextTypes.DEFAULT_TYPE, *, single_page: bool = False):
     if not is_admin(update):
         await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
@@ -9704,15 +12526,19 @@ async def _run_youtoo_collect(update: Update, context: ContextTypes.DEFAULT_TYPE
         f"잠시만 기다려 주세요..."
     )
 
-    ws = get_youtoo_ws()
+    ws = get_youtoo_ws(ensure_header=False)
     if not ws:
         await update.message.reply_text("구글시트(youtoo 탭) 준비에 실패했습니다. SPREADSHEET_ID/권한을 확인하세요.")
         return
 
     new_rows: list[list[str]] = []
+    metas: list[dict] = []
     seen: set[str] = set()
     short_body_rows = 0
     body_fetch_fail = 0
+    unchanged_count = 0
+    force_full = any((a or "").strip().lower() in ("full", "전체") for a in (context.args or []))
+    fp_store = _youtoo_fingerprint_load()
 
     sort_by = NAVER_CAFE_WEB_SORT_BY
     view_type = NAVER_CAFE_WEB_VIEW_TYPE
@@ -9720,7 +12546,7 @@ async def _run_youtoo_collect(update: Update, context: ContextTypes.DEFAULT_TYPE
     try:
         async with httpx.AsyncClient(follow_redirects=True) as client:
             for p in range(start_page, start_page + pages):
-                status, data, snippet = await _fetch_cafe_boardlist_page(
+                status, data, snippet = await _fetch_cafe_boardlist_page_preview(
                     client,
                     cafe_id=cafe_id,
                     menu_id=menu_id,
@@ -9754,91 +12580,39 @@ async def _run_youtoo_collect(update: Update, context: ContextTypes.DEFAULT_TYPE
                 for entry in article_list:
                     if not isinstance(entry, dict):
                         continue
-                    item = entry.get("item")
-                    if not isinstance(item, dict):
-                        continue
-
-                    article_id = item.get("articleId")
-                    if not article_id:
-                        continue
-
-                    src_id = f"navercafe:{cafe_id}:{menu_id}:{article_id}"
-                    if src_id in seen:
+                    meta = _youtoo_list_item_meta(entry.get("item"), cafe_id=cafe_id, menu_id=menu_id)
+                    if not meta or meta["src_id"] in seen:
                         continue
-                    seen.add(src_id)
-
-                    subject = str(item.get("subject") or "").strip()
-                    comment_cnt = item.get("commentCount")
-                    if comment_cnt is None:
-                        comment_cnt = item.get("replyArticleCount")
-                    comment_cnt = str(comment_cnt or 0)
+                    seen.add(meta["src_id"])
+                    metas.append(meta)
 
-                    writer = item.get("writerInfo") if isinstance(item.get("writerInfo"), dict) else {}
-                    nick = str((writer or {}).get("nickName") or "").strip()
-
-                    posted_at = _ms_to_kst_str(item.get("writeDateTimestamp"))
-                    read_cnt = str(item.get("readCount") or 0)
-                    like_cnt = str(item.get("likeCount") or 0)
-
-                    # 첫 댓글(있을 때만 추가 호출)
-                    first_comment = ""
-                    first_comment_nick = ""
-                    first_comment_time = ""
-                    try:
-                        _cc = int(str(comment_cnt))
-                    except Exception:
-                        _cc = 0
-                    if _cc > 0:
-                        first_comment, first_comment_nick, first_comment_time = await _fetch_first_comment(
-                            client,
-                            cafe_id=cafe_id,
-                            article_id=str(article_id),
-                            cookie=cookie,
-                        )
+            # 목록 메타가 그대로인 글은 지난번 상세를 재사용(카운터만 갱신)
+            details: list[dict | None] = [
+                None if force_full else _youtoo_fingerprint_detail(fp_store, m) for m in metas
+            ]
+            changed_idx = [i for i, d in enumerate(details) if d is None]
+            unchanged_count = len(metas) - len(changed_idx)
 
-                    # 본문(20자 미만 여부 판정용)
-                    body_text = ""
-                    body_len = 0
-                    body_short = ""
-                    body_ok = False
-                    try:
-                        body_text, body_ok = await _fetch_article_body_text(
-                            client,
-                            cafe_id=cafe_id,
-                            menu_id=menu_id,
-                            article_id=str(article_id),
-                        )
-                    except Exception as e:
-                        print(f"[YOUTOO] 본문 추출 실패(article_id={article_id}): {e}")
-                        body_text, body_ok = "", False
-
-                    if body_ok:
-                        body_len = _youtoo_effective_body_len(body_text)
-                        body_text = _youtoo_trim_body_preview(body_text)
-                        if body_len < YOUTOO_SHORT_BODY_MIN_LEN:
-                            body_short = "Y"
-                            short_body_rows += 1
-                    else:
-                        body_fetch_fail += 1
-
-                    link = f"{NAVER_CAFE_BASE_URL}/{article_id}"
-
-                    new_rows.append([
-                        src_id,
-                        subject,
-                        comment_cnt,
-                        read_cnt,
-                        like_cnt,
-                        link,
-                        first_comment,
-                        first_comment_nick,
-                        first_comment_time,
-                        posted_at,
-                        nick,
-                        body_text,
-                        str(body_len) if body_ok else "",
-                        body_short,
-                    ])
+            # 본문/첫 댓글은 글 단위로 병렬 수집(쿠키 단위 한도는 _naver_limited_get이 지킨다)
+            fetched = await _youtoo_fetch_details(
+                client,
+                [metas[i] for i in changed_idx],
+                cafe_id=cafe_id,
+                menu_id=menu_id,
+                cookie=cookie,
+            )
+            for i, d in zip(changed_idx, fetched):
+                details[i] = d
+
+        # 게시판 순서 그대로 행 재조립
+        for meta, detail in zip(metas, details):
+            _youtoo_fingerprint_update(fp_store, meta, detail)
+            row, body_ok, body_short = _youtoo_build_row(meta, detail)
+            if body_short:
+                short_body_rows += 1
+            if not body_ok:
+                body_fetch_fail += 1
+            new_rows.append(row)
 
         inserted = 0
         updated = 0
@@ -9847,12 +12621,14 @@ async def _run_youtoo_collect(update: Update, context: ContextTypes.DEFAULT_TYPE
             if not ok:
                 await update.message.reply_text("구글시트(youtoo)에 저장하지 못했습니다. 권한/시트 상태를 확인하세요.")
                 return
+        # 시트 저장까지 성공한 경우에만 지문을 남긴다(실패 시 다음 실행에서 다시 수집)
+        _youtoo_fingerprint_save(fp_store)
 
         await update.message.reply_text(
             f"✅ youtoo 수집 완료\n"
             f"- 신규 추가(상단): {inserted}건\n"
             f"- 기존 업데이트: {updated}건\n"
-            f"- 수집: {len(new_rows)}건\n"
+            f"- 수집: {len(new_rows)}건 (변경 없음·상세 생략 {unchanged_count}건)\n"
             f"- 본문 {YOUTOO_SHORT_BODY_MIN_LEN}자 미만(노란색): {short_body_rows}건\n"
             f"- 본문 추출 실패: {body_fetch_fail}건\n"
             f"- 대상 페이지: {page_desc} (pageSize={page_size})"
@@ -9874,6 +12650,7 @@ async def youtoo(update: Update, context: ContextTypes.DEFAULT_TYPE):
     - /youtoo page=2         -> 2페이지(1페이지만)
     - /youtoo page=2 pages=2 -> 2~3페이지
     - /youtoo menu=20        -> 메뉴ID를 바꿔서 수집(테스트/확장용)
+    - /youtoo 3 full         -> 변경 없는 글도 본문/첫 댓글을 다시 수집
     - /youtoo_page 5         -> 5페이지만 저장(별도 명령어)
     """
     return await _run_youtoo_collect(update, context, single_page=False)
@@ -10266,140 +13043,227 @@ async def rebuild_activity_summary(ws, *, target_day: date) -> int:
     return len(summary_rows)
 
 
-async def activitycrawl(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """/activitycrawl
-
-    자유게시판(16), 응원중계방(18), 한풀이 소통방(30), 소리벗고 빤쓰질러(19)의
-    어제 게시글을 수집해 '활동' 시트에 저장하고 G:H 취합표를 갱신한다.
-    """
-    if not is_admin(update):
-        await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
-        return
+# 활동 게시판 본문 병렬 수집 개수(게시판 전체 공유)
+ACTIVITY_BODY_CONCURRENCY = max(1, int(os.getenv("ACTIVITY_BODY_CONCURRENCY", "6")))
 
-    cookie = _get_naver_web_cookie()
-    if not cookie:
-        await update.message.reply_text(
-            "NAVER_COOKIE 환경변수가 비어있습니다.\n"
-            "Render 환경변수에 브라우저 쿠키 문자열을 넣어주세요."
-        )
-        return
 
-    cafe_id = NAVER_CAFE_WEB_CAFE_ID
-    target_day = _activity_target_yesterday()
-    target_label = target_day.strftime("%Y-%m-%d")
+class _ActivityCrawlError(Exception):
+    """게시판 수집을 중단해야 하는 오류(권한/응답 파싱 실패). 메시지는 그대로 사용자에게 보낸다."""
 
-    await update.message.reply_text(
-        f"네이버 카페 활동 게시글을 가져옵니다.\n"
-        f"- 대상 날짜: {target_label}\n"
-        f"- 게시판: {len(ACTIVITY_MENUS)}개\n"
-        f"잠시만 기다려 주세요..."
-    )
 
-    ws = get_activity_ws()
-    if not ws:
-        await update.message.reply_text("구글시트(활동 탭) 준비에 실패했습니다. SPREADSHEET_ID/권한을 확인하세요.")
-        return
+async def _activity_fetch_body(
+    client: httpx.AsyncClient,
+    *,
+    cafe_id: str,
+    menu_id: str,
+    article_id: str,
+    body_sem: asyncio.Semaphore,
+    preview: tuple[str, bool] | None = None,
+) -> tuple[str, bool]:
+    # 목록 미리보기가 본문 전체(잘리지 않음)일 때만 본문 API 생략
+    full = _preview_full_text(preview)
+    if full is not None:
+        return full, True
+    async with body_sem:
+        try:
+            return await _fetch_article_body_text(
+                client,
+                cafe_id=cafe_id,
+                menu_id=menu_id,
+                article_id=article_id,
+            )
+        except Exception as e:
+            print(f"[ACTIVITY] 본문 추출 실패(article_id={article_id}): {e}")
+            return "", False
 
-    rows: list[list[str]] = []
-    seen: set[str] = set()
-    scanned = 0
-    body_fail = 0
 
-    try:
+async def _activity_crawl_board(
+    client: httpx.AsyncClient,
+    *,
+    cafe_id: str,
+    menu_id: str,
+    board_name: str,
+    target_day: date,
+    body_sem: asyncio.Semaphore,
+) -> list[dict]:
+    """게시판 하나에서 target_day 글을 목록 순서대로 모은다.
+
+    - 목록 페이지는 순차로 넘기며(한 페이지가 전부 대상일보다 과거면 중단),
+      본문은 페이지를 읽는 즉시 병렬로 요청해 다음 페이지 목록 조회와 겹치게 한다.
+    """
+    items: list[dict] = []
+    body_tasks: list[asyncio.Task] = []
+    try:
+        for page in range(1, ACTIVITY_MAX_PAGES + 1):
+            status, data, snippet = await _fetch_cafe_boardlist_page_preview(
+                client,
+                cafe_id=cafe_id,
+                menu_id=menu_id,
+                page=page,
+                page_size=ACTIVITY_PAGE_SIZE,
+                sort_by=NAVER_CAFE_WEB_SORT_BY,
+                view_type=NAVER_CAFE_WEB_VIEW_TYPE,
+            )
+
+            if status in (401, 403):
+                raise _ActivityCrawlError(
+                    f"접근이 거부되었습니다. (HTTP {status}, menuId={menu_id})\n"
+                    "쿠키가 만료되었거나 해당 게시판 읽기 권한이 없을 수 있습니다."
+                )
+
+            if not data:
+                raise _ActivityCrawlError(
+                    f"게시판 '{board_name}' page={page} 응답 파싱에 실패했습니다.\n"
+                    f"(HTTP {status}) 응답 일부: {snippet}"
+                )
+
+            result = data.get("result") if isinstance(data, dict) else None
+            article_list = (result or {}).get("articleList") if isinstance(result, dict) else None
+            if not isinstance(article_list, list) or not article_list:
+                break
+
+            page_dates: list[date] = []
+            for entry in article_list:
+                if not isinstance(entry, dict):
+                    continue
+                item = entry.get("item")
+                if not isinstance(item, dict):
+                    continue
+
+                article_id = item.get("articleId")
+                if not article_id:
+                    continue
+
+                posted_at = _ms_to_kst_str(item.get("writeDateTimestamp"))
+                posted_day = _activity_posted_date(posted_at)
+                if posted_day:
+                    page_dates.append(posted_day)
+
+                # 어제 글만 수집
+                if posted_day != target_day:
+                    continue
+
+                writer = item.get("writerInfo") if isinstance(item.get("writerInfo"), dict) else {}
+                items.append({
+                    "src_id": f"activity:{cafe_id}:{menu_id}:{article_id}",
+                    "subject": str(item.get("subject") or "").strip(),
+                    "posted_at": posted_at,
+                    "nick": str((writer or {}).get("nickName") or "").strip(),
+                    "board_name": board_name,
+                })
+                body_tasks.append(asyncio.create_task(_activity_fetch_body(
+                    client,
+                    cafe_id=cafe_id,
+                    menu_id=menu_id,
+                    article_id=str(article_id),
+                    body_sem=body_sem,
+                    preview=_boardlist_item_preview(item),
+                )))
+
+            # TIME 정렬 기준으로 한 페이지가 전부 대상일보다 과거면 이후 페이지는 중단
+            if page_dates and all(d < target_day for d in page_dates):
+                break
+
+        bodies = await asyncio.gather(*body_tasks)
+    except BaseException:
+        for t in body_tasks:
+            t.cancel()
+        raise
+
+    for it, (body_text, body_ok) in zip(items, bodies):
+        it["body_text"] = body_text
+        it["body_ok"] = body_ok
+    return items
+
+
+async def activitycrawl(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """/activitycrawl
+
+    자유게시판(16), 응원중계방(18), 한풀이 소통방(30), 소리벗고 빤쓰질러(19)의
+    어제 게시글을 수집해 '활동' 시트에 저장하고 G:H 취합표를 갱신한다.
+    """
+    if not is_admin(update):
+        await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
+        return
+
+    cookie = _get_naver_web_cookie()
+    if not cookie:
+        await update.message.reply_text(
+            "NAVER_COOKIE 환경변수가 비어있습니다.\n"
+            "Render 환경변수에 브라우저 쿠키 문자열을 넣어주세요."
+        )
+        return
+
+    cafe_id = NAVER_CAFE_WEB_CAFE_ID
+    target_day = _activity_target_yesterday()
+    target_label = target_day.strftime("%Y-%m-%d")
+
+    await update.message.reply_text(
+        f"네이버 카페 활동 게시글을 가져옵니다.\n"
+        f"- 대상 날짜: {target_label}\n"
+        f"- 게시판: {len(ACTIVITY_MENUS)}개\n"
+        f"잠시만 기다려 주세요..."
+    )
+
+    ws = get_activity_ws()
+    if not ws:
+        await update.message.reply_text("구글시트(활동 탭) 준비에 실패했습니다. SPREADSHEET_ID/권한을 확인하세요.")
+        return
+
+    rows: list[list[str]] = []
+    seen: set[str] = set()
+    scanned = 0
+    body_fail = 0
+
+    try:
+        # 게시판 4개를 동시에 수집(쿠키 단위 동시성 한도는 _naver_limited_get이 공유)
+        body_sem = asyncio.Semaphore(ACTIVITY_BODY_CONCURRENCY)
         async with httpx.AsyncClient(follow_redirects=True) as client:
-            for menu_id, board_name in ACTIVITY_MENUS:
-                for page in range(1, ACTIVITY_MAX_PAGES + 1):
-                    status, data, snippet = await _fetch_cafe_boardlist_page(
+            board_results = await asyncio.gather(
+                *[
+                    _activity_crawl_board(
                         client,
                         cafe_id=cafe_id,
                         menu_id=menu_id,
-                        page=page,
-                        page_size=ACTIVITY_PAGE_SIZE,
-                        sort_by=NAVER_CAFE_WEB_SORT_BY,
-                        view_type=NAVER_CAFE_WEB_VIEW_TYPE,
+                        board_name=board_name,
+                        target_day=target_day,
+                        body_sem=body_sem,
                     )
+                    for menu_id, board_name in ACTIVITY_MENUS
+                ],
+                return_exceptions=True,
+            )
 
-                    if status in (401, 403):
-                        await update.message.reply_text(
-                            f"접근이 거부되었습니다. (HTTP {status}, menuId={menu_id})\n"
-                            "쿠키가 만료되었거나 해당 게시판 읽기 권한이 없을 수 있습니다."
-                        )
-                        return
+        # 순차 수집 때와 같은 순서(게시판 순서 → 목록 순서)로 합친 뒤 정렬해야 동률 순서까지 동일하다.
+        for res in board_results:
+            if isinstance(res, _ActivityCrawlError):
+                await update.message.reply_text(str(res))
+                return
+            if isinstance(res, BaseException):
+                raise res
 
-                    if not data:
-                        await update.message.reply_text(
-                            f"게시판 '{board_name}' page={page} 응답 파싱에 실패했습니다.\n"
-                            f"(HTTP {status}) 응답 일부: {snippet}"
-                        )
-                        return
+        for board_items in board_results:
+            for it in board_items:
+                if it["src_id"] in seen:
+                    continue
+                seen.add(it["src_id"])
+                scanned += 1
 
-                    result = data.get("result") if isinstance(data, dict) else None
-                    article_list = (result or {}).get("articleList") if isinstance(result, dict) else None
-                    if not isinstance(article_list, list) or not article_list:
-                        break
+                body_text, body_ok = it["body_text"], it["body_ok"]
+                if not body_ok:
+                    body_fail += 1
 
-                    page_dates: list[date] = []
-                    for entry in article_list:
-                        if not isinstance(entry, dict):
-                            continue
-                        item = entry.get("item")
-                        if not isinstance(item, dict):
-                            continue
-
-                        article_id = item.get("articleId")
-                        if not article_id:
-                            continue
-
-                        posted_at = _ms_to_kst_str(item.get("writeDateTimestamp"))
-                        posted_day = _activity_posted_date(posted_at)
-                        if posted_day:
-                            page_dates.append(posted_day)
-
-                        # 어제 글만 수집
-                        if posted_day != target_day:
-                            continue
-
-                        src_id = f"activity:{cafe_id}:{menu_id}:{article_id}"
-                        if src_id in seen:
-                            continue
-                        seen.add(src_id)
-                        scanned += 1
-
-                        writer = item.get("writerInfo") if isinstance(item.get("writerInfo"), dict) else {}
-                        nick = str((writer or {}).get("nickName") or "").strip()
-                        subject = str(item.get("subject") or "").strip()
-
-                        body_text = ""
-                        body_ok = False
-                        try:
-                            body_text, body_ok = await _fetch_article_body_text(
-                                client,
-                                cafe_id=cafe_id,
-                                menu_id=menu_id,
-                                article_id=str(article_id),
-                            )
-                        except Exception as e:
-                            print(f"[ACTIVITY] 본문 추출 실패(article_id={article_id}): {e}")
-                            body_ok = False
-
-                        if not body_ok:
-                            body_fail += 1
-
-                        content = _activity_trim_content(body_text or subject)
-                        char_count = _activity_effective_len(content)
-
-                        rows.append([
-                            src_id,
-                            content,
-                            str(char_count),
-                            board_name,
-                            posted_at,
-                            nick,
-                        ])
-
-                    # TIME 정렬 기준으로 한 페이지가 전부 대상일보다 과거면 이후 페이지는 중단
-                    if page_dates and all(d < target_day for d in page_dates):
-                        break
+                content = _activity_trim_content(body_text or it["subject"])
+                char_count = _activity_effective_len(content)
+
+                rows.append([
+                    it["src_id"],
+                    content,
+                    str(char_count),
+                    it["board_name"],
+                    it["posted_at"],
+                    it["nick"],
+                ])
 
         rows.sort(key=lambda r: (r[4] or ""), reverse=True)
         ok, inserted, updated = await upsert_activity_rows_top(rows)
@@ -10476,6 +13340,8 @@ QUIZ_GSHEET_BACKOFF_MAX_SEC = float(os.getenv("QUIZ_GSHEET_BACKOFF_MAX_SEC", "35
 # 댓글 수집 안전장치
 QUIZ_COMMENT_MAX_PAGES = int(os.getenv("QUIZ_COMMENT_MAX_PAGES", "200"))
 QUIZ_COMMENT_TIMEOUT_SEC = float(os.getenv("QUIZ_COMMENT_TIMEOUT_SEC", "18"))
+# 2페이지 이후 댓글 페이지 병렬 요청 수(쿠키 단위 한도는 _naver_limited_get이 별도로 지킨다)
+QUIZ_COMMENT_PAGE_CONCURRENCY = max(1, int(os.getenv("QUIZ_COMMENT_PAGE_CONCURRENCY", "4")))
 
 # 퀴즈 마감시간 기준
 # - B2:H2에는 시간만 입력한다. 예: 14:00
@@ -10504,6 +13370,15 @@ QUIZ_WITHDRAW_DB_SHEET_NAME = (os.getenv("QUIZ_WITHDRAW_DB_SHEET_NAME") or "탈
 QUIZ_UNMATCHED_BETRISE_NICK = (os.getenv("QUIZ_UNMATCHED_BETRISE_NICK") or "미가입").strip()
 QUIZ_WITHDRAWN_BETRISE_NICK = (os.getenv("QUIZ_WITHDRAWN_BETRISE_NICK") or "탈퇴회원").strip()
 
+# 회원 DB 매핑 캐시
+# - 같은 프로세스에서 QUIZ_MEMBER_DB_MEMO_SEC 이내 재호출은 시트를 전혀 읽지 않는다.
+# - 그 이후에는 세 DB에서 매핑에 쓰는 열만 읽어(values_batch_get 1회) 서명을 비교하고, 같으면 로컬 사본을 쓴다.
+#   다르면 같은 읽기 결과로 매핑을 다시 만든다. (탭 전체 get_all_values 없음)
+# - 서명이 같아도 QUIZ_MEMBER_DB_MAX_AGE_SEC가 지나면 매핑을 다시 만든다.
+QUIZ_MEMBER_DB_CACHE_PATH = (os.getenv("QUIZ_MEMBER_DB_CACHE_PATH") or "quiz_member_db_cache.json").strip()
+QUIZ_MEMBER_DB_MEMO_SEC = max(0, int(os.getenv("QUIZ_MEMBER_DB_MEMO_SEC", "600")))
+QUIZ_MEMBER_DB_MAX_AGE_SEC = max(0, int(os.getenv("QUIZ_MEMBER_DB_MAX_AGE_SEC", "21600")))
+
 # 요일 컬럼(월~일)
 _QUIZ_DOW_COLS = ["B", "C", "D", "E", "F", "G", "H"]
 
@@ -10730,7 +13605,7 @@ async def _http_get_json_with_retry(
     last_snip = ""
     for attempt in range(max_retries + 1):
         try:
-            r = await client.get(url, headers=headers, timeout=timeout_sec)
+            r = await _naver_limited_get(client, url, cookie=headers.get("Cookie", ""), headers=headers, timeout=timeout_sec)
             status = r.status_code
             last_snip = (r.text or "")[:400]
 
@@ -10958,10 +13833,12 @@ async def _fetch_all_comments_for_article(
 
     chosen = None
     chosen_meta = {}
+    first_items: list[dict] = []
     first_status = 0
     first_err = ""
 
     # 1) 동작하는 댓글 엔드포인트 1개 선택(기존 코드의 후보 생성 로직을 재사용)
+    #    댓글 0개(items=[])도 정상 응답이다. 선택된 후보의 1페이지 응답은 그대로 재사용한다.
     for cand in _build_comment_url_candidates(cafe_id, str(article_id)):
         url1 = _format_comment_page_url(cand, 1)
         st, j, snip = await _http_get_json_with_retry(client, url1, headers, timeout_sec=QUIZ_COMMENT_TIMEOUT_SEC, max_retries=2)
@@ -10979,71 +13856,94 @@ async def _fetch_all_comments_for_article(
 
         chosen = cand
         chosen_meta = meta
+        first_items = items
         break
 
-    if not chosen:
-        # 댓글이 0개라서 items가 []인 케이스도 있으므로, JSON 파싱이 되는 케이스를 다시 시도(빈 리스트 허용)
-        for cand in _build_comment_url_candidates(cafe_id, str(article_id)):
-            url1 = _format_comment_page_url(cand, 1)
-            st, j, snip = await _http_get_json_with_retry(client, url1, headers, timeout_sec=QUIZ_COMMENT_TIMEOUT_SEC, max_retries=2)
-            if st in (401, 403):
-                return st, [], "권한 없음(쿠키 만료/게시판 권한 부족)"
-            if not j:
-                continue
-            items, meta = _extract_comment_items_meta(j)
-            if isinstance(items, list):
-                chosen = cand
-                chosen_meta = meta
-                break
-
     if not chosen:
         return (first_status or 0), [], (first_err or "댓글 API 파싱 실패")
 
-    # 2) 페이지네이션 수집
-    all_items: list[dict] = []
-    page = 1
-    seen_pages = set()
-
-    while page <= max(1, QUIZ_COMMENT_MAX_PAGES):
-        if page in seen_pages:
-            # 무한루프 방지
-            break
-        seen_pages.add(page)
-
-        url = _format_comment_page_url(chosen, page)
-        st, j, snip = await _http_get_json_with_retry(client, url, headers, timeout_sec=QUIZ_COMMENT_TIMEOUT_SEC, max_retries=2)
+    max_pages = max(1, QUIZ_COMMENT_MAX_PAGES)
+    pages: dict[int, list[dict]] = {1: first_items}
 
-        if st in (401, 403):
-            return st, [], "권한 없음(쿠키 만료/게시판 권한 부족)"
-        if not j:
-            # 200인데 JSON이 비정상/빈 본문 등 → 중단
-            if st and (200 <= st < 300):
-                break
-            return st or 0, [], (snip or "댓글 요청 실패")
+    # 2) 1페이지 메타로 마지막 페이지 추정(totalCount/pageSize). 모르면 묶음 단위로 전진한다.
+    last_page: int | None = None
+    if not first_items or chosen_meta.get("hasNext") is False:
+        last_page = 1
+    else:
+        try:
+            total = int(chosen_meta.get("totalCount"))
+            size = int(chosen_meta.get("pageSize") or len(first_items))
+            if total >= 0 and size > 0:
+                last_page = max(1, -(-total // size))
+        except Exception:
+            last_page = None
+    if last_page is not None:
+        last_page = min(last_page, max_pages)
 
-        items, meta = _extract_comment_items_meta(j)
-        if items is None:
-            # 스키마가 달라졌다 → 중단
-            break
+    sem = asyncio.Semaphore(QUIZ_COMMENT_PAGE_CONCURRENCY)
 
-        items2 = _flatten_comment_items(items)
-        # visible filter
-        items2 = [it for it in items2 if _comment_is_visible(it)]
-        if not items2:
-            break
+    async def _fetch_page(p: int) -> tuple[int, int, dict | None, dict, str]:
+        async with sem:
+            st, j, snip = await _http_get_json_with_retry(
+                client,
+                _format_comment_page_url(chosen, p),
+                headers,
+                timeout_sec=QUIZ_COMMENT_TIMEOUT_SEC,
+                max_retries=2,
+            )
+        items, meta = _extract_comment_items_meta(j) if j else (None, {})
+        return p, st, items, meta, snip
+
+    # end_page: 여기까지만 유효(빈 페이지/hasNext=false/스키마 변화가 처음 나온 페이지에서 끝)
+    end_page = last_page or max_pages
+    next_page = 2
+    page_has_next: dict[int, object] = {1: chosen_meta.get("hasNext")}
+    while next_page <= end_page:
+        if last_page is not None:
+            batch = list(range(next_page, last_page + 1))
+        else:
+            batch = list(range(next_page, min(end_page, next_page + QUIZ_COMMENT_PAGE_CONCURRENCY - 1) + 1))
+        next_page = batch[-1] + 1
 
-        all_items.extend(items2)
+        for p, st, items, meta, snip in sorted(await asyncio.gather(*[_fetch_page(p) for p in batch])):
+            if p > end_page:
+                continue
+            if st in (401, 403):
+                return st, [], "권한 없음(쿠키 만료/게시판 권한 부족)"
+            if items is None:
+                # 200인데 JSON이 비정상/빈 본문 또는 스키마 변화 → 이 페이지에서 중단
+                if st and (200 <= st < 300):
+                    end_page = p - 1
+                    continue
+                return st or 0, [], (snip or "댓글 요청 실패")
+            if not items:
+                end_page = p - 1
+                continue
+            pages[p] = items
+            page_has_next[p] = meta.get("hasNext")
+            if meta.get("hasNext") is False:
+                end_page = p
 
-        # 다음 페이지 판단
-        has_next = meta.get("hasNext")
-        next_page = meta.get("nextPage")
-        if isinstance(has_next, bool) and not has_next:
-            break
+        # totalCount가 실제보다 작게 온 경우: 마지막 페이지가 hasNext=true면 묶음 단위 전진으로 전환
+        if last_page is not None and end_page == last_page and page_has_next.get(last_page) is True:
+            last_page = None
+            end_page = max_pages
 
-        if isinstance(next_page, int) and next_page > page:
-            page = next_page
-        else:
-            page += 1
+    # 3) 페이지 순서대로 합치고 댓글 id로 중복 제거(페이지 경계에서 새 댓글이 밀려 들어온 경우 대비)
+    all_items: list[dict] = []
+    seen_ids: set[str] = set()
+    for p in sorted(pages):
+        if p > end_page and p != 1:
+            continue
+        for it in _flatten_comment_items(pages[p]):
+            if not _comment_is_visible(it):
+                continue
+            cid = str(it.get("commentId") or it.get("id") or it.get("commentNo") or "")
+            if cid:
+                if cid in seen_ids:
+                    continue
+                seen_ids.add(cid)
+            all_items.append(it)
 
     return 200, all_items, ""
 
@@ -11073,6 +13973,7 @@ async def _gsheet_call_with_backoff(op_name: str, func, *args, **kwargs):
 
             sleep_s = min(QUIZ_GSHEET_BACKOFF_MAX_SEC, base * (2 ** attempt))
             print(f"[GSHEET][QUIZ] {op_name} retry {attempt+1}/{QUIZ_GSHEET_MAX_RETRIES} after {sleep_s:.1f}s: {msg[:180]}")
+            span_record("gsheet.backoff", sleep_s, ok=False, retries=1)
             try:
                 await asyncio.sleep(sleep_s)
             except Exception:
@@ -11115,13 +14016,29 @@ async def _ensure_quiz_schema(ws) -> None:
     return
 
 
+# (QUIZ_ANSWER_ALIASES_JSON 원문, 매핑) - 답안 1칸마다 매핑을 다시 만들지 않도록 env 원문 기준으로 캐시
+_QUIZ_ALIAS_CACHE: tuple[str, dict[str, str]] | None = None
+
+
 def _quiz_alias_pairs() -> dict[str, str]:
     """퀴즈 답안 비교용 동의어 매핑.
 
     기본값은 KBO 팀명 표기 차이를 흡수한다.
     추가/수정이 필요하면 Render 환경변수 QUIZ_ANSWER_ALIASES_JSON에 아래 형태로 넣을 수 있다.
     예: {"KT":["케이티","케이티위즈"],"KIA":["기아","기아타이거즈"]}
+    (env 원문이 바뀌지 않으면 이전에 만든 매핑을 그대로 쓴다.)
     """
+    global _QUIZ_ALIAS_CACHE
+    raw = (os.getenv("QUIZ_ANSWER_ALIASES_JSON") or "").strip()
+    cached = _QUIZ_ALIAS_CACHE
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+    mp = _quiz_build_alias_pairs(raw)
+    _QUIZ_ALIAS_CACHE = (raw, mp)
+    return mp
+
+
+def _quiz_build_alias_pairs(raw: str) -> dict[str, str]:
     default = {
         "KT": ["KT", "kt", "케이티", "케티", "KT위즈", "케이티위즈"],
         "KIA": ["KIA", "kia", "기아", "KIA타이거즈", "기아타이거즈"],
@@ -11143,7 +14060,6 @@ def _quiz_alias_pairs() -> dict[str, str]:
         "O": ["o", "O"],
     }
 
-    raw = (os.getenv("QUIZ_ANSWER_ALIASES_JSON") or "").strip()
     if raw:
         try:
             custom = json.loads(raw)
@@ -11279,7 +14195,11 @@ def _quiz_format_answer(parts: list[str]) -> str:
 
 
 def _quiz_score_slash_answer(submitted: str, answer_key: str) -> int:
-    """정답/제출답을 / 기준으로 위치별 비교해 맞은 개수를 반환."""
+    """정답/제출답을 / 기준으로 위치별 비교해 맞은 개수를 반환.
+
+    운영 채점은 QuizScorer 를 쓴다. 이 함수는 칸 단위 기준 구현으로 남겨
+    tests/test_quiz_scorer.py 에서 QuizScorer 결과와 비교한다.
+    """
     ox_flags = _quiz_ox_flags_for_answer_key(answer_key)
     ans_parts = _quiz_split_slash_answer(answer_key)
     sub_parts = _quiz_split_slash_answer(submitted, ox_flags=ox_flags)
@@ -11305,140 +14225,264 @@ def _quiz_points_for_score(score: int) -> int:
     return 0
 
 
+class QuizScorer:
+    """주간 정답(B1:H1)을 한 번만 정규화해 두고 제출답 행렬을 한 번에 채점한다.
+
+    - 정답: 요일별 (정규화된 칸, O/X 위치 플래그)를 생성 시 1회 계산
+    - 제출답: (원문, O/X 플래그) 기준으로 정규화 결과를 캐시 → 같은 답안 문자열은 1번만 정규화
+    - 채점 결과는 _quiz_score_slash_answer()와 동일하다.
+    """
+
+    def __init__(self, answer_keys: list[str]):
+        self.answer_parts: list[tuple[str, ...]] = []
+        self.ox_flags: list[tuple[bool, ...]] = []
+        for key in list(answer_keys or [])[:7] + [""] * max(0, 7 - len(answer_keys or [])):
+            self.answer_parts.append(tuple(_quiz_split_slash_answer(key)))
+            self.ox_flags.append(tuple(_quiz_ox_flags_for_answer_key(key)))
+        self._sub_cache: dict[tuple[str, tuple[bool, ...]], tuple[str, ...]] = {}
+
+    def answer_ok(self, dow: int) -> bool:
+        return 0 <= dow < 7 and bool(self.answer_parts[dow])
+
+    def _submitted_parts(self, submitted: str, ox: tuple[bool, ...]) -> tuple[str, ...]:
+        k = (submitted, ox)
+        parts = self._sub_cache.get(k)
+        if parts is None:
+            parts = tuple(_quiz_split_slash_answer(submitted, ox_flags=list(ox)))
+            self._sub_cache[k] = parts
+        return parts
+
+    def score(self, submitted: str, dow: int) -> int:
+        ans = self.answer_parts[dow] if 0 <= dow < 7 else ()
+        if not ans or not submitted:
+            return 0
+        sub = self._submitted_parts(submitted, self.ox_flags[dow])
+        return sum(1 for a, b in zip(ans, sub) if a == b)
+
+    def score_matrix(self, rows: list[tuple[int, list[str]]]) -> dict[int, list[int]]:
+        """[(row_num, A~H)] → {row_num: [월~일 점수 7칸]} (닉네임 없는 행 제외)."""
+        active = [d for d in range(7) if self.answer_parts[d]]
+        out: dict[int, list[int]] = {}
+        for row_num, rr in rows:
+            if not rr[0]:
+                continue
+            scores = [0] * 7
+            for d in active:
+                submitted = rr[1 + d]
+                if submitted:
+                    scores[d] = self.score(submitted, d)
+            out[row_num] = scores
+        return out
+
+
 def _quiz_payment_start_cell() -> str:
     m = re.match(r"^\s*([A-Z]+[0-9]+)", (QUIZ_PAYMENT_VIEW_RANGE or "W3:AA").upper())
     return m.group(1) if m else "W3"
 
 
-async def _quiz_get_answer_key_for_dow(ws, dow: int) -> str:
-    """B1:H1 중 해당 요일 정답을 읽는다. B2:H2 마감시간은 건드리지 않는다.
+def _quiz_pad_row(row: list, n: int) -> list[str]:
+    """Sheets에서 읽은 행을 n칸까지 빈 문자열로 패딩한다."""
+    out = [str(x or "").strip() for x in (row or [])]
+    if len(out) < n:
+        out.extend([""] * (n - len(out)))
+    return out[:n]
+
+
+# ───────── 퀴즈 탭 모델(1회 읽기) ─────────
+# 명령어 1회당 퀴즈 탭을 get_all_values로 한 번만 읽고,
+# 제출 반영 → I:J 채점 → W:AA 지급뷰 → 요약 집계를 모두 메모리에서 계산한 뒤
+# I:J와 W:AA를 batch_update 1회로 함께 쓴다. (이전 값보다 짧아지면 빈 칸으로 덮어 잔여값 제거)
+
+def _quiz_col_index(letters: str) -> int:
+    """'A' → 0, 'W' → 22, 'AA' → 26"""
+    n = 0
+    for ch in (letters or "").strip().upper():
+        if not ("A" <= ch <= "Z"):
+            break
+        n = n * 26 + (ord(ch) - 64)
+    return max(0, n - 1)
+
+
+def _quiz_payment_view_bounds() -> tuple[int, int, int]:
+    """QUIZ_PAYMENT_VIEW_RANGE → (시작 행, 시작 열 index, 끝 열 index)"""
+    m = re.match(r"^\s*([A-Z]+)(\d+)\s*:\s*([A-Z]+)", (QUIZ_PAYMENT_VIEW_RANGE or "W3:AA").upper())
+    if not m:
+        return 3, _quiz_col_index("W"), _quiz_col_index("AA")
+    return int(m.group(2)), _quiz_col_index(m.group(1)), _quiz_col_index(m.group(3))
+
+
+_QUIZ_SCORE_COL_I = _quiz_col_index("I")
 
-    gspread/Sheets API는 범위 앞쪽이 비어 있으면 반환 배열 길이가 짧아지는 경우가 있어,
-    해당 요일 셀(B1~H1)을 직접 읽는 방식을 우선 사용한다.
+
+class QuizWorkbook:
+    """퀴즈 탭 스냅샷.
+
+    - answer_keys: B1:H1 (월~일 정답)
+    - rows: [(row_number, A~H 8칸)] 4행부터, 완전 빈 행 제외
+    - score_extent / payment_extent: 현재 I:J, 지급뷰에 값이 남아 있는 마지막 행
     """
-    if not (0 <= int(dow) <= 6):
-        return ""
-    col = _QUIZ_DOW_COLS[int(dow)]
 
-    # 1) 가장 안전한 방법: 해당 요일 정답 셀 직접 읽기
-    try:
-        cell = await _gsheet_call_with_backoff("quiz.answer_key.acell", ws.acell, f"{col}1")
-        val = getattr(cell, "value", "")
-        if val is not None:
-            return str(val or "").strip()
-    except Exception as e:
-        print(f"[QUIZ] answer key acell read failed: {e}")
+    def __init__(self, values: list[list[str]]):
+        values = [list(r or []) for r in (values or [])]
+        row1 = _quiz_pad_row(values[0] if values else [], 8)
+        self.answer_keys: list[str] = [row1[1 + i] for i in range(7)]
 
-    # 2) 폴백: row_values는 중간 빈 칸을 보존하는 경우가 많아 한 번 더 시도
-    try:
-        row = await _gsheet_call_with_backoff("quiz.answer_key.row_values", ws.row_values, 1)
-        idx = 1 + int(dow)  # A=0, B=1 ... H=7
-        if isinstance(row, list) and len(row) > idx:
-            return str(row[idx] or "").strip()
-    except Exception as e:
-        print(f"[QUIZ] answer key row read failed: {e}")
+        self.rows: list[tuple[int, list[str]]] = []
+        for row_num, row in enumerate(values[3:], start=4):
+            rr = _quiz_pad_row(row, 8)
+            if any(rr):
+                self.rows.append((row_num, rr))
 
-    return ""
+        pay_row, pay_c0, pay_c1 = _quiz_payment_view_bounds()
+        self.score_extent = 3
+        self.payment_extent = pay_row - 1
+        for row_num, row in enumerate(values, start=1):
+            if row_num >= 4 and any(str(x or "").strip() for x in row[_QUIZ_SCORE_COL_I:_QUIZ_SCORE_COL_I + 2]):
+                self.score_extent = row_num
+            if row_num >= pay_row and any(str(x or "").strip() for x in row[pay_c0:pay_c1 + 1]):
+                self.payment_extent = row_num
 
+    def answer_key(self, dow: int) -> str:
+        return self.answer_keys[dow] if 0 <= dow < 7 else ""
 
-def _quiz_pad_row(row: list, n: int) -> list[str]:
-    """Sheets에서 읽은 행을 n칸까지 빈 문자열로 패딩한다."""
-    out = [str(x or "").strip() for x in (row or [])]
-    if len(out) < n:
-        out.extend([""] * (n - len(out)))
-    return out[:n]
+    def nick_to_row(self) -> dict[str, int]:
+        # 닉네임은 최초로 생긴 행을 유지한다. 중복 닉네임 행이 있으면 첫 행만 사용.
+        out: dict[str, int] = {}
+        for row_num, rr in self.rows:
+            if rr[0]:
+                out.setdefault(rr[0], row_num)
+        return out
 
+    def last_row(self) -> int:
+        return max([3] + [row_num for row_num, _ in self.rows])
 
-async def _quiz_get_answer_keys_all(ws) -> list[str]:
-    """B1:H1 전체 정답을 안전하게 읽는다. 빈 칸은 빈 문자열."""
-    answers = [""] * 7
+    def set_day_value(self, row_num: int, dow: int, value: str) -> None:
+        for rn, rr in self.rows:
+            if rn == row_num:
+                rr[1 + dow] = value
+                return
 
-    # row_values 우선: A열 포함해서 읽은 뒤 B~H 매핑
-    try:
-        row = await _gsheet_call_with_backoff("quiz.answer_keys.row_values", ws.row_values, 1)
-        row = _quiz_pad_row(row if isinstance(row, list) else [], 8)
-        for i in range(7):
-            answers[i] = str(row[1 + i] or "").strip()
-    except Exception as e:
-        print(f"[QUIZ] answer keys row read failed: {e}")
+    def add_row(self, row_num: int, row: list[str]) -> None:
+        self.rows.append((row_num, _quiz_pad_row(row, 8)))
+        self.rows.sort(key=lambda x: x[0])
 
-    # 비어 있는 칸은 acell로 개별 보강
-    for i, col in enumerate(_QUIZ_DOW_COLS):
-        if answers[i]:
-            continue
-        try:
-            cell = await _gsheet_call_with_backoff("quiz.answer_keys.acell", ws.acell, f"{col}1")
-            answers[i] = str(getattr(cell, "value", "") or "").strip()
-        except Exception:
-            pass
 
-    return answers
+async def _quiz_load_workbook(ws) -> QuizWorkbook:
+    values = await _gsheet_call_with_backoff("quiz.book.get_all_values", ws.get_all_values)
+    return QuizWorkbook(values or [])
 
 
-async def _quiz_read_rows_a_to_h(ws) -> list[list[str]]:
-    """퀴즈 데이터 A4:H를 읽는다. 중간 빈 칸이 있어도 항상 8칸으로 패딩한다."""
+def _quiz_appended_start_row(resp) -> int | None:
+    """append_rows 응답의 updatedRange('퀴즈'!A57:H60)에서 시작 행을 꺼낸다."""
     try:
-        vals = await _gsheet_call_with_backoff("quiz.rows.get_all_values", ws.get_all_values)
-    except Exception as e:
-        print(f"[QUIZ] rows get_all_values failed: {e}")
-        try:
-            vals = await _gsheet_call_with_backoff("quiz.rows.get_range", ws.get, "A4:H")
-        except Exception as e2:
-            print(f"[QUIZ] rows range read failed: {e2}")
-            vals = []
-
-    # get_all_values면 0-based row 4는 index 3부터, ws.get('A4:H')면 이미 data-only일 수 있음
-    rows_src = vals[3:] if vals and len(vals) >= 4 and any(str(x or "").strip() for x in vals[0]) else (vals or [])
-    rows: list[list[str]] = []
-    for row in rows_src:
-        rr = _quiz_pad_row(row if isinstance(row, list) else [], 8)
-        if not any(rr):
-            continue
-        rows.append(rr)
-    return rows
+        rng = str(((resp or {}).get("updates") or {}).get("updatedRange") or "")
+        m = re.search(r"![A-Z]+(\d+)", rng)
+        return int(m.group(1)) if m else None
+    except Exception:
+        return None
 
 
-async def _quiz_update_score_columns(ws) -> tuple[int, int]:
-    """I:J 영역을 / 기준 채점 결과로 갱신한다.
+def _quiz_compute_results(book: QuizWorkbook, *, dows: list[int], betrise_by_allblack: dict[str, str]) -> dict:
+    """I:J 채점값, 지급뷰 행, 요약 집계를 메모리에서 계산한다.
 
-    - I열: B~H 요일별 정답 수 합계
-    - J열: 정답자 여부(Y/공백)
-    - B1:H1 정답칸과 A4:H 제출 영역만 읽고 계산한다.
+    dows가 여러 개면(날짜 범위 수집) 지급뷰에 요일 순서대로 모두 싣는다.
+    반환 dict의 answer_key/submitted_cnt 등 단일 값은 dows[0] 기준, 요일별 값은 by_day[dow].
     """
-    answers = await _quiz_get_answer_keys_all(ws)
-    rows = await _quiz_read_rows_a_to_h(ws)
+    days = ["월", "화", "수", "목", "금", "토", "일"]
 
-    out: list[list[str | int]] = []
-    for row in rows:
-        nick = str(row[0] or "").strip()
-        if not nick:
-            continue
-        total = 0
-        for dow, answer in enumerate(answers):
-            if not answer:
+    # 회원 × 요일 점수 행렬을 한 번에 계산
+    scorer = QuizScorer(book.answer_keys)
+    matrix = scorer.score_matrix(book.rows)
+
+    # I:J - B~H 요일별 정답 수 합계 / 정답자 여부
+    score_by_row: dict[int, list[str | int]] = {}
+    for row_num, scores in matrix.items():
+        total = sum(scores)
+        score_by_row[row_num] = [total, "Y" if total > 0 else ""]
+
+    # 지급뷰 + 요약(해당 요일)
+    payment_rows: list[list[str | int]] = []
+    by_day: dict[int, dict] = {}
+    for order, dow in enumerate(dows):
+        day_label = days[dow] if 0 <= dow < len(days) else ""
+        answer_key = book.answer_key(dow)
+        answer_ok = scorer.answer_ok(dow)
+        day_rows: list[list[str | int]] = []
+        submitted_cnt = 0
+        scored_cnt = 0
+        for row_num, rr in book.rows:
+            nick, submitted = rr[0], rr[1 + dow]
+            if not nick or not submitted:
                 continue
-            submitted = str(row[1 + dow] or "").strip()
-            if not submitted:
+            submitted_cnt += 1
+            if not answer_ok:
+                continue
+            score = matrix[row_num][dow]
+            if score > 0:
+                scored_cnt += 1
+            points = _quiz_points_for_score(score)
+            if points <= 0:
                 continue
-            total += _quiz_score_slash_answer(submitted, answer)
-        out.append([total, "Y" if total > 0 else ""])
+            betrise_nick = betrise_by_allblack.get(_quiz_db_nick_key(nick), QUIZ_UNMATCHED_BETRISE_NICK)
+            day_rows.append([nick, betrise_nick, day_label, score, points])
+
+        day_rows.sort(key=lambda r: (-int(r[4]), str(r[0])))
+        payment_rows.extend(day_rows)
+        by_day[dow] = {
+            "answer_key": answer_key,
+            "answer_ok": answer_ok,
+            "payment_cnt": len(day_rows),
+            "total_payment": sum(int(r[4]) for r in day_rows),
+            "submitted_cnt": submitted_cnt,
+            "scored_cnt": scored_cnt,
+        }
 
-    # 기존 I:J 잔여값이 남지 않도록 충분히 지운 뒤 현재 데이터 수만큼 다시 쓴다.
-    try:
-        last = int(getattr(ws, "row_count", 2000) or 2000)
-        last = max(4, last)
-        await _gsheet_call_with_backoff("quiz.score_cols.clear", ws.batch_clear, [f"I4:J{last}"])
-    except Exception as e:
-        print(f"[QUIZ] score cols clear failed: {e}")
+    first = by_day.get(dows[0], {}) if dows else {}
+    return {
+        **first,
+        "by_day": by_day,
+        "score_by_row": score_by_row,
+        "score_rows": len(score_by_row),
+        "winner_cnt": sum(1 for v in score_by_row.values() if v[1]),
+        "payment_rows": payment_rows,
+        "payment_cnt": len(payment_rows),
+        "total_payment": sum(int(r[4]) for r in payment_rows),
+    }
 
-    if out:
-        try:
-            await _gsheet_call_with_backoff("quiz.score_cols.update", ws.update, range_name="I4", values=out)
-        except TypeError:
-            await _gsheet_call_with_backoff("quiz.score_cols.update_legacy", ws.update, "I4", out)
 
-    winner_cnt = sum(1 for r in out if len(r) > 1 and str(r[1]).strip())
-    return len(out), winner_cnt
+async def _quiz_write_results(ws, book: QuizWorkbook, *, dow: int | None = None, dows: list[int] | None = None) -> dict:
+    """채점/지급뷰를 계산하고 I:J + W:AA를 batch_update 1회로 반영한다. 계산 결과 dict 반환."""
+    dows = list(dows or ([] if dow is None else [dow]))
+    betrise_by_allblack: dict[str, str] = {}
+    if any(_quiz_split_slash_answer(book.answer_key(d)) for d in dows):
+        betrise_by_allblack = await _quiz_load_betrise_nick_by_allblack_nick()
+    res = _quiz_compute_results(book, dows=dows, betrise_by_allblack=betrise_by_allblack)
+
+    payload: list[dict] = []
+
+    # I:J (4행부터, 기존 값이 남아 있던 행까지 빈 칸으로 덮는다)
+    score_end = max(book.last_row(), book.score_extent)
+    if score_end >= 4:
+        score_values = [res["score_by_row"].get(r, ["", ""]) for r in range(4, score_end + 1)]
+        payload.append({"range": f"I4:J{score_end}", "values": score_values})
+
+    # 지급뷰는 누적하지 않고 매번 고정 영역을 덮어쓴다.
+    pay_row, pay_c0, pay_c1 = _quiz_payment_view_bounds()
+    width = pay_c1 - pay_c0 + 1
+    header = ["올블랙닉네임", "벳라이즈닉네임", "출제요일", "정답수", "지급금액"]
+    pay_values = [header] + res["payment_rows"]
+    pay_values = [(list(r) + [""] * width)[:width] for r in pay_values]
+    pay_end = max(pay_row + len(pay_values) - 1, book.payment_extent)
+    pay_values += [[""] * width] * (pay_end - pay_row + 1 - len(pay_values))
+    payload.append({
+        "range": f"{_col_letter(pay_c0 + 1)}{pay_row}:{_col_letter(pay_c1 + 1)}{pay_end}",
+        "values": pay_values,
+    })
+
+    await _gsheet_call_with_backoff("quiz.results.batch_update", ws.batch_update, payload, value_input_option="RAW")
+    book.score_extent = max(res["score_by_row"], default=3)
+    book.payment_extent = pay_row + len(res["payment_rows"])
+    return res
 
 
 def _quiz_db_nick_key(nick: str) -> str:
@@ -11454,41 +14498,12 @@ def _quiz_db_phone_key(phone: str) -> str:
     return re.sub(r"\D+", "", str(phone or ""))
 
 
-async def _quiz_load_betrise_nick_by_allblack_nick() -> dict[str, str]:
-    """올블랙닉네임 → 벳라이즈닉네임 매핑을 생성한다.
-
-    매칭 경로:
-    1) 퀴즈 지급뷰 닉네임 = 올블랙닉네임
-    2) 올블랙DB C열 닉네임에서 찾고, 같은 행 E열 연락처 추출
-    3) 탈퇴DB B열 연락처와 일치하면 '탈퇴회원' 반환
-    4) 벳라이즈DB B열 연락처와 비교해, 같은 행 A열 닉네임 반환
-    """
-    client_gs = get_gs_client()
-    spreadsheet_id = os.getenv("SPREADSHEET_ID")
-    if not (client_gs and spreadsheet_id):
-        return {}
-
-    try:
-        sh = await _gsheet_call_with_backoff("quiz.db.open", client_gs.open_by_key, spreadsheet_id)
-        ws_allblack = _get_ws_by_name(sh, QUIZ_ALLBLACK_DB_SHEET_NAME)
-        ws_betrise = _get_ws_by_name(sh, QUIZ_BETRISE_DB_SHEET_NAME)
-        ws_withdraw = _get_ws_by_name(sh, QUIZ_WITHDRAW_DB_SHEET_NAME)
-        if not ws_allblack or not ws_betrise:
-            print(f"[QUIZ][DB] sheet missing: allblack={bool(ws_allblack)} betrise={bool(ws_betrise)}")
-            return {}
-
-        allblack_rows = await _gsheet_call_with_backoff("quiz.db.allblack.get", ws_allblack.get_all_values)
-        betrise_rows = await _gsheet_call_with_backoff("quiz.db.betrise.get", ws_betrise.get_all_values)
-        withdraw_rows = []
-        if ws_withdraw:
-            try:
-                withdraw_rows = await _gsheet_call_with_backoff("quiz.db.withdraw.get", ws_withdraw.get_all_values)
-            except Exception as e:
-                print(f"[QUIZ][DB] withdraw load failed: {e}")
-    except Exception as e:
-        print(f"[QUIZ][DB] load failed: {e}")
-        return {}
-
+def _quiz_build_betrise_nick_map(
+    allblack_rows: list[list[str]],
+    betrise_rows: list[list[str]],
+    withdraw_rows: list[list[str]],
+) -> dict[str, str]:
+    """세 DB 시트 값 → 올블랙닉네임키 → 벳라이즈닉네임 매핑."""
     # 탈퇴DB: B열 연락처만 사용한다. (A열=닉네임, B열=연락처)
     withdrawn_phones: set[str] = set()
     for row in (withdraw_rows or [])[1:]:
@@ -11521,62 +14536,138 @@ async def _quiz_load_betrise_nick_by_allblack_nick() -> dict[str, str]:
     return out
 
 
-async def _quiz_update_daily_payment_view(ws, *, dow: int, answer_key: str) -> tuple[int, int]:
-    """W3:AA 지급 정렬뷰를 최신 결과로 덮어쓴다.
+_QUIZ_MEMBER_DB_MEMO: dict = {"checked_at": 0.0, "built_at": 0.0, "sig": "", "map": None}
+_QUIZ_MEMBER_DB_LOCK = asyncio.Lock()
 
-    반환: (지급대상자 수, 총 지급금액)
-    """
-    days = ["월", "화", "수", "목", "금", "토", "일"]
-    day_label = days[dow] if 0 <= dow < len(days) else ""
-    answer_key = (answer_key or "").strip()
 
-    payment_rows: list[list[str | int]] = []
-    betrise_by_allblack = await _quiz_load_betrise_nick_by_allblack_nick()
-    if answer_key:
-        rows = await _quiz_read_rows_a_to_h(ws)
-        for row in rows:
-            nick = str(row[0] or "").strip()
-            if not nick:
-                continue
-            submitted = str(row[1 + dow] if len(row) > (1 + dow) else "").strip()
-            if not submitted:
-                continue
-            score = _quiz_score_slash_answer(submitted, answer_key)
-            points = _quiz_points_for_score(score)
-            if points <= 0:
-                continue
-            betrise_nick = betrise_by_allblack.get(_quiz_db_nick_key(nick), QUIZ_UNMATCHED_BETRISE_NICK)
-            payment_rows.append([nick, betrise_nick, day_label, score, points])
+def _quiz_a1_sheet(name: str) -> str:
+    return "'" + str(name or "").replace("'", "''") + "'"
 
-    payment_rows.sort(key=lambda r: (-int(r[4]), str(r[0])))
 
-    header = [["올블랙닉네임", "벳라이즈닉네임", "출제요일", "정답수", "지급금액"]]
-    values = header + payment_rows
+async def _quiz_member_db_read(sh, probes: list[tuple[object, str]]) -> tuple[str, list[list[list[str]]]]:
+    """매핑에 쓰는 열만 한 번에 읽는다. probes: [(ws, "C:E"), ...] → (리비전 서명, probe별 행 목록)
 
-    # 지급뷰는 누적하지 않고 매번 고정 영역을 덮어쓴다.
+    행은 시트 열 위치 그대로(앞쪽 열은 "" 로 채움) 돌려줘서 _quiz_build_betrise_nick_map 에 바로 넘긴다.
+    서명은 닉네임/연락처 셀 수정, A열이 빈 새 행, 행 추가/삭제/순서 변경을 모두 감지한다.
+    ws 가 None 인 probe 는 빈 목록.
+    """
+    present = [(ws, cols) for ws, cols in probes if ws]
+    ranges = [f"{_quiz_a1_sheet(ws.title)}!{cols}" for ws, cols in present]
+    res = await _gsheet_call_with_backoff("quiz.db.probe", sh.values_batch_get, ranges)
+    value_ranges = (res or {}).get("valueRanges", []) or []
+    if len(value_ranges) != len(ranges):
+        raise RuntimeError(f"values_batch_get 결과 범위 수 불일치: {len(value_ranges)}/{len(ranges)}")
+
+    parts = [str(len(ranges))]
+    by_ws: dict[int, list[list[str]]] = {}
+    for (ws, cols), vr in zip(present, value_ranges):
+        rows = [[str(c) for c in (r or [])] for r in (vr.get("values") or [])]
+        joined = ["\x1e".join(r) for r in rows]
+        parts.append(f"{len(rows)}:" + _hashlib.sha1("\x1f".join(joined).encode("utf-8")).hexdigest())
+        lead = 0
+        for ch in cols.split(":", 1)[0]:
+            lead = lead * 26 + (ord(ch.upper()) - 64)
+        by_ws[id(ws)] = [[""] * (lead - 1) + r for r in rows]
+    return "|".join(parts), [by_ws.get(id(ws), []) if ws else [] for ws, _ in probes]
+
+
+def _quiz_member_db_cache_load() -> dict | None:
     try:
-        await _gsheet_call_with_backoff("quiz.payment.clear", ws.batch_clear, [QUIZ_PAYMENT_VIEW_RANGE])
+        with open(QUIZ_MEMBER_DB_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and isinstance(data.get("map"), dict):
+            return data
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        print(f"[QUIZ] payment view clear failed: {e}")
+        print(f"[QUIZ][DB] cache load failed(무시): {e}")
+    return None
 
-    try:
-        await _gsheet_call_with_backoff("quiz.payment.update", ws.update, range_name=_quiz_payment_start_cell(), values=values)
-    except TypeError:
-        await _gsheet_call_with_backoff("quiz.payment.update_legacy", ws.update, _quiz_payment_start_cell(), values)
 
-    total_points = sum(int(r[4]) for r in payment_rows)
-    return len(payment_rows), total_points
+def _quiz_member_db_cache_save(sig: str, built_at: float, mapping: dict[str, str]) -> None:
+    tmp = QUIZ_MEMBER_DB_CACHE_PATH + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"sig": sig, "built_at": built_at, "map": mapping}, f, ensure_ascii=False)
+        os.replace(tmp, QUIZ_MEMBER_DB_CACHE_PATH)
+    except Exception as e:
+        print(f"[QUIZ][DB] cache save failed(무시): {e}")
 
 
+async def _quiz_load_betrise_nick_by_allblack_nick() -> dict[str, str]:
+    """올블랙닉네임 → 벳라이즈닉네임 매핑을 생성한다.
+
+    매칭 경로:
+    1) 퀴즈 지급뷰 닉네임 = 올블랙닉네임
+    2) 올블랙DB C열 닉네임에서 찾고, 같은 행 E열 연락처 추출
+    3) 탈퇴DB B열 연락처와 일치하면 '탈퇴회원' 반환
+    4) 벳라이즈DB B열 연락처와 비교해, 같은 행 A열 닉네임 반환
+
+    회원 DB는 거의 바뀌지 않으므로 메모리/로컬 사본을 재사용한다. (QUIZ_MEMBER_DB_* 참고)
+    """
+    async with _QUIZ_MEMBER_DB_LOCK:
+        memo = _QUIZ_MEMBER_DB_MEMO
+        now_ts = time.time()
+        if memo["map"] is not None and now_ts - memo["checked_at"] < QUIZ_MEMBER_DB_MEMO_SEC:
+            return dict(memo["map"])
 
+        client_gs = get_gs_client()
+        spreadsheet_id = os.getenv("SPREADSHEET_ID")
+        if not (client_gs and spreadsheet_id):
+            return {}
 
-async def _quiz_upsert_answers_for_day(ws, *, dow: int, nick_to_ans: dict[str, str], op_prefix: str = "quiz_upsert") -> tuple[int, int, int, int]:
+        try:
+            sh = await _gsheet_call_with_backoff("quiz.db.open", client_gs.open_by_key, spreadsheet_id)
+            ws_allblack = _get_ws_by_name(sh, QUIZ_ALLBLACK_DB_SHEET_NAME)
+            ws_betrise = _get_ws_by_name(sh, QUIZ_BETRISE_DB_SHEET_NAME)
+            ws_withdraw = _get_ws_by_name(sh, QUIZ_WITHDRAW_DB_SHEET_NAME)
+            if not ws_allblack or not ws_betrise:
+                print(f"[QUIZ][DB] sheet missing: allblack={bool(ws_allblack)} betrise={bool(ws_betrise)}")
+                return {}
+        except Exception as e:
+            print(f"[QUIZ][DB] load failed: {e}")
+            return {}
+
+        # 매핑에 쓰는 열만 한 번에 읽기(올블랙 C:E / 벳라이즈 A:B / 탈퇴 B) → 서명이 같으면 메모리/로컬 사본 재사용,
+        # 바뀌었으면 같은 값으로 바로 다시 만든다(탭 전체를 다시 읽지 않음).
+        try:
+            sig, (allblack_rows, betrise_rows, withdraw_rows) = await _quiz_member_db_read(
+                sh, [(ws_allblack, "C:E"), (ws_betrise, "A:B"), (ws_withdraw, "B:B")]
+            )
+        except Exception as e:
+            print(f"[QUIZ][DB] load failed: {e}")
+            return {}
+
+        if memo["map"] is None:
+            cached = _quiz_member_db_cache_load()
+            if cached:
+                memo.update(sig=cached.get("sig") or "", built_at=float(cached.get("built_at") or 0), map=cached["map"])
+        if memo["map"] is not None and memo["sig"] == sig and now_ts - memo["built_at"] < QUIZ_MEMBER_DB_MAX_AGE_SEC:
+            memo["checked_at"] = now_ts
+            return dict(memo["map"])
+
+        out = _quiz_build_betrise_nick_map(allblack_rows, betrise_rows, withdraw_rows)
+        memo.update(checked_at=now_ts, built_at=now_ts, sig=sig, map=out)
+        _quiz_member_db_cache_save(sig, now_ts, out)
+        print(f"[QUIZ][DB] member index rebuilt: {len(out)} nicks")
+        return dict(out)
+
+
+async def _quiz_upsert_answers_for_day(
+    ws,
+    *,
+    dow: int,
+    nick_to_ans: dict[str, str],
+    op_prefix: str = "quiz_upsert",
+    book: QuizWorkbook | None = None,
+) -> tuple[int, int, int, int]:
     """닉네임은 A열 고정, 해당 요일(B~H) 컬럼만 덮어쓴다.
 
     동작 원칙:
     - 기존 닉네임이 있으면 같은 행의 해당 요일 컬럼을 새 답안으로 덮어쓴다.
     - 기존 닉네임이 없으면 새 행을 A~H 형태로 추가한다.
     - 같은 날짜를 재크롤링해도 해당 날짜 컬럼만 갱신되고 다른 요일 컬럼은 건드리지 않는다.
+    - book(QuizWorkbook)을 넘기면 시트를 다시 읽지 않고, 반영 결과도 book에 그대로 적용한다.
     반환: (inserted_cnt, updated_cnt, overwritten_cnt, unchanged_cnt)
     """
     if not nick_to_ans:
@@ -11586,33 +14677,11 @@ async def _quiz_upsert_answers_for_day(ws, *, dow: int, nick_to_ans: dict[str, s
         raise ValueError("invalid dow")
 
     day_col = _QUIZ_DOW_COLS[int(dow)]
+    if book is None:
+        book = await _quiz_load_workbook(ws)
 
-    existing_nicks_raw = await _gsheet_call_with_backoff(f"{op_prefix}.existing_nicks", ws.get, "A4:A")
-    existing_nicks: list[str] = []
-    for r in (existing_nicks_raw or []):
-        if not r:
-            continue
-        v = str(r[0]).strip()
-        if v:
-            existing_nicks.append(v)
-
-    # 닉네임은 최초로 생긴 행을 유지한다. 중복 닉네임 행이 있으면 첫 행만 사용.
-    nick_to_row: dict[str, int] = {}
-    for i, nick in enumerate(existing_nicks):
-        nick_to_row.setdefault(nick, 4 + i)
-
-    last_existing = 3 + len(existing_nicks)
-
-    day_vals_raw = await _gsheet_call_with_backoff(
-        f"{op_prefix}.day_vals",
-        ws.get,
-        f"{day_col}4:{day_col}{max(4, last_existing)}",
-    )
-    day_vals: list[str] = []
-    for r in (day_vals_raw or []):
-        day_vals.append(str(r[0]).strip() if r else "")
-    if len(day_vals) < len(existing_nicks):
-        day_vals.extend([""] * (len(existing_nicks) - len(day_vals)))
+    nick_to_row = book.nick_to_row()
+    day_vals = {row_num: rr[1 + int(dow)] for row_num, rr in book.rows}
 
     updates: list[dict] = []
     new_rows: list[list[str]] = []
@@ -11627,19 +14696,20 @@ async def _quiz_upsert_answers_for_day(ws, *, dow: int, nick_to_ans: dict[str, s
 
         if nick in nick_to_row:
             row_num = nick_to_row[nick]
-            idx0 = row_num - 4
-            cur = day_vals[idx0] if (0 <= idx0 < len(day_vals)) else ""
+            cur = day_vals.get(row_num, "")
             if cur == ans:
                 unchanged_cnt += 1
                 continue
             if cur:
                 overwritten_cnt += 1
             updates.append({"range": f"{day_col}{row_num}", "values": [[ans]]})
+            day_vals[row_num] = ans
         else:
             row = [""] * 8
             row[0] = nick
             row[1 + int(dow)] = ans
             new_rows.append(row)
+            nick_to_row[nick] = -1  # 같은 호출 안에서 중복 추가 방지
 
     if updates:
         await _gsheet_call_with_backoff(
@@ -11648,33 +14718,309 @@ async def _quiz_upsert_answers_for_day(ws, *, dow: int, nick_to_ans: dict[str, s
             updates,
             value_input_option="RAW",
         )
+        for u in updates:
+            book.set_day_value(int(u["range"][len(day_col):]), int(dow), u["values"][0][0])
     if new_rows:
-        await _gsheet_call_with_backoff(
+        resp = await _gsheet_call_with_backoff(
             f"{op_prefix}.append_rows",
             ws.append_rows,
             new_rows,
             value_input_option="RAW",
             table_range="A4",
         )
+        start_row = _quiz_appended_start_row(resp) or (book.last_row() + 1)
+        for i, row in enumerate(new_rows):
+            book.add_row(start_row + i, row)
 
     return len(new_rows), len(updates), overwritten_cnt, unchanged_cnt
 
 
+def _quiz_answers_from_comments(items: list[dict], deadline_dt: datetime | None) -> tuple[dict[str, str], dict[str, int]]:
+    """댓글 → {닉네임: 답안} (작성시간 오름차순, 닉네임당 첫 답안만) + 집계값."""
+    parsed = []
+    deadline_excluded = 0
+    deadline_unknown_ts = 0
+    for it in items:
+        nick, text, ts = _extract_comment_nick_and_text(it)
+        if not nick or not text:
+            continue
+
+        # B2:H2 마감시간 기준 필터
+        # - 기본: 게시글 작성일 다음날(QUIZ_DEADLINE_DAY_OFFSET=1) 해당 시간
+        # - 마감 정각 댓글은 포함, 마감 이후 댓글은 제외
+        if deadline_dt:
+            cdt = _quiz_ts_ms_to_kst_datetime(ts)
+            if cdt is None:
+                deadline_unknown_ts += 1
+            elif cdt > deadline_dt:
+                deadline_excluded += 1
+                continue
+
+        parsed.append((ts, nick, text))
+
+    parsed.sort(key=lambda x: (x[0], x[1]))
+
+    valid_ans = 0
+    dup_skip = 0
+    no_ans = 0
+    seen_nick: set[str] = set()
+    nick_to_ans: dict[str, str] = {}
+
+    # 새 이벤트 답안 형식: '4 / KT / 2' 또는 '4/케이티/2'
+    # - / 기준 3개 항목으로 분리
+    # - KT/케이티, KIA/기아 등 동의어는 같은 값으로 정규화
+    for ts, nick, text in parsed:
+        parts = _quiz_split_slash_answer(text)
+        if not parts:
+            no_ans += 1
+            continue
+        ans = _quiz_format_answer(parts)
+        valid_ans += 1
+        if nick in seen_nick:
+            dup_skip += 1
+            continue
+        seen_nick.add(nick)
+        nick_to_ans[nick] = ans
+
+    return nick_to_ans, {
+        "deadline_excluded": deadline_excluded,
+        "deadline_unknown_ts": deadline_unknown_ts,
+        "total_fetched": len(parsed),
+        "valid_ans": valid_ans,
+        "dup_skip": dup_skip,
+        "no_ans": no_ans,
+    }
+
+
+# /quizcrawl M.DD-M.DD (기간 일괄 수집)
+# - 요일 컬럼(B~H)이 7개뿐이므로 기간은 최대 7일
+QUIZ_RANGE_MAX_DAYS = 7
+_QUIZ_MD_RANGE_RE = re.compile(r"^\s*\d{1,2}\s*[./]\s*\d{1,2}\s*[-~]\s*\d{1,2}\s*[./]\s*\d{1,2}\s*$")
+
+
+def _quiz_parse_md_range(raw: str) -> list[datetime] | None:
+    """'3.3-3.6' → [3.3, 3.4, 3.5, 3.6] (KST 자정). 연말→연초 범위는 시작일을 전년도로 본다."""
+    m = re.match(r"^\s*(\d{1,2})\s*[./]\s*(\d{1,2})\s*[-~]\s*(\d{1,2})\s*[./]\s*(\d{1,2})\s*$", raw or "")
+    if not m:
+        return None
+    m1, d1, m2, d2 = (int(x) for x in m.groups())
+    year = now_kst().year
+    try:
+        end = datetime(year, m2, d2, tzinfo=KST)
+        start = datetime(year, m1, d1, tzinfo=KST)
+        if start > end:
+            start = datetime(year - 1, m1, d1, tzinfo=KST)
+    except Exception:
+        return None
+    days = (end - start).days + 1
+    if not (1 <= days <= QUIZ_RANGE_MAX_DAYS):
+        return None
+    return [start + timedelta(days=i) for i in range(days)]
+
+
+async def _quizcrawl_range(update: Update, target_dts: list[datetime]) -> None:
+    day_names = ["월", "화", "수", "목", "금", "토", "일"]
+    range_label = f"{target_dts[0].month}.{target_dts[0].day:02d}-{target_dts[-1].month}.{target_dts[-1].day:02d}"
+
+    ws = get_quiz_ws()
+    if not ws:
+        await update.message.reply_text("구글시트(퀴즈 탭) 준비에 실패했습니다. SPREADSHEET_ID/권한을 확인하세요.")
+        return
+
+    # B2:H2 마감시간은 한 번에 읽는다.
+    try:
+        row2 = await _gsheet_call_with_backoff("quiz.deadline.row_values", ws.row_values, 2)
+    except Exception as e:
+        print(f"[QUIZ] deadline row read failed: {e}")
+        row2 = []
+    row2 = _quiz_pad_row(row2 if isinstance(row2, list) else [], 8)
+
+    cookie = _get_naver_quiz_cookie()
+    if not cookie:
+        await update.message.reply_text(
+            "NAVER_QUIZ_COOKIE(또는 기존 NAVER_COOKIE)가 비어있습니다.\n"
+            "브라우저에서 로그인 후 쿠키를 Render 환경변수에 넣어주세요."
+        )
+        return
+
+    cafe_id = QUIZ_CAFE_ID
+    menu_id = QUIZ_MENU_ID
+    pages = max(1, min(20, int(QUIZ_FIND_PAGES)))
+    page_size = max(1, min(50, int(QUIZ_FIND_PAGE_SIZE)))
+    wanted = {(dt.month, dt.day) for dt in target_dts}
+    earliest = target_dts[0].date()
+
+    await update.message.reply_text(
+        f"퀴즈 게시글을 찾는 중... (작성일 {range_label}, {len(target_dts)}일, cafeId={cafe_id}, menuId={menu_id}, pages=1~{pages})\n"
+        "잠시만 기다려 주세요..."
+    )
+
+    # (month, day) → (articleId, subject)  ※ 날짜별로 목록에서 처음 나온 글(가장 최근 글)
+    found: dict[tuple[int, int], tuple[str, str]] = {}
+    comments_by_day: dict[tuple[int, int], tuple[int, list[dict], str]] = {}
+
+    try:
+        async with httpx.AsyncClient(follow_redirects=True) as client:
+            # 1) 게시글 찾기: 목록 1회 순회로 기간 전체
+            for p in range(1, pages + 1):
+                st, j, snip = await _fetch_quiz_boardlist_page(
+                    client,
+                    cafe_id=cafe_id,
+                    menu_id=menu_id,
+                    page=p,
+                    page_size=page_size,
+                    sort_by="TIME",
+                    view_type="L",
+                )
+
+                if st in (401, 403):
+                    await update.message.reply_text(
+                        f"접근이 거부되었습니다. (HTTP {st})\n"
+                        "쿠키가 만료되었거나, 해당 게시판을 읽을 권한이 없는 계정일 수 있습니다.\n"
+                        "NAVER_QUIZ_COOKIE를 최신으로 갱신해 주세요."
+                    )
+                    return
+
+                if not j:
+                    await update.message.reply_text(f"글 목록 응답 파싱 실패 (page={p}, HTTP {st})\n응답 일부: {snip}")
+                    return
+
+                result = j.get("result") if isinstance(j, dict) else None
+                article_list = (result or {}).get("articleList") if isinstance(result, dict) else None
+                if not isinstance(article_list, list) or not article_list:
+                    break
+
+                page_dates = []
+                for entry in article_list:
+                    item = entry.get("item") if isinstance(entry, dict) else None
+                    if not isinstance(item, dict) or not item.get("articleId"):
+                        continue
+                    d = _ms_to_kst_date(item.get("writeDateTimestamp"))
+                    if not d:
+                        continue
+                    page_dates.append(d)
+                    key = (d.month, d.day)
+                    if key in wanted and key not in found:
+                        found[key] = (str(item.get("articleId")), str(item.get("subject") or "").strip())
+
+                if len(found) == len(wanted):
+                    break
+                # TIME 정렬 기준으로 한 페이지가 전부 기간 시작일보다 과거면 중단
+                if page_dates and all(d < earliest for d in page_dates):
+                    break
+
+            if not found:
+                await update.message.reply_text(f"기간({range_label})의 게시글을 1~{pages}페이지에서 찾지 못했습니다.")
+                return
+
+            # 2) 댓글 전체 수집(게시글 단위 동시 수집)
+            keys = sorted(found, key=lambda k: next(i for i, dt in enumerate(target_dts) if (dt.month, dt.day) == k))
+            results = await asyncio.gather(*[
+                _fetch_all_comments_for_article(client, cafe_id=cafe_id, menu_id=menu_id, article_id=found[k][0])
+                for k in keys
+            ])
+            comments_by_day = dict(zip(keys, results))
+    except Exception as e:
+        await update.message.reply_text(f"요청 중 오류가 발생했습니다: {e}")
+        return
+
+    for st_c, _, _ in comments_by_day.values():
+        if st_c in (401, 403):
+            await update.message.reply_text(
+                f"댓글 접근이 거부되었습니다. (HTTP {st_c})\n"
+                "쿠키가 만료되었거나 댓글 읽기 권한이 없는 계정일 수 있습니다.\n"
+                "NAVER_QUIZ_COOKIE를 갱신해 주세요."
+            )
+            return
+
+    # 3) 날짜별 답안 추출 → 같은 스냅샷(QuizWorkbook) 위에서 요일 컬럼별 upsert
+    try:
+        book = await _quiz_load_workbook(ws)
+    except Exception as e:
+        await update.message.reply_text(f"구글시트 읽기 중 오류가 발생했습니다: {e}")
+        return
+
+    lines: list[str] = []
+    done_dows: list[int] = []
+    for dt in target_dts:
+        key = (dt.month, dt.day)
+        dow = dt.weekday()
+        label = f"{dt.month}.{dt.day:02d}({day_names[dow]})"
+        if key not in found:
+            lines.append(f"- {label}: 게시글 없음")
+            continue
+        st_c, items, err = comments_by_day.get(key, (0, [], "미수집"))
+        if st_c != 200 and not items:
+            lines.append(f"- {label}: 댓글 수집 실패 (HTTP {st_c}) {err}")
+            continue
+
+        deadline_raw = row2[1 + dow]
+        deadline_dt = _quiz_build_deadline_dt(dt, deadline_raw) if deadline_raw else None
+        nick_to_ans, stats = _quiz_answers_from_comments(items, deadline_dt)
+        try:
+            inserted_cnt, updated_cnt, overwritten_cnt, unchanged_cnt = await _quiz_upsert_answers_for_day(
+                ws,
+                dow=dow,
+                nick_to_ans=nick_to_ans,
+                op_prefix="quiz_range_upsert",
+                book=book,
+            )
+        except Exception as e:
+            lines.append(f"- {label}: 시트 반영 오류 {e}")
+            continue
+        done_dows.append(dow)
+        lines.append(
+            f"- {label} [{_QUIZ_DOW_COLS[dow]}열] 답안 {len(nick_to_ans)}명 "
+            f"(신규 {inserted_cnt} / 업데이트 {updated_cnt} / 덮어쓰기 {overwritten_cnt} / 변경없음 {unchanged_cnt}, "
+            f"마감 이후 제외 {stats['deadline_excluded']}, 중복 {stats['dup_skip']}, 형식 불일치 {stats['no_ans']})"
+        )
+
+    # 4) 채점/지급뷰는 마지막에 한 번만 (지급뷰에는 기간의 요일을 모두 싣는다)
+    payment_line = "- 지급 정렬뷰: 반영된 날짜 없음"
+    if done_dows:
+        try:
+            res = await _quiz_write_results(ws, book, dows=done_dows)
+            payment_line = (
+                f"- I:J 주간 정답 재계산: {res['score_rows']}명 / 주간 정답자 {res['winner_cnt']}명\n"
+                f"- 지급 정렬뷰(W3:AA): {res['payment_cnt']}명 / 총 {res['total_payment']:,}원"
+            )
+        except Exception as e:
+            payment_line = f"- 지급 정렬뷰 생성 중 오류: {e}"
+
+    await update.message.reply_text(
+        f"✅ /quizcrawl 기간 완료 ({range_label})\n" + "\n".join(lines) + "\n" + payment_line
+    )
+
+
 async def quizcrawl(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """/quizcrawl M.DD : 해당 날짜(작성일 기준) 게시글 1개를 찾고 댓글 전체를 수집해 '퀴즈' 시트에 반영."""
+    """/quizcrawl M.DD : 해당 날짜(작성일 기준) 게시글 1개를 찾고 댓글 전체를 수집해 '퀴즈' 시트에 반영.
+
+    /quizcrawl M.DD-M.DD : 기간(최대 7일) 게시글을 목록 1회 순회로 찾고 댓글을 동시에 수집해
+    날짜별로 반영한 뒤, 채점/지급뷰는 마지막에 한 번만 갱신한다.
+    """
     if not is_admin(update):
         await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
         return
 
     # args 파싱
     if not context.args:
-        await update.message.reply_text("사용법: /quizcrawl M.DD\n예) /quizcrawl 3.3")
+        await update.message.reply_text("사용법: /quizcrawl M.DD 또는 /quizcrawl M.DD-M.DD\n예) /quizcrawl 3.3\n예) /quizcrawl 3.3-3.6")
         return
 
-    md = _parse_md_arg(context.args[0])
-    if not md:
-        await update.message.reply_text("날짜 형식이 올바르지 않습니다. 예) /quizcrawl 3.3")
-        return
+    day_range = None
+    md = None
+    if _QUIZ_MD_RANGE_RE.match(context.args[0] or ""):
+        day_range = _quiz_parse_md_range(context.args[0])
+        if not day_range:
+            await update.message.reply_text(
+                f"기간 형식이 올바르지 않습니다. (최대 {QUIZ_RANGE_MAX_DAYS}일) 예) /quizcrawl 3.3-3.6"
+            )
+            return
+    else:
+        md = _parse_md_arg(context.args[0])
+        if not md:
+            await update.message.reply_text("날짜 형식이 올바르지 않습니다. 예) /quizcrawl 3.3")
+            return
 
     # (인스턴스 내부) chat_id+message_id dedup
     try:
@@ -11693,6 +15039,10 @@ async def quizcrawl(update: Update, context: ContextTypes.DEFAULT_TYPE):
     except Exception:
         pass
 
+    if day_range:
+        await _quizcrawl_range(update, day_range)
+        return
+
     mm, dd = md
     year = now_kst().year
     try:
@@ -11822,92 +15172,44 @@ async def quizcrawl(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     # 3) 댓글 → (닉네임, 답안) 추출 + 중복 제거(첫 답안만)
-    # 작성시간 오름차순
-    parsed = []
-    deadline_excluded = 0
-    deadline_unknown_ts = 0
-    for it in items:
-        nick, text, ts = _extract_comment_nick_and_text(it)
-        if not nick or not text:
-            continue
-
-        # B2:H2 마감시간 기준 필터
-        # - 기본: 게시글 작성일 다음날(QUIZ_DEADLINE_DAY_OFFSET=1) 해당 시간
-        # - 마감 정각 댓글은 포함, 마감 이후 댓글은 제외
-        if deadline_dt:
-            cdt = _quiz_ts_ms_to_kst_datetime(ts)
-            if cdt is None:
-                deadline_unknown_ts += 1
-            elif cdt > deadline_dt:
-                deadline_excluded += 1
-                continue
-
-        parsed.append((ts, nick, text))
-
-    parsed.sort(key=lambda x: (x[0], x[1]))
-
-    total_fetched = len(parsed)
-    valid_ans = 0
-    dup_skip = 0
-    no_ans = 0
-
-    seen_nick: set[str] = set()
-    nick_to_ans: dict[str, str] = {}
-
-    # 새 이벤트 답안 형식: '4 / KT / 2' 또는 '4/케이티/2'
-    # - / 기준 3개 항목으로 분리
-    # - KT/케이티, KIA/기아 등 동의어는 같은 값으로 정규화
-    for ts, nick, text in parsed:
-        parts = _quiz_split_slash_answer(text)
-        if not parts:
-            no_ans += 1
-            continue
-        ans = _quiz_format_answer(parts)
-        valid_ans += 1
-        if nick in seen_nick:
-            dup_skip += 1
-            continue
-        seen_nick.add(nick)
-        nick_to_ans[nick] = ans
+    nick_to_ans, stats = _quiz_answers_from_comments(items, deadline_dt)
+    deadline_excluded = stats["deadline_excluded"]
+    deadline_unknown_ts = stats["deadline_unknown_ts"]
+    total_fetched = stats["total_fetched"]
+    valid_ans = stats["valid_ans"]
+    dup_skip = stats["dup_skip"]
+    no_ans = stats["no_ans"]
 
     # 4) 시트 upsert (해당 요일 컬럼만)
     #    - 기존 닉네임: 같은 행의 해당 요일 컬럼을 새 답안으로 덮어씀
     #    - 신규 닉네임: 신규 행 append
     #    - 다른 요일 컬럼은 건드리지 않음
+    #    퀴즈 탭은 여기서 한 번만 읽고(QuizWorkbook) 이후 채점/지급뷰는 메모리에서 계산한다.
     try:
+        book = await _quiz_load_workbook(ws)
         inserted_cnt, updated_cnt, overwritten_cnt, unchanged_cnt = await _quiz_upsert_answers_for_day(
             ws,
             dow=dow,
             nick_to_ans=nick_to_ans,
             op_prefix="quiz_upsert",
+            book=book,
         )
     except Exception as e:
         await update.message.reply_text(f"구글시트 반영 중 오류가 발생했습니다: {e}")
         return
 
-    # 5) 해당 요일 정답(B1:H1) 기준 지급 정렬뷰(W3:AA) 생성
-    answer_key_raw = await _quiz_get_answer_key_for_dow(ws, dow)
+    # 5) 해당 요일 정답(B1:H1) 기준 I:J 채점 + 지급 정렬뷰(W3:AA) 생성 (batch_update 1회)
+    #    정답칸이 비어있거나 / 형식이 아니면 오래된 지급뷰가 남지 않도록 헤더만 갱신된다.
+    answer_key_raw = book.answer_key(dow)
     answer_key_parts = _quiz_split_slash_answer(answer_key_raw)
     answer_key_display = _quiz_format_answer(answer_key_parts) if answer_key_parts else (answer_key_raw or "")
     try:
-        await _quiz_update_score_columns(ws)
+        res = await _quiz_write_results(ws, book, dow=dow)
     except Exception as e:
-        print(f"[QUIZ] score columns update failed: {e}")
-
-    payment_cnt = 0
-    total_payment = 0
-    if answer_key_parts:
-        try:
-            payment_cnt, total_payment = await _quiz_update_daily_payment_view(ws, dow=dow, answer_key=answer_key_raw)
-        except Exception as e:
-            await update.message.reply_text(f"지급 정렬뷰 생성 중 오류가 발생했습니다: {e}")
-            return
-    else:
-        # 정답칸이 비어있거나 / 형식이 아니면 오래된 지급뷰가 남지 않도록 헤더만 갱신
-        try:
-            await _quiz_update_daily_payment_view(ws, dow=dow, answer_key="")
-        except Exception:
-            pass
+        await update.message.reply_text(f"지급 정렬뷰 생성 중 오류가 발생했습니다: {e}")
+        return
+    payment_cnt = res["payment_cnt"]
+    total_payment = res["total_payment"]
 
     # 6) 요약 응답
     summary = (
@@ -12037,85 +15339,40 @@ async def quizcrawl_article(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     # 댓글 → (닉네임, 답안) 추출 + 중복 제거(첫 답안만)
-    parsed = []
-    deadline_excluded = 0
-    deadline_unknown_ts = 0
-    for it in items:
-        nick, text, ts = _extract_comment_nick_and_text(it)
-        if not nick or not text:
-            continue
-
-        # B2:H2 마감시간 기준 필터
-        # - 기본: 게시글 작성일 다음날(QUIZ_DEADLINE_DAY_OFFSET=1) 해당 시간
-        # - 마감 정각 댓글은 포함, 마감 이후 댓글은 제외
-        if deadline_dt:
-            cdt = _quiz_ts_ms_to_kst_datetime(ts)
-            if cdt is None:
-                deadline_unknown_ts += 1
-            elif cdt > deadline_dt:
-                deadline_excluded += 1
-                continue
-
-        parsed.append((ts, nick, text))
-
-    parsed.sort(key=lambda x: (x[0], x[1]))
-
-    total_fetched = len(parsed)
-    valid_ans = 0
-    dup_skip = 0
-    no_ans = 0
-
-    seen_nick: set[str] = set()
-    nick_to_ans: dict[str, str] = {}
-
-    for ts, nick, text in parsed:
-        parts = _quiz_split_slash_answer(text)
-        if not parts:
-            no_ans += 1
-            continue
-        ans = _quiz_format_answer(parts)
-        valid_ans += 1
-        if nick in seen_nick:
-            dup_skip += 1
-            continue
-        seen_nick.add(nick)
-        nick_to_ans[nick] = ans
+    nick_to_ans, stats = _quiz_answers_from_comments(items, deadline_dt)
+    deadline_excluded = stats["deadline_excluded"]
+    deadline_unknown_ts = stats["deadline_unknown_ts"]
+    total_fetched = stats["total_fetched"]
+    valid_ans = stats["valid_ans"]
+    dup_skip = stats["dup_skip"]
+    no_ans = stats["no_ans"]
 
     # 시트 upsert (해당 요일 컬럼만)
     # - 기존 닉네임은 같은 행을 유지하고 해당 요일 컬럼만 덮어쓴다.
     try:
+        book = await _quiz_load_workbook(ws)
         inserted_cnt, updated_cnt, overwritten_cnt, unchanged_cnt = await _quiz_upsert_answers_for_day(
             ws,
             dow=dow,
             nick_to_ans=nick_to_ans,
             op_prefix="quiz_article_upsert",
+            book=book,
         )
     except Exception as e:
         await update.message.reply_text(f"구글시트 반영 중 오류가 발생했습니다: {e}")
         return
 
-    # 해당 요일 정답(B1:H1) 기준 지급 정렬뷰(W3:AA) 생성
-    answer_key_raw = await _quiz_get_answer_key_for_dow(ws, dow)
+    # 해당 요일 정답(B1:H1) 기준 I:J 채점 + 지급 정렬뷰(W3:AA) 생성 (batch_update 1회)
+    answer_key_raw = book.answer_key(dow)
     answer_key_parts = _quiz_split_slash_answer(answer_key_raw)
     answer_key_display = _quiz_format_answer(answer_key_parts) if answer_key_parts else (answer_key_raw or "")
     try:
-        await _quiz_update_score_columns(ws)
+        res = await _quiz_write_results(ws, book, dow=dow)
     except Exception as e:
-        print(f"[QUIZ] score columns update failed: {e}")
-
-    payment_cnt = 0
-    total_payment = 0
-    if answer_key_parts:
-        try:
-            payment_cnt, total_payment = await _quiz_update_daily_payment_view(ws, dow=dow, answer_key=answer_key_raw)
-        except Exception as e:
-            await update.message.reply_text(f"지급 정렬뷰 생성 중 오류가 발생했습니다: {e}")
-            return
-    else:
-        try:
-            await _quiz_update_daily_payment_view(ws, dow=dow, answer_key="")
-        except Exception:
-            pass
+        await update.message.reply_text(f"지급 정렬뷰 생성 중 오류가 발생했습니다: {e}")
+        return
+    payment_cnt = res["payment_cnt"]
+    total_payment = res["total_payment"]
 
     summary = (
         f"✅ /quizcrawl_article 완료 (articleId={article_id} / {mm}.{dd:02d} / {day_label})\n"
@@ -12203,38 +15460,17 @@ async def quiz_recalc(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     try:
-        answer_key_raw = await _quiz_get_answer_key_for_dow(ws, dow)
+        # 퀴즈 탭 1회 읽기 → 채점/지급뷰/요약을 메모리에서 계산 → I:J + W:AA batch_update 1회
+        # (정답이 없거나 / 형식이 아니면 오래된 지급뷰가 남지 않도록 헤더만 갱신)
+        book = await _quiz_load_workbook(ws)
+        answer_key_raw = book.answer_key(dow)
         answer_key_parts = _quiz_split_slash_answer(answer_key_raw)
         answer_key_display = _quiz_format_answer(answer_key_parts) if answer_key_parts else (answer_key_raw or "")
 
-        score_rows, winner_cnt = await _quiz_update_score_columns(ws)
-
-        payment_cnt = 0
-        total_payment = 0
-        if answer_key_parts:
-            payment_cnt, total_payment = await _quiz_update_daily_payment_view(ws, dow=dow, answer_key=answer_key_raw)
-        else:
-            # 정답이 없거나 / 형식이 아니면 오래된 지급뷰가 남지 않도록 헤더만 갱신
-            await _quiz_update_daily_payment_view(ws, dow=dow, answer_key="")
-
-        rows = await _quiz_read_rows_a_to_h(ws)
-        submitted_cnt = 0
-        scored_cnt = 0
-        if answer_key_parts:
-            for row in rows:
-                nick = str(row[0] or "").strip()
-                submitted = str(row[1 + dow] if len(row) > (1 + dow) else "").strip()
-                if not nick or not submitted:
-                    continue
-                submitted_cnt += 1
-                if _quiz_score_slash_answer(submitted, answer_key_raw) > 0:
-                    scored_cnt += 1
-        else:
-            for row in rows:
-                nick = str(row[0] or "").strip()
-                submitted = str(row[1 + dow] if len(row) > (1 + dow) else "").strip()
-                if nick and submitted:
-                    submitted_cnt += 1
+        res = await _quiz_write_results(ws, book, dow=dow)
+        score_rows, winner_cnt = res["score_rows"], res["winner_cnt"]
+        payment_cnt, total_payment = res["payment_cnt"], res["total_payment"]
+        submitted_cnt, scored_cnt = res["submitted_cnt"], res["scored_cnt"]
 
     except Exception as e:
         await update.message.reply_text(f"재채점 중 오류가 발생했습니다: {e}")
@@ -12285,11 +15521,336 @@ async def quiz_reset(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 
+# ───────────────── 자동 실행 스케줄러 (PTB JobQueue) ─────────────────
+# 설정 형식 (환경변수 SCHEDULE_JOBS, ';' 또는 줄바꿈 구분):
+#   "HH:MM 명령어 [인자...]"                  → 매일 KST HH:MM
+#   "MM HH * * DOW 명령어 [인자...]"          → cron 형식(분/시/요일만 사용, 0=일요일)
+#   예) SCHEDULE_JOBS="00:05 rollover; 00:06 export_rollover; 30 6 * * 1-5 pipeline tomorrow; 01:10 activitycrawl"
+# SCHEDULE_JOBS 가 비어 있으면 구글시트 SCHEDULE_SHEET_NAME 탭(time/command/args/enabled)에서 읽는다.
+# - 같은 명령어는 동시에 두 번 돌지 않음(no-overlap lock)
+# - 실행 전 0~SCHEDULE_JITTER_SEC 초 무작위 대기
+# - 실행 결과 요약은 SCHEDULE_ADMIN_CHAT_ID(없으면 ADMIN_IDS 첫 번째)로 전송
+
+from datetime import time as dt_time
+
+SCHEDULE_JOBS_RAW = (os.getenv("SCHEDULE_JOBS") or "").strip()
+SCHEDULE_SHEET_NAME = (os.getenv("SCHEDULE_SHEET_NAME") or "schedule").strip()
+SCHEDULE_HEADER = ["time", "command", "args", "enabled"]
+SCHEDULE_JITTER_SEC = max(0, int(os.getenv("SCHEDULE_JITTER_SEC", "60")))
+SCHEDULE_ADMIN_CHAT_ID = (os.getenv("SCHEDULE_ADMIN_CHAT_ID") or "").strip()
+SCHEDULE_SUMMARY_TAIL = max(1, int(os.getenv("SCHEDULE_SUMMARY_TAIL", "5")))
+
+_SCHEDULE_JOB_PREFIX = "sched:"
+_SCHEDULE_LOCKS: dict[str, asyncio.Lock] = {}
+
+
+def _schedule_routines() -> dict:
+    """스케줄로 실행 가능한 명령어 → 핸들러."""
+    return {
+        "pipeline": pipeline,
+        "rollover": rollover,
+        "export_rollover": export_rollover,
+        "activitycrawl": activitycrawl,
+        "export_comment_fill": export_comment_fill,
+        "crawlmazsoccer_today": crawlmazsoccer_today,
+        "crawlmazsoccer_tomorrow": crawlmazsoccer_tomorrow,
+        "crawlmazsoccer_both": crawlmazsoccer_both,
+        "crawlmazbaseball_today": crawlmazbaseball_today,
+        "crawlmazbaseball_tomorrow": crawlmazbaseball_tomorrow,
+        "crawlmazbaseball_both": crawlmazbaseball_both,
+        "bvcrawl_today": bvcrawl_today,
+        "bvcrawl_tomorrow": bvcrawl_tomorrow,
+        "bvcrawl_both": bvcrawl_both,
+        "crawlsoccer": crawlsoccer,
+        "crawlsoccerkr": crawlsoccerkr,
+        "crawlbaseball": crawlbaseball,
+        "crawloverbaseball": crawloverbaseball,
+        "crawlbasketball": crawlbasketball,
+        "crawlvolleyball": crawlvolleyball,
+        "cafe_soccer": cafe_soccer,
+        "cafe_baseball": cafe_baseball,
+        "cafe_basketball": cafe_basketball,
+        "cafe_volleyball": cafe_volleyball,
+        "cafe_soccer_deep": cafe_soccer_deep,
+        "cafe_baseball_deep": cafe_baseball_deep,
+        "cafe_basketball_deep": cafe_basketball_deep,
+        "cafe_volleyball_deep": cafe_volleyball_deep,
+        "cafe_news_upload": cafe_news_upload,
+        "youtoo": youtoo,
+    }
+
+
+def _schedule_parse_days(raw: str) -> tuple[int, ...] | None:
+    """cron 요일 필드('*', '1-5', '0,6') → PTB days 튜플(0=일요일). 잘못된 값이면 None."""
+    s = (raw or "").strip()
+    if s in ("", "*"):
+        return tuple(range(7))
+    out: set[int] = set()
+    for part in s.split(","):
+        part = part.strip()
+        m = re.match(r"^(\d)-(\d)$", part)
+        if m:
+            a, b = int(m.group(1)), int(m.group(2))
+            if a > b or b > 7:
+                return None
+            out.update(d % 7 for d in range(a, b + 1))
+            continue
+        if part.isdigit() and int(part) <= 7:
+            out.add(int(part) % 7)  # cron은 7도 일요일
+            continue
+        return None
+    return tuple(sorted(out))
+
+
+def _schedule_parse_line(line: str) -> dict | None:
+    """설정 한 줄 → {"hour", "minute", "days", "command", "args"}. 형식이 틀리면 None."""
+    tokens = (line or "").strip().split()
+    if not tokens or tokens[0].startswith("#"):
+        return None
+
+    m = re.match(r"^(\d{1,2}):(\d{2})$", tokens[0])
+    if m:
+        hour, minute = int(m.group(1)), int(m.group(2))
+        days = tuple(range(7))
+        rest = tokens[1:]
+    elif len(tokens) >= 6 and tokens[0].isdigit() and tokens[1].isdigit() and tokens[2] == "*" and tokens[3] == "*":
+        minute, hour = int(tokens[0]), int(tokens[1])
+        days = _schedule_parse_days(tokens[4])
+        rest = tokens[5:]
+    else:
+        return None
+
+    if days is None or not rest or not (0 <= hour <= 23 and 0 <= minute <= 59):
+        return None
+
+    command = rest[0].lstrip("/").strip().lower()
+    if command not in _schedule_routines():
+        print(f"[SCHEDULE] 알 수 없는 명령어라 건너뜀: {command}")
+        return None
+
+    return {"hour": hour, "minute": minute, "days": days, "command": command, "args": rest[1:]}
+
+
+def _schedule_load_sheet_lines() -> list[str]:
+    """schedule 탭에서 enabled 행을 'HH:MM command args' 줄로 변환."""
+    client_gs = get_gs_client()
+    spreadsheet_id = os.getenv("SPREADSHEET_ID")
+    if not (client_gs and spreadsheet_id):
+        return []
+    try:
+        sh = client_gs.open_by_key(spreadsheet_id)
+        ws = _get_ws_by_name(sh, SCHEDULE_SHEET_NAME)
+        if not ws:
+            return []
+        values = ws.get_all_values()
+    except Exception as e:
+        print(f"[SCHEDULE] {SCHEDULE_SHEET_NAME} 탭 읽기 실패: {e}")
+        return []
+
+    if not values:
+        return []
+    header = [c.strip().lower() for c in values[0]]
+
+    def _idx(name: str, default: int) -> int:
+        return header.index(name) if name in header else default
+
+    i_time, i_cmd, i_args, i_enabled = _idx("time", 0), _idx("command", 1), _idx("args", 2), _idx("enabled", 3)
+
+    def _cell(row: list[str], i: int) -> str:
+        return row[i].strip() if len(row) > i and row[i] else ""
+
+    lines: list[str] = []
+    for row in values[1:]:
+        if _cell(row, i_enabled).lower() in ("0", "false", "no", "off", "n"):
+            continue
+        when, cmd = _cell(row, i_time), _cell(row, i_cmd)
+        if not when or not cmd:
+            continue
+        lines.append(f"{when} {cmd} {_cell(row, i_args)}".strip())
+    return lines
+
+
+def load_schedule_config() -> list[dict]:
+    """SCHEDULE_JOBS(env) 우선, 없으면 schedule 탭에서 스케줄 목록을 읽는다."""
+    if SCHEDULE_JOBS_RAW:
+        lines = re.split(r"[;\n]+", SCHEDULE_JOBS_RAW)
+    else:
+        lines = _schedule_load_sheet_lines()
+
+    out: list[dict] = []
+    for line in lines:
+        if not (line or "").strip():
+            continue
+        entry = _schedule_parse_line(line)
+        if entry is None:
+            print(f"[SCHEDULE] 설정 형식 오류로 건너뜀: {line!r}")
+            continue
+        out.append(entry)
+    return out
+
+
+def _schedule_admin_chat_id() -> int | str | None:
+    if SCHEDULE_ADMIN_CHAT_ID:
+        return int(SCHEDULE_ADMIN_CHAT_ID) if SCHEDULE_ADMIN_CHAT_ID.lstrip("-").isdigit() else SCHEDULE_ADMIN_CHAT_ID
+    if ADMIN_IDS:
+        return ADMIN_IDS[0]
+    return None
+
+
+class _ScheduledMessage:
+    """스케줄 실행 시 update.message 대용: reply_text 내용을 모아두기만 한다."""
+
+    def __init__(self, chat_id):
+        self.chat_id = chat_id
+        self.message_id = 0
+        self.text = ""
+        self.replies: list[str] = []
+
+    async def reply_text(self, text: str, *args, **kwargs):
+        self.replies.append(str(text or ""))
+        print(f"[SCHEDULE][REPLY] {_short_log_text(str(text or ''), 300)}")
+        return None
+
+
+class _ScheduledUpdate:
+    """스케줄 실행 시 관리자 명령어 핸들러에 넘기는 최소 Update 대용 객체."""
+
+    def __init__(self, chat_id):
+        admin_id = ADMIN_IDS[0] if ADMIN_IDS else 0
+        self.update_id = 0
+        self.callback_query = None
+        self.message = _ScheduledMessage(chat_id)
+        self.effective_message = self.message
+        self.effective_user = type("ScheduledUser", (), {"id": admin_id})()
+        self.effective_chat = type("ScheduledChat", (), {"id": chat_id})()
+
+
+async def _scheduled_job_callback(context: ContextTypes.DEFAULT_TYPE) -> None:
+    data = dict(getattr(context.job, "data", None) or {})
+    command = data.get("command") or ""
+    args = list(data.get("args") or [])
+    handler = _schedule_routines().get(command)
+    if handler is None:
+        return
+
+    chat_id = _schedule_admin_chat_id()
+    lock = _SCHEDULE_LOCKS.setdefault(command, asyncio.Lock())
+    label = f"/{command}" + (f" {' '.join(args)}" if args else "")
+
+    async def _notify(text: str) -> None:
+        if chat_id is None:
+            print(f"[SCHEDULE] {text}")
+            return
+        try:
+            await context.bot.send_message(chat_id=chat_id, text=text)
+        except Exception as e:
+            print(f"[SCHEDULE] 관리자 알림 실패: {e}")
+
+    if lock.locked():
+        await _notify(f"⏭ 스케줄 {label}: 이전 실행이 아직 진행 중이라 건너뜀")
+        return
+
+    async with lock:
+        if SCHEDULE_JITTER_SEC:
+            await asyncio.sleep(_random.uniform(0, SCHEDULE_JITTER_SEC))
+
+        fake_update = _ScheduledUpdate(chat_id)
+        t_wait = time.perf_counter()
+        # 수동 무거운 명령/다른 스케줄과 같은 레인에서 순서대로 실행
+        async with _TG_HEAVY_SEM:
+            waited = time.perf_counter() - t_wait
+            started = get_kst_now()
+            status = "✅ 완료"
+            handle = cmd_trace_begin(f"sched:{label}")
+            try:
+                await handler(fake_update, _PipelineContext(context, args))
+            except Exception as e:
+                status = f"❌ 오류: {type(e).__name__}: {e}"
+                traceback.print_exc()
+            finally:
+                trace, elapsed = cmd_trace_end(handle)
+
+    tail = [r for r in fake_update.message.replies if r.strip()][-SCHEDULE_SUMMARY_TAIL:]
+    lines = [
+        f"⏰ 스케줄 실행 {label}",
+        f"- 시작 {started.strftime('%m-%d %H:%M:%S')} KST / 소요 {elapsed:.1f}s"
+        + (f" (레인 대기 {waited:.1f}s)" if waited >= 1 else ""),
+        f"- 결과 {status}",
+    ]
+    if CMD_TIMING_REPORT and trace["stages"] and elapsed >= CMD_TIMING_MIN_SEC:
+        lines.append("- 단계별 소요:")
+        lines.extend(f"  {ln}" for ln in format_span_stats(trace["stages"]))
+    if tail:
+        lines.append("- 마지막 응답:")
+        lines.extend(f"  · {_short_log_text(r, 300)}" for r in tail)
+    await _notify("\n".join(lines))
+
+
+def install_schedule_jobs(app) -> int:
+    """스케줄 설정을 읽어 JobQueue에 등록(기존 스케줄 job은 제거). 등록 개수를 돌려준다."""
+    jq = getattr(app, "job_queue", None)
+    if jq is None:
+        print("[SCHEDULE] JobQueue 비활성 → python-telegram-bot[job-queue] 설치 필요. 스케줄 생략")
+        return 0
+
+    for job in jq.jobs():
+        if (job.name or "").startswith(_SCHEDULE_JOB_PREFIX):
+            job.schedule_removal()
+
+    entries = load_schedule_config()
+    for i, entry in enumerate(entries):
+        jq.run_daily(
+            _scheduled_job_callback,
+            time=dt_time(entry["hour"], entry["minute"], tzinfo=KST),
+            days=entry["days"],
+            name=f"{_SCHEDULE_JOB_PREFIX}{i}:{entry['command']}",
+            data={"command": entry["command"], "args": entry["args"]},
+        )
+    print(f"[SCHEDULE] {len(entries)}개 스케줄 등록")
+    return len(entries)
+
+
+def _format_schedule_entry(entry: dict) -> str:
+    day_names = "일월화수목금토"
+    days = entry["days"]
+    day_txt = "매일" if len(days) == 7 else ",".join(day_names[d] for d in days)
+    args_txt = (" " + " ".join(entry["args"])) if entry["args"] else ""
+    return f"{entry['hour']:02d}:{entry['minute']:02d} ({day_txt}) /{entry['command']}{args_txt}"
+
+
+async def schedule_list(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """/schedule : 현재 스케줄 설정과 실행 중인 스케줄 표시."""
+    if not is_admin(update):
+        await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
+        return
+
+    entries = load_schedule_config()
+    if not entries:
+        await update.message.reply_text("등록된 스케줄이 없습니다. (SCHEDULE_JOBS 또는 schedule 탭 확인)")
+        return
+
+    running = [name for name, lock in _SCHEDULE_LOCKS.items() if lock.locked()]
+    lines = ["⏰ 스케줄 (KST)"] + [f"- {_format_schedule_entry(e)}" for e in entries]
+    if running:
+        lines.append("실행 중: " + ", ".join(running))
+    await update.message.reply_text("\n".join(lines))
+
+
+async def schedule_reload(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """/schedule_reload : schedule 탭/환경변수를 다시 읽어 JobQueue 재등록."""
+    if not is_admin(update):
+        await update.message.reply_text("이 명령어는 관리자만 사용할 수 있습니다.")
+        return
+
+    cnt = install_schedule_jobs(context.application)
+    await update.message.reply_text(f"스케줄 재등록 완료: {cnt}개")
+
+
 def main():
     reload_analysis_from_sheet()
     reload_news_from_sheet()
 
-    app = ApplicationBuilder().token(TOKEN).build()
+    app = ApplicationBuilder().token(TOKEN).concurrent_updates(_ChatLaneUpdateProcessor()).build()
 
     # 모든 업데이트에 대해 update_id 중복 처리 방지(웹훅 재전송/슬립 복귀 시 중복 응답 방지)
     app.add_handler(TypeHandler(Update, _dedup_update_guard), group=-1)
@@ -12310,6 +15871,9 @@ def main():
     # export_tomorrow → export_today 롤오버
     app.add_handler(CommandHandler("export_rollover", export_rollover))
     app.add_handler(CommandHandler("export_comment_fill", export_comment_fill))    
+    app.add_handler(CommandHandler("llm_batch", llm_batch))  # OpenAI 배치 상태 확인/즉시 반영
+    app.add_handler(CommandHandler("llm_stats", llm_stats))  # LLM 호출 지점별 사용량/재시도/토큰
+    app.add_handler(CommandHandler("timing", timing_stats))  # 단계별 소요 시간/카운터
     app.add_handler(CommandHandler("export_comment_txt", export_comment_txt))
     app.add_handler(CommandHandler("export_comment_zip", export_comment_zip))
     app.add_handler(CommandHandler("export_comment_zip_buttons", export_comment_zip_buttons))
@@ -12367,11 +15931,29 @@ def main():
     app.add_handler(CommandHandler("bvcrawl_today", bvcrawl_today))
     app.add_handler(CommandHandler("bvcrawl_tomorrow", bvcrawl_tomorrow))
 
+    # mazgtv 오늘+내일 통합 (목록 1회 순회 → today/tomorrow 시트로 분배)
+    app.add_handler(CommandHandler("crawlmazsoccer_both", crawlmazsoccer_both))
+    app.add_handler(CommandHandler("crawlmazbaseball_both", crawlmazbaseball_both))
+    app.add_handler(CommandHandler("bvcrawl_both", bvcrawl_both))
+
+    # 전 종목 크롤링(동시) → 댓글 생성 → 카페 업로드 파이프라인
+    app.add_handler(CommandHandler("pipeline", pipeline))
+
+    # 자동 실행 스케줄 (JobQueue)
+    app.add_handler(CommandHandler("schedule", schedule_list))
+    app.add_handler(CommandHandler("schedule_reload", schedule_reload))
+
 
 
 
     app.add_handler(CallbackQueryHandler(on_callback))
 
+    install_schedule_jobs(app)
+
+    # OpenAI 배치 결과 주기 확인
+    if app.job_queue is not None:
+        app.job_queue.run_repeating(_openai_batch_poll_job, interval=OPENAI_BATCH_POLL_SEC, first=60, name="openai_batch_poll")
+
     port = int(os.environ.get("PORT", "10000"))
     app.run_webhook(
         listen="0.0.0.0",
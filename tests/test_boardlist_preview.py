@@ -0,0 +1,168 @@
+import asyncio
+import json
+import os
+
+import httpx
+import pytest
+
+import bot
+from conftest import FIXTURES
+
+
+def _load(name: str) -> dict:
+    with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _items(data: dict) -> list[dict]:
+    return [e["item"] for e in data["result"]["articleList"]]
+
+
+class _Recorder:
+    """MockTransport 핸들러: URL 경로/쿼리로 고정 응답을 돌려주고 요청을 기록한다."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        for match, resp in self.routes:
+            if match(request):
+                return resp() if callable(resp) else resp
+        return httpx.Response(404, json={})
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture(autouse=True)
+def _reset_unsupported():
+    bot._BOARDLIST_PREVIEW_UNSUPPORTED.clear()
+    yield
+    bot._BOARDLIST_PREVIEW_UNSUPPORTED.clear()
+
+
+def test_item_preview_flags_truncation():
+    short, long_, none = _items(_load("naver_boardlist_view_c.json"))
+    assert bot._boardlist_item_preview(short) == ("출석 체크합니다!", False)
+
+    text, truncated = bot._boardlist_item_preview(long_)
+    assert truncated is True
+    assert not text.endswith("...")
+
+    assert bot._boardlist_item_preview(none) is None
+
+
+def test_preview_full_text_only_for_untruncated():
+    assert bot._preview_full_text(("전체 본문", False)) == "전체 본문"
+    assert bot._preview_full_text(("잘린 본문", True)) is None
+    assert bot._preview_full_text(None) is None
+
+
+def _article_transport(article_id: str):
+    article = _load(f"naver_article_{article_id}.json")
+    return _Recorder([
+        (lambda r: f"/articles/{article_id}" in r.url.path, httpx.Response(200, json=article)),
+    ])
+
+
+def test_youtoo_truncated_preview_fetches_full_body():
+    data = _load("naver_boardlist_view_c.json")
+    meta = bot._youtoo_list_item_meta(_items(data)[1], cafe_id="1", menu_id="2")
+    meta["comment_cnt"] = "0"
+    rec = _article_transport("9102")
+
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(rec)) as client:
+            return await bot._youtoo_fetch_detail(client, meta, cafe_id="1", menu_id="2", cookie="")
+
+    detail = _run(go())
+    assert detail["body_ok"] is True
+    assert "결승골" in detail["body_text"]
+    assert len(rec.requests) == 1
+
+
+def test_youtoo_untruncated_preview_skips_body_call():
+    data = _load("naver_boardlist_view_c.json")
+    meta = bot._youtoo_list_item_meta(_items(data)[0], cafe_id="1", menu_id="2")
+    rec = _Recorder([])
+
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(rec)) as client:
+            return await bot._youtoo_fetch_detail(client, meta, cafe_id="1", menu_id="2", cookie="")
+
+    detail = _run(go())
+    assert detail["body_text"] == "출석 체크합니다!"
+    assert detail["body_ok"] is True
+    assert rec.requests == []
+
+
+def test_activity_body_matches_full_article_when_preview_truncated():
+    data = _load("naver_boardlist_view_c.json")
+    preview = bot._boardlist_item_preview(_items(data)[1])
+    rec = _article_transport("9102")
+
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(rec)) as client:
+            via_preview = await bot._activity_fetch_body(
+                client, cafe_id="1", menu_id="2", article_id="9102",
+                body_sem=asyncio.Semaphore(1), preview=preview,
+            )
+            direct = await bot._fetch_article_body_text(client, cafe_id="1", menu_id="2", article_id="9102")
+            return via_preview, direct
+
+    via_preview, direct = _run(go())
+    assert via_preview == direct
+    content = bot._activity_trim_content(via_preview[0])
+    assert bot._activity_effective_len(content) > bot._activity_effective_len(preview[0])
+
+
+def _boardlist_route(view_type: str, resp):
+    return (lambda r: r.url.params.get("viewType") == view_type, resp)
+
+
+def _fetch_preview_page(rec):
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(rec)) as client:
+            return await bot._fetch_cafe_boardlist_page_preview(
+                client, cafe_id="1", menu_id="2", page=1, page_size=15, sort_by="TIME", view_type="L",
+            )
+    return _run(go())
+
+
+def test_rich_view_transient_error_is_not_remembered():
+    rec = _Recorder([
+        _boardlist_route(bot.NAVER_CAFE_PREVIEW_VIEW_TYPE, httpx.Response(503, text="busy")),
+        _boardlist_route("L", httpx.Response(200, json=_load("naver_boardlist_view_l.json"))),
+    ])
+    status, data, _ = _fetch_preview_page(rec)
+    assert status == 200
+    assert bot._boardlist_has_core_fields(data)
+    assert ("1", "2") not in bot._BOARDLIST_PREVIEW_UNSUPPORTED
+
+
+def test_rich_view_without_preview_fields_is_remembered():
+    rec = _Recorder([
+        _boardlist_route(bot.NAVER_CAFE_PREVIEW_VIEW_TYPE, httpx.Response(200, json=_load("naver_boardlist_view_l.json"))),
+    ])
+    status, data, _ = _fetch_preview_page(rec)
+    assert status == 200
+    assert ("1", "2") in bot._BOARDLIST_PREVIEW_UNSUPPORTED
+
+    # 이후 요청은 기본 viewType만 사용
+    rec.requests.clear()
+    rec.routes.append(_boardlist_route("L", httpx.Response(200, json=_load("naver_boardlist_view_l.json"))))
+    _fetch_preview_page(rec)
+    assert [r.url.params.get("viewType") for r in rec.requests] == ["L"]
+
+
+def test_rich_view_with_previews_is_used():
+    rec = _Recorder([
+        _boardlist_route(bot.NAVER_CAFE_PREVIEW_VIEW_TYPE, httpx.Response(200, json=_load("naver_boardlist_view_c.json"))),
+    ])
+    status, data, _ = _fetch_preview_page(rec)
+    assert status == 200
+    assert len(rec.requests) == 1
+    assert ("1", "2") not in bot._BOARDLIST_PREVIEW_UNSUPPORTED
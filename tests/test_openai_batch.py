@@ -0,0 +1,282 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import bot
+
+
+class _StandInBatchAPI:
+    """OpenAI Files/Batches API의 로컬 대체 서버(네트워크 없이 제출/조회/결과 다운로드)."""
+
+    def __init__(self):
+        self.lines: list[dict] = []
+        self.polls_before_done = 1
+        self.polls = 0
+        self.final_status = "completed"
+        self.has_output = True
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *a):
+                pass
+
+            def _json(self, obj, code=200):
+                data = json.dumps(obj).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if self.path.endswith("/files"):
+                    text = body.decode("utf-8", "replace")
+                    api.lines = [json.loads(m) for m in re.findall(r'^\{"custom_id".*$', text, flags=re.M)]
+                    return self._json({
+                        "id": "file-in", "object": "file", "bytes": len(body), "created_at": 0,
+                        "filename": "in.jsonl", "purpose": "batch", "status": "processed",
+                    })
+                if self.path.endswith("/batches"):
+                    return self._json(api.batch("in_progress"))
+                self._json({"error": "not found"}, 404)
+
+            def do_GET(self):
+                if self.path.endswith("/batches/batch_1"):
+                    api.polls += 1
+                    done = api.polls > api.polls_before_done
+                    return self._json(api.batch(api.final_status if done else "in_progress"))
+                if self.path.endswith("/files/file-out/content"):
+                    data = api.output().encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/jsonl")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+                self._json({"error": "not found"}, 404)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def batch(self, status: str) -> dict:
+        out = {
+            "id": "batch_1", "object": "batch", "endpoint": "/v1/chat/completions",
+            "input_file_id": "file-in", "completion_window": "24h", "status": status, "created_at": 0,
+        }
+        if status == "completed" and self.has_output:
+            out["output_file_id"] = "file-out"
+        return out
+
+    def output(self) -> str:
+        rows = []
+        for line in self.lines:
+            cid = line["custom_id"]
+            content = f"1. {cid} 첫 댓글\n2. {cid} 둘째 댓글"
+            rows.append({"custom_id": cid, "response": {
+                "status_code": 200, "body": {"choices": [{"message": {"role": "assistant", "content": content}}]},
+            }})
+        return "\n".join(json.dumps(r, ensure_ascii=False) for r in rows)
+
+    def close(self):
+        self.server.shutdown()
+
+
+class _FakeWorksheet:
+    def __init__(self, rows: list[list[str]]):
+        self.rows = rows
+        self.fail_updates = 0
+        self.updates: list[list[dict]] = []
+
+    def get_all_values(self):
+        return [list(r) for r in self.rows]
+
+    def batch_update(self, payload, **kw):
+        if self.fail_updates:
+            self.fail_updates -= 1
+            raise RuntimeError("APIError: [503] backend error")
+        self.updates.append(payload)
+        header = self.rows[0]
+        for p in payload:
+            m = re.match(r"([A-Z]+)(\d+)$", p["range"])
+            col = next(i for i in range(len(header)) if bot._col_letter(i + 1) == m.group(1))
+            self.rows[int(m.group(2)) - 1][col] = p["values"][0][0]
+
+
+_HEADER = ["day", "sport", "src_id", "title", "body", "createdAt", "simple", "comments"]
+_SITE_TEXT = "두산은 최근 5경기 4승을 기록했다. 선발 곽빈이 안정적이다. 한화는 타선이 침체돼 있다. " * 5
+
+
+def _row(src_id: str) -> list[str]:
+    return ["tomorrow", "KBO", src_id, "제목", "본문", "", "", ""]
+
+
+@pytest.fixture
+def stand_in(tmp_path, monkeypatch):
+    api = _StandInBatchAPI()
+    monkeypatch.setattr(bot, "OPENAI_BATCH_BASE_URL", api.url)
+    monkeypatch.setattr(bot, "OPENAI_BATCH_STATE_PATH", str(tmp_path / "batch_state.json"))
+    monkeypatch.setattr(bot, "_openai_batch_client", None)
+    yield api
+    api.close()
+
+
+@pytest.fixture
+def sheets(monkeypatch):
+    books = {
+        bot.EXPORT_TODAY_SHEET_NAME: _FakeWorksheet([list(_HEADER)]),
+        bot.EXPORT_TOMORROW_SHEET_NAME: _FakeWorksheet([list(_HEADER), _row("maz:1"), _row("maz:2")]),
+    }
+    monkeypatch.setattr(bot, "get_export_ws", lambda name: books.get(name))
+    return books
+
+
+def _submit(ids: list[str]) -> str:
+    lines, items = [], {}
+    for n, sid in enumerate(ids):
+        cid = f"c{n}"
+        lines.append(bot._openai_batch_request_line(cid, model="gpt-test", system="s", prompt=sid, temperature=0.5))
+        items[cid] = {"sheet": bot.EXPORT_TOMORROW_SHEET_NAME, "src_id": sid, "column": "comments", "count": 6}
+    return bot.submit_openai_batch("export_comment", lines, items, chat_id=1)
+
+
+def _submit_site(ids: list[str]) -> str:
+    req = bot._build_site_rewrite_request(_SITE_TEXT, league="KBO", home_team="두산", away_team="한화")
+    lines, items = [], {}
+    for n, sid in enumerate(ids):
+        cid = f"s{n}"
+        lines.append(bot._openai_batch_request_line(cid, model="gpt-test", system="s", prompt=sid, temperature=0.5))
+        items[cid] = {
+            "sheet": bot.EXPORT_TOMORROW_SHEET_NAME, "src_id": sid, "site_title": "제목", "sport_label": "야구",
+            "row_sport": "KBO", "league": "KBO", "home": "두산", "away": "한화", "req": req,
+        }
+    return bot.submit_openai_batch("site_rewrite", lines, items, chat_id=1)
+
+
+def _cell(ws: _FakeWorksheet, src_id: str, column: str) -> str:
+    i_src, i_col = _HEADER.index("src_id"), _HEADER.index(column)
+    return next(r[i_col] for r in ws.rows[1:] if r[i_src] == src_id)
+
+
+def _comments(ws: _FakeWorksheet, src_id: str) -> str:
+    return _cell(ws, src_id, "comments")
+
+
+def test_parse_output_keeps_failed_ids_empty():
+    text = "\n".join([
+        json.dumps({"custom_id": "a", "response": {"status_code": 200, "body": {"choices": [{"message": {"content": " 안녕 "}}]}}}),
+        json.dumps({"custom_id": "b", "response": {"status_code": 429, "body": {}}}),
+        "not json",
+        json.dumps({"response": {"status_code": 200}}),
+    ])
+    assert bot._openai_batch_parse_output(text) == {"a": "안녕", "b": ""}
+
+
+def test_results_to_cells_counts_empty_comments_as_failed():
+    items = {
+        "c0": {"sheet": "export_tomorrow", "src_id": "maz:1", "column": "comments", "count": 2},
+        "c1": {"sheet": "export_tomorrow", "src_id": "maz:2", "column": "comments", "count": 2},
+    }
+    cells, failed = bot._openai_batch_results_to_cells("export_comment", items, {"c0": "1. 하나\n2. 둘\n3. 셋", "c1": ""})
+    assert cells == {"export_tomorrow": {"maz:1": {"comments": "하나\n둘"}}}
+    assert failed == 1
+
+
+def test_submit_poll_and_write_through_stand_in(stand_in, sheets):
+    assert _submit(["maz:1", "maz:2"]) == "batch_1"
+    assert bot._openai_batch_pending_src_ids() == {"maz:1", "maz:2"}
+
+    # 첫 조회는 진행 중 → 상태 유지
+    assert bot._openai_batch_poll_once() == []
+    assert "batch_1" in bot._openai_batch_load_state()["batches"]
+
+    reports = bot._openai_batch_poll_once()
+    assert [(r["status"], r["written"], r["failed"], r["error"]) for r in reports] == [("completed", 2, 0, "")]
+    tomo = sheets[bot.EXPORT_TOMORROW_SHEET_NAME]
+    assert _comments(tomo, "maz:1") == "c0 첫 댓글\nc0 둘째 댓글"
+    assert len(tomo.updates) == 1
+    assert bot._openai_batch_load_state()["batches"] == {}
+    assert bot._openai_batch_pending_src_ids() == set()
+
+
+def test_rows_moved_by_rollover_are_written_to_other_export_sheet(stand_in, sheets):
+    _submit(["maz:1", "maz:2"])
+    stand_in.polls_before_done = 0
+    today, tomo = sheets[bot.EXPORT_TODAY_SHEET_NAME], sheets[bot.EXPORT_TOMORROW_SHEET_NAME]
+    # /export_rollover: tomorrow → today
+    today.rows, tomo.rows = [list(_HEADER)] + tomo.rows[1:], [list(_HEADER)]
+
+    (rep,) = bot._openai_batch_poll_once()
+    assert (rep["written"], rep["failed"], rep["error"]) == (2, 0, "")
+    assert _comments(today, "maz:2") == "c1 첫 댓글\nc1 둘째 댓글"
+
+
+def test_rows_missing_everywhere_count_as_failed(stand_in, sheets):
+    _submit(["maz:1", "maz:gone"])
+    stand_in.polls_before_done = 0
+
+    (rep,) = bot._openai_batch_poll_once()
+    assert (rep["written"], rep["failed"]) == (1, 1)
+    assert bot._openai_batch_load_state()["batches"] == {}
+
+
+def test_write_failure_keeps_batch_until_written(stand_in, sheets):
+    _submit(["maz:1", "maz:2"])
+    stand_in.polls_before_done = 0
+    tomo = sheets[bot.EXPORT_TOMORROW_SHEET_NAME]
+    tomo.fail_updates = 1
+
+    (rep,) = bot._openai_batch_poll_once()
+    assert rep["written"] == 0 and "batch_update" in rep["error"]
+    state = bot._openai_batch_load_state()["batches"]
+    assert state["batch_1"]["write_attempts"] == 1
+
+    (rep,) = bot._openai_batch_poll_once()
+    assert (rep["written"], rep["error"]) == (2, "")
+    assert _comments(tomo, "maz:2") == "c1 첫 댓글\nc1 둘째 댓글"
+    assert bot._openai_batch_load_state()["batches"] == {}
+
+
+def test_write_failure_gives_up_after_max_attempts(stand_in, sheets, monkeypatch):
+    monkeypatch.setattr(bot, "OPENAI_BATCH_WRITE_MAX_ATTEMPTS", 2)
+    _submit(["maz:1"])
+    stand_in.polls_before_done = 0
+    sheets[bot.EXPORT_TOMORROW_SHEET_NAME].fail_updates = 5
+
+    assert len(bot._openai_batch_poll_once()) == 1
+    (rep,) = bot._openai_batch_poll_once()
+    assert "포기" in rep["error"]
+    assert bot._openai_batch_load_state()["batches"] == {}
+
+
+@pytest.mark.parametrize("final_status,has_output", [("failed", True), ("expired", True), ("completed", False)])
+def test_site_rewrite_without_results_writes_fallback_body(stand_in, sheets, final_status, has_output):
+    tomo = sheets[bot.EXPORT_TOMORROW_SHEET_NAME]
+    for r in tomo.rows[1:]:
+        r[_HEADER.index("body")] = ""
+    _submit_site(["maz:1", "maz:2"])
+    stand_in.polls_before_done = 0
+    stand_in.final_status, stand_in.has_output = final_status, has_output
+
+    (rep,) = bot._openai_batch_poll_once()
+    assert (rep["status"], rep["written"], rep["failed"]) == (final_status, 4, 2)
+    assert rep["error"]
+    for sid in ("maz:1", "maz:2"):
+        assert "두산은 최근 5경기" in _cell(tomo, sid, "body")
+        assert _cell(tomo, sid, "simple")
+    assert bot._openai_batch_load_state()["batches"] == {}
+
+
+def test_failed_export_comment_batch_is_dropped_without_writes(stand_in, sheets):
+    _submit(["maz:1"])
+    stand_in.polls_before_done = 0
+    stand_in.final_status = "cancelled"
+
+    (rep,) = bot._openai_batch_poll_once()
+    assert (rep["written"], rep["failed"], rep["error"]) == (0, 1, "배치 상태 cancelled")
+    assert sheets[bot.EXPORT_TOMORROW_SHEET_NAME].updates == []
+    assert bot._openai_batch_pending_src_ids() == set()
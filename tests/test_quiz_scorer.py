@@ -0,0 +1,65 @@
+import random
+import time
+
+import pytest
+
+import bot
+
+_KEYS = ["4 / KT / 2", "O / 3 / X", "0 / 두산 / 1", "", "X / O / O", "2 / 엘지 / 0", "1 / 한화 / O"]
+_POOL = {
+    0: ["4/KT/2", "4 / kt / 2", "4/케이티/2", "3/KT/2", "4/KT", "4 / KT / 2 / 9", "", "KT"],
+    1: ["O/3/X", "o / 3 / x", "0/3/X", "오/삼/엑스", "X/3/O", "O / 3"],
+    2: ["0/두산/1", "O/두산/1", "영/두산/일", "0 / 두산베어스 / 1", "1/두산/0"],
+    3: ["1/2/3", "O/X/O"],
+    4: ["X/O/O", "x/o/o", "0/O/O", "X / O / 0", "엑스/오/오"],
+    5: ["2/엘지/0", "2/LG/0", "2 / 엘지 / O", "이/엘지/영"],
+    6: ["1/한화/O", "1/한화/0", "일 / 한화 / 오", "1 / 한화이글스 / O"],
+}
+
+
+def _synthetic_rows(n: int, seed: int = 7) -> list[tuple[int, list[str]]]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        nick = f"user{i}" if rng.random() > 0.01 else ""
+        answers = [rng.choice(_POOL[d]) if rng.random() > 0.2 else "" for d in range(7)]
+        rows.append((i + 4, [nick] + answers))
+    return rows
+
+
+def _reference_matrix(rows):
+    """_quiz_score_slash_answer 로 칸마다 채점(같은 답안 문자열은 한 번만 계산해 테스트 시간을 줄인다)."""
+    memo: dict[tuple[str, int], int] = {}
+    out = {}
+    for row_num, rr in rows:
+        if not rr[0]:
+            continue
+        scores = []
+        for d in range(7):
+            k = (rr[1 + d], d)
+            if k not in memo:
+                memo[k] = bot._quiz_score_slash_answer(rr[1 + d], _KEYS[d]) if _KEYS[d] else 0
+            scores.append(memo[k])
+        out[row_num] = scores
+    return out
+
+
+@pytest.mark.parametrize("dow", range(7))
+def test_score_matches_reference_per_cell(dow):
+    scorer = bot.QuizScorer(_KEYS)
+    for submitted in _POOL[dow] + ["", " / / ", "O/O/O", "0/0/0"]:
+        expected = bot._quiz_score_slash_answer(submitted, _KEYS[dow]) if _KEYS[dow] else 0
+        assert scorer.score(submitted, dow) == expected, submitted
+    assert scorer.answer_ok(dow) == bool(_KEYS[dow])
+
+
+def test_score_matrix_matches_reference_on_10k_x_7():
+    rows = _synthetic_rows(10_000)
+
+    t0 = time.perf_counter()
+    got = bot.QuizScorer(_KEYS).score_matrix(rows)
+    elapsed = time.perf_counter() - t0
+
+    assert got == _reference_matrix(rows)
+    assert any(sum(v) for v in got.values())
+    print(f"\n[bench] QuizScorer.score_matrix 10k×7: {elapsed:.3f}s")